@@ -1,6 +1,7 @@
 """
 Programme pédagogique interactif sur la neutronique des REP
 """
+import multiprocessing
 import sys
 import os
 from PyQt6.QtWidgets import QApplication, QMessageBox
@@ -16,4 +17,6 @@ def main():
     sys.exit(app.exec())
 
 if __name__ == '__main__':
+    # Exécutable figé (PyInstaller) : les processus des analyses ne relancent pas l'interface
+    multiprocessing.freeze_support()
     main() 
\ No newline at end of file
@@ -0,0 +1,147 @@
+"""
+Interface en ligne de commande, sans interface graphique
+
+    python -m src.cli run scenario.json [autres.json ...] [--output-dir DIR] [--format csv|npz]
+                          [--workers N] [--realtime FACTEUR]
+
+Chaque fichier de scénario est déroulé sur un `ReactorModel` neuf ; plusieurs
+scénarios sont répartis sur un pool de processus. Les résultats CSV sont
+écrits ligne par ligne au fil du scénario, les résultats NPZ à la fin. Ce
+module n'importe ni PyQt6 ni matplotlib : il peut tourner sur un serveur
+d'intégration sans affichage.
+"""
+import argparse
+import csv
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from src.model import config
+from src.model.scenario import ScenarioError, load_scenario, iter_scenario
+
+OUTPUT_FORMATS = ("csv", "npz")
+
+
+def run_scenario_file(path, output_dir, output_format, pacing=None):
+    """
+    Déroule un fichier de scénario et écrit ses résultats (exécuté dans un processus du pool).
+
+    Returns:
+        dict: "scenario", "output", "rows", "seconds" et "error" (None en cas de succès)
+    """
+    start = time.perf_counter()
+    path = Path(path)
+    output = Path(output_dir) / f"{path.stem}.{output_format}"
+    rows = 0
+    writing = False
+    try:
+        scenario = load_scenario(path)
+        columns = ("time_hours",) + scenario["recorded_quantities"]
+        output.parent.mkdir(parents=True, exist_ok=True)
+        if output_format == "csv":
+            writing = True
+            with open(output, "w", newline="", encoding="utf-8") as file:
+                writer = csv.writer(file)
+                writer.writerow(columns)
+                for row in iter_scenario(scenario, pacing=pacing):
+                    writer.writerow([repr(row[name]) for name in columns])
+                    rows += 1
+        else:
+            records = [[row[name] for name in columns] for row in iter_scenario(scenario, pacing=pacing)]
+            rows = len(records)
+            writing = True
+            table = np.array(records, dtype=float).reshape(rows, len(columns))
+            np.savez_compressed(output, **{name: table[:, index] for index, name in enumerate(columns)})
+        error = None
+    except Exception as e:
+        # Un scénario en échec n'interrompt pas le lot ; sa sortie partielle est supprimée
+        error = f"{type(e).__name__}: {e}"
+        if writing:
+            output.unlink(missing_ok=True)
+    return {
+        "scenario": str(path),
+        "output": str(output),
+        "rows": rows,
+        "seconds": time.perf_counter() - start,
+        "error": error,
+    }
+
+
+def run_scenarios(paths, output_dir, output_format=None, workers=None, pacing=None):
+    """
+    Déroule une liste de fichiers de scénario, en parallèle si plusieurs processus sont demandés.
+
+    Args:
+        paths: fichiers de scénario
+        output_dir: répertoire des résultats (un fichier par scénario, même nom de base)
+        output_format: "csv" ou "npz" (SCENARIO_OUTPUT_FORMAT par défaut)
+        workers: nombre de processus (0 : un par cœur, 1 : dans le processus courant)
+        pacing: facteur d'accélération par rapport au temps réel (None : au plus vite)
+
+    Yields:
+        dict: résultat de run_scenario_file, dans l'ordre des fichiers
+    """
+    output_format = config.SCENARIO_OUTPUT_FORMAT if output_format is None else output_format
+    workers = config.SCENARIO_WORKERS if workers is None else int(workers)
+    if output_format not in OUTPUT_FORMATS:
+        raise ScenarioError(f"Format de sortie inconnu : {output_format!r} "
+                            f"(valeurs possibles : {', '.join(OUTPUT_FORMATS)})")
+    workers = (os.cpu_count() or 1) if workers == 0 else workers
+    workers = min(workers, len(paths))
+    if workers <= 1:
+        for path in paths:
+            yield run_scenario_file(path, output_dir, output_format, pacing)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_scenario_file, path, output_dir, output_format, pacing) for path in paths]
+        for future in futures:
+            yield future.result()
+
+
+def _command_run(arguments):
+    """Sous-commande "run" : déroule les scénarios et affiche un résumé par fichier."""
+    failures = 0
+    for result in run_scenarios(arguments.scenarios, arguments.output_dir, arguments.format, arguments.workers,
+                                arguments.realtime):
+        if result["error"] is None:
+            print(f"{result['scenario']} -> {result['output']} "
+                  f"({result['rows']} lignes, {result['seconds']:.2f} s)")
+        else:
+            failures += 1
+            print(f"{result['scenario']} : échec - {result['error']}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+def build_parser():
+    """Analyseur des arguments de la ligne de commande."""
+    parser = argparse.ArgumentParser(prog="python -m src.cli",
+                                     description="NeutroScope sans interface graphique")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Déroule un ou plusieurs fichiers de scénario")
+    run.add_argument("scenarios", nargs="+", help="fichiers de scénario JSON")
+    run.add_argument("--output-dir", default="scenario_results",
+                     help="répertoire des résultats (défaut : scenario_results)")
+    run.add_argument("--format", choices=OUTPUT_FORMATS, default=None,
+                     help="format des résultats (défaut : scenario.OUTPUT_FORMAT de config.json)")
+    run.add_argument("--workers", type=int, default=None,
+                     help="nombre de processus, 0 pour un par cœur (défaut : scenario.WORKERS)")
+    run.add_argument("--realtime", type=float, default=None, metavar="FACTEUR",
+                     help="cadence le scénario sur l'horloge murale, accéléré de FACTEUR "
+                          "(1 : temps réel ; défaut : au plus vite)")
+    run.set_defaults(handler=_command_run)
+    return parser
+
+
+def main(argv=None):
+    """Point d'entrée de la ligne de commande ; retourne le code de sortie."""
+    arguments = build_parser().parse_args(argv)
+    return arguments.handler(arguments)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,17 @@
 """
 Controller module connecting the UI with the reactor model
 """
+import threading
+from concurrent.futures import Future
+
 from src.model.reactor_model import ReactorModel
+from src.model.uncertainty import propagate_uncertainty
+from src.model.sensitivity import sobol_indices
 from src.model.preset_model import PresetCategory
 from src.model import config
-import copy
+from src.controller.reactor_snapshot import ReactorSnapshot
+from src.controller.simulation_worker import SnapshotBuffer, SimulationWorker
+from src.controller.simulation_clock import SimulationClock
 
 
 class ReactorController:
@@ -12,6 +19,101 @@ class ReactorController:
     
     def __init__(self):
         self.model = ReactorModel()
+        self._snapshot = None
+        self.snapshots = SnapshotBuffer()
+        self.worker = None
+        self.clock = SimulationClock(frame_rate=config.gui_settings.get("display_refresh_rate_hz", 60))
+
+    def start_worker(self):
+        """
+        Confie le modèle à un thread de calcul.
+
+        Une fois le thread démarré, le modèle ne doit plus être modifié ni lu
+        que par des commandes passées à `submit` ; la vue lit `latest_snapshot`.
+        """
+        if self.worker is None:
+            self.worker = SimulationWorker(self, self.snapshots)
+            self.worker.start()
+        return self.worker
+
+    def stop_worker(self, timeout=None):
+        """Arrête le thread de calcul après les commandes en attente"""
+        if self.worker is not None:
+            self.worker.stop(timeout)
+            self.worker = None
+
+    def submit(self, method, *args):
+        """
+        Exécute une méthode du contrôleur sur le thread de calcul.
+
+        Sans thread de calcul (ligne de commande, scripts), la méthode est
+        exécutée immédiatement et l'instantané publié avant le retour.
+
+        Returns:
+            Future: résultat de la méthode
+        """
+        if self.worker is not None:
+            return self.worker.submit(method, *args)
+        future = Future()
+        try:
+            result = method(*args)
+            snapshot = self.get_snapshot()
+            if snapshot is not self.snapshots.latest():
+                self.snapshots.publish(snapshot)
+        except Exception as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+        return future
+
+    def latest_snapshot(self):
+        """Dernier instantané complet publié (None avant la première publication)"""
+        return self.snapshots.latest()
+
+    def set_display_sections(self, names):
+        """Sections calculées par le thread de calcul avant chaque publication"""
+        if self.worker is not None:
+            self.worker.sections = tuple(names)
+
+    def materialize_snapshot(self, snapshot, names):
+        """Calcule des sections supplémentaires d'un instantané publié (à passer par `submit`)"""
+        return snapshot.materialize(names)
+
+    def start_clock(self, acceleration=None, substep_minutes=None):
+        """
+        Démarre (ou règle) l'horloge de simulation.
+
+        L'horloge n'avance que sur le thread de calcul, entre deux commandes :
+        cette méthode doit lui être passée par `submit`.
+
+        Args:
+            acceleration: secondes simulées par seconde réelle
+            substep_minutes: résolution physique de l'intégration
+        """
+        self.clock.start(acceleration, substep_minutes)
+        return self.get_clock_statistics()
+
+    def pause_clock(self):
+        """Suspend l'horloge de simulation (à passer par `submit`)"""
+        self.clock.pause()
+        return self.get_clock_statistics()
+
+    def get_clock_statistics(self):
+        """Temps simulé, accélération effective, sous-pas intégrés et images sautées de l'horloge"""
+        return self.clock.get_statistics()
+
+    def get_snapshot(self):
+        """
+        Retourne l'instantané immuable de l'état courant du modèle.
+        
+        Un seul instantané est construit par version de l'état : les lectures
+        répétées à la même version réutilisent les sections déjà calculées.
+        """
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.version != self.model.state_version:
+            snapshot = ReactorSnapshot(self.model)
+            self._snapshot = snapshot
+        return snapshot
 
     def get_gui_settings(self):
         """Retourne les paramètres de configuration de l'interface graphique."""
@@ -63,61 +165,194 @@ class ReactorController:
         params = self.model.update_fuel_enrichment(enrichment)
         return self.get_reactor_parameters()
     
+    def update_parameters(self, values):
+        """Met à jour plusieurs paramètres de pilotage avec un seul recalcul"""
+        self.model.update_parameters(values)
+        return self.get_reactor_parameters()
+    
     def get_reactor_parameters(self):
-        """Récupérer tous les paramètres calculés du réacteur"""
+        """Récupérer tous les paramètres calculés du réacteur (vue en lecture seule)"""
+        return self.get_snapshot().reactor_parameters
+    
+    def get_recompute_statistics(self):
+        """Retourne le nombre de recalculs effectués par grandeur et le dernier lot recalculé"""
         return {
-            "k_effective": self.model.k_effective,
-            "k_infinite": self.model.k_infinite,
-            "reactivity": self.model.reactivity,
-            "doubling_time": self.model.doubling_time,
-            "delayed_neutron_fraction": self.model.delayed_neutron_fraction,
-            "eta": self.model.eta,
-            "epsilon": self.model.epsilon,
-            "p": self.model.p,
-            "f": self.model.f,
-            "thermal_non_leakage_prob": self.model.thermal_non_leakage_prob,
-            "fast_non_leakage_prob": self.model.fast_non_leakage_prob
+            "counts": dict(self.model.recompute_counts),
+            "last_recomputed": self.model.last_recomputed
         }
     
+    def get_cache_statistics(self):
+        """Retourne les statistiques du cache d'évaluations (None s'il est désactivé)"""
+        cache = self.model.evaluation_cache
+        return cache.get_statistics() if cache is not None else None
+    
+    def set_response_surface_enabled(self, enabled, rebuild=False):
+        """Active ou désactive la table de réponse précalculée de k-effectif"""
+        if enabled:
+            self.model.enable_response_surface(rebuild)
+        else:
+            self.model.disable_response_surface()
+        return self.get_reactor_parameters()
+    
+    def get_response_surface_error_report(self, samples=None):
+        """Retourne l'écart entre la table de réponse et le modèle analytique (None si inactive)"""
+        surface = self.model.response_surface
+        return surface.error_report(samples) if surface is not None else None
+    
     def get_axial_flux_distribution(self):
         """Get axial flux distribution data"""
-        return self.model.get_axial_flux_distribution()
+        return self.get_snapshot().axial_flux
+
+    def get_equivalent_rod_position(self):
+        """Position équivalente des barres (%) pour la visualisation du flux"""
+        return self.get_snapshot().equivalent_rod_position
+    
+    def get_rz_power_distribution(self):
+        """Distribution de puissance r-z (cartes radiale et axiale) pour l'état courant"""
+        return self.get_snapshot().rz_power
     
     def get_four_factors_data(self):
         """Get four factors data for visualization"""
-        return self.model.get_four_factors_data()
+        return self.get_snapshot().four_factors
     
     def get_neutron_balance_data(self):
         """Get neutron balance data for visualization"""
-        return self.model.get_neutron_balance_data()
+        return self.get_snapshot().neutron_balance
     
     def get_neutron_cycle_data(self):
         """Get neutron cycle data for visualization"""
-        return self.model.get_neutron_cycle_data()
+        return self.get_snapshot().neutron_cycle
+    
+    def get_reactivity_coefficients(self):
+        """Get reactivity coefficients (pcm per unit) from the current snapshot"""
+        return self.get_snapshot().reactivity_coefficients
     
     def get_current_configuration(self):
         """Get current reactor configuration"""
-        return {
-            "rod_group_R_position": self.model.rod_group_R_position,
-            "rod_group_GCP_position": self.model.rod_group_GCP_position,
-            "boron_concentration": self.model.boron_concentration,
-            "average_temperature": self.model.average_temperature,
-            "fuel_enrichment": self.model.fuel_enrichment,
-            "power_level": self.model.power_level
-        }
+        return self.get_snapshot().configuration
+    
+    def get_axial_xenon_data(self):
+        """Get per-node axial iodine/xenon and flux data from the current snapshot"""
+        return self.get_snapshot().axial_xenon
     
     def get_xenon_dynamics_data(self):
         """Get the xenon dynamics data from the model"""
-        return self.model.get_xenon_dynamics_data()
+        return self.get_snapshot().xenon_dynamics
     
     def advance_time(self, hours=1.0):
         """Advance simulation time and update xenon dynamics"""
         self.model.advance_time(hours)
         return self.get_reactor_parameters()
     
+    def advance_kinetics(self, seconds, dt=None):
+        """Avance la cinétique ponctuelle avec la réactivité actuelle du modèle"""
+        times, relative_power = self.model.advance_kinetics(seconds, dt)
+        return {
+            "time_s": times,
+            "relative_power": relative_power,
+            "reactivity": self.model.reactivity,
+            "stable_period": self.model.point_kinetics.stable_period(self.model.reactivity)
+        }
+    
+    def reset_kinetics(self, relative_power=1.0):
+        """Remet la cinétique ponctuelle à l'équilibre"""
+        self.model.reset_kinetics(relative_power)
+    
+    def scram(self):
+        """Déclenche un arrêt d'urgence (insertion complète des barres)"""
+        self.model.scram()
+        return self.get_reactor_parameters()
+    
+    def find_critical_parameter(self, parameter, target_k_effective=1.0, target_reactivity_pcm=None, apply=False):
+        """
+        Recherche la valeur critique du bore ou d'un groupe de barres.
+        
+        Args:
+            parameter: "boron_concentration", "rod_group_R_position" ou "rod_group_GCP_position"
+            target_k_effective: k-effectif recherché
+            target_reactivity_pcm: réactivité recherchée en pcm (prioritaire si fournie)
+            apply: si True, applique la valeur trouvée au modèle
+            
+        Returns:
+            float or None: valeur critique, ou None si la cible n'est pas atteignable
+        """
+        target_reactivity = None
+        if target_reactivity_pcm is not None:
+            target_reactivity = target_reactivity_pcm / config.REACTIVITY_TO_PCM
+        value = self.model.find_critical_parameter(parameter, target_k_effective, target_reactivity)
+        if value is not None and apply:
+            setters = {
+                "boron_concentration": self.model.update_boron_concentration,
+                "rod_group_R_position": self.model.update_rod_group_R_position,
+                "rod_group_GCP_position": self.model.update_rod_group_GCP_position,
+            }
+            setters[parameter](value)
+        return value
+    
+    def run_depletion(self, cycle_length_days=None):
+        """Calcule l'évolution du combustible sur un cycle (chaîne réduite de noyaux lourds)"""
+        return self.model.run_depletion(cycle_length_days)
+    
+    def set_cycle_time(self, days):
+        """Place le cœur à un instant du cycle (jours) et retourne les nouveaux paramètres"""
+        self.model.set_cycle_time(days)
+        return self.get_reactor_parameters()
+    
+    def get_boron_letdown_curve(self):
+        """Bore critique le long du cycle pour l'état de pilotage courant"""
+        return self.model.get_boron_letdown()
+    
+    def run_uncertainty_analysis(self, samples=None, workers=None):
+        """Bandes de centiles de k-effectif et de la trajectoire xénon (Monte-Carlo sur les coefficients)"""
+        return self.model.run_uncertainty_analysis(samples, workers)
+
+    def run_sensitivity_analysis(self, base_samples=None, workers=None):
+        """Indices de Sobol de premier ordre et totaux des entrées et coefficients du modèle"""
+        return self.model.run_sensitivity_analysis(base_samples, workers)
+
+    def start_uncertainty_analysis(self, samples=None, workers=None):
+        """
+        Lance la propagation d'incertitudes sur l'état actuel hors du thread de calcul.
+
+        Seule la lecture des entrées du modèle passe par le thread de calcul :
+        l'analyse (plusieurs secondes) ne retarde ni l'horloge ni les consignes.
+
+        Returns:
+            Future: résultat de propagate_uncertainty
+        """
+        inputs = self.submit(self.model.get_model_inputs)
+        return self._start_analysis(
+            lambda: propagate_uncertainty(samples=samples, workers=workers, **inputs.result()))
+
+    def start_sensitivity_analysis(self, base_samples=None, workers=None):
+        """
+        Lance le calcul des indices de Sobol hors du thread de calcul (il ne lit pas le modèle).
+
+        Returns:
+            Future: résultat de sobol_indices
+        """
+        return self._start_analysis(lambda: sobol_indices(base_samples=base_samples, workers=workers))
+
+    @staticmethod
+    def _start_analysis(analysis):
+        """Exécute une analyse sur un thread dédié et retourne son Future"""
+        future = Future()
+
+        def run():
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(analysis())
+            except Exception as e:
+                future.set_exception(e)
+
+        threading.Thread(target=run, name="NeutroScope-analyse", daemon=True).start()
+        return future
+    
     def reset_xenon_to_equilibrium(self):
         """Reset xenon concentrations to equilibrium for current power level"""
         self.model.calculate_xenon_equilibrium()
+        self.model.recompute()
         return self.get_reactor_parameters()
     
     def get_preset_names(self):
@@ -0,0 +1,166 @@
+"""
+Instantané immuable et versionné de l'état physique du réacteur
+"""
+import copy
+from types import MappingProxyType
+
+import numpy as np
+
+
+def _freeze(value):
+    """Rend une structure de données en lecture seule (dict, liste, tableau NumPy)."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, np.ndarray):
+        frozen = np.array(value, copy=True)
+        frozen.flags.writeable = False
+        return frozen
+    return value
+
+
+# Sections ne dépendant que des entrées quantifiées du modèle : elles peuvent être
+# partagées par tous les états ayant la même clé dans le cache d'évaluations.
+# (Les sections xénon contiennent le temps de simulation et n'en font pas partie ;
+# le flux axial dépend de la distribution nodale du xénon, absente de la clé.)
+_CACHEABLE_SECTIONS = frozenset({
+    "equivalent_rod_position", "four_factors", "neutron_balance", "neutron_cycle",
+    "reactivity_coefficients", "rz_power"
+})
+
+# Sections lues par la fenêtre principale : ce sont celles que le thread de
+# calcul calcule avant de publier un instantané.
+DISPLAY_SECTIONS = (
+    "reactivity_coefficients", "axial_flux", "equivalent_rod_position", "four_factors",
+    "neutron_balance", "neutron_cycle", "xenon_dynamics", "axial_xenon", "preset_name"
+)
+
+
+class ReactorSnapshot:
+    """
+    État du modèle figé à une version donnée.
+
+    Les paramètres scalaires sont capturés à la création ; les sections de
+    visualisation (flux axial, facteurs, bilan, cycle, xénon) sont calculées
+    à la première lecture puis conservées. Toutes les données retournées sont
+    en lecture seule, de sorte qu'un même instantané peut être partagé entre
+    plusieurs lecteurs (widgets, threads) sans copie.
+    """
+
+    __slots__ = ("version", "_state", "_sections", "_shared_sections", "reactor_parameters", "configuration")
+
+    def __init__(self, model):
+        self.version = model.state_version
+        # Copie superficielle : les attributs physiques sont des scalaires
+        self._state = copy.copy(model)
+        self._sections = {}
+        # Sections partagées via le cache d'évaluations du modèle, s'il est actif
+        entry = model.cache_entry
+        self._shared_sections = entry["sections"] if entry is not None else None
+
+        state = self._state
+        self.reactor_parameters = MappingProxyType({
+            "k_effective": state.k_effective,
+            "k_infinite": state.k_infinite,
+            "reactivity": state.reactivity,
+            "doubling_time": state.doubling_time,
+            "delayed_neutron_fraction": state.delayed_neutron_fraction,
+            "eta": state.eta,
+            "epsilon": state.epsilon,
+            "p": state.p,
+            "f": state.f,
+            "thermal_non_leakage_prob": state.thermal_non_leakage_prob,
+            "fast_non_leakage_prob": state.fast_non_leakage_prob
+        })
+        self.configuration = MappingProxyType({
+            "rod_group_R_position": state.rod_group_R_position,
+            "rod_group_GCP_position": state.rod_group_GCP_position,
+            "boron_concentration": state.boron_concentration,
+            "average_temperature": state.average_temperature,
+            "fuel_enrichment": state.fuel_enrichment,
+            "power_level": state.power_level
+        })
+
+    def _section(self, name, builder):
+        """Calcule une section à la première demande puis la réutilise."""
+        try:
+            return self._sections[name]
+        except KeyError:
+            pass
+
+        shared = self._shared_sections if name in _CACHEABLE_SECTIONS else None
+        section = shared.get(name) if shared is not None else None
+        if section is None:
+            section = _freeze(builder())
+            if shared is not None:
+                shared[name] = section
+        self._sections[name] = section
+        return section
+
+    def has_sections(self, names):
+        """Indique si toutes les sections demandées sont déjà calculées"""
+        return all(name in self._sections for name in names)
+
+    def materialize(self, names=DISPLAY_SECTIONS):
+        """
+        Calcule immédiatement les sections demandées.
+
+        La copie superficielle du modèle partage ses solveurs avec le modèle
+        vivant : un instantané destiné à un autre thread doit être matérialisé
+        par le thread qui possède le modèle, avant publication. Les sections
+        non matérialisées ne doivent pas être lues depuis un autre thread.
+        """
+        for name in names:
+            getattr(self, name)
+        return self
+
+    @property
+    def axial_flux(self):
+        """Distribution axiale du flux : (hauteurs, flux)"""
+        return self._section("axial_flux", self._state.get_axial_flux_distribution)
+
+    @property
+    def equivalent_rod_position(self):
+        """Position équivalente des barres (%) utilisée par le graphique de flux"""
+        return self._section("equivalent_rod_position", self._state._get_equivalent_rod_position_percent)
+
+    @property
+    def four_factors(self):
+        """Données du graphique des facteurs"""
+        return self._section("four_factors", self._state.get_four_factors_data)
+
+    @property
+    def neutron_balance(self):
+        """Données du bilan neutronique"""
+        return self._section("neutron_balance", self._state.get_neutron_balance_data)
+
+    @property
+    def neutron_cycle(self):
+        """Données du cycle neutronique"""
+        return self._section("neutron_cycle", self._state.get_neutron_cycle_data)
+
+    @property
+    def rz_power(self):
+        """Distribution de puissance r-z (diffusion à deux groupes en géométrie cylindrique)"""
+        return self._section("rz_power", self._state.solve_rz_flux)
+
+    @property
+    def reactivity_coefficients(self):
+        """Coefficients de réactivité (pcm par unité)"""
+        return self._section("reactivity_coefficients", self._state.get_reactivity_coefficients)
+
+    @property
+    def xenon_dynamics(self):
+        """Données de dynamique Xénon"""
+        return self._section("xenon_dynamics", self._state.get_xenon_dynamics_data)
+
+    @property
+    def axial_xenon(self):
+        """Distributions axiales I-135/Xe-135 et flux par maille (None si le modèle axial est inactif)"""
+        return self._section("axial_xenon", self._state.get_axial_xenon_data)
+
+    @property
+    def preset_name(self):
+        """Nom du preset correspondant à l'état ('Personnalisé' si aucun)"""
+        return self._section("preset_name", self._state.get_current_preset_name)
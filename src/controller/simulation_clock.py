@@ -0,0 +1,163 @@
+"""
+Horloge de simulation : temps physique accéléré, découplé de l'affichage
+
+Le temps simulé suit l'horloge murale multipliée par un facteur
+d'accélération ; il est intégré en sous-pas de durée fixe (la résolution
+physique), aussi nombreux que nécessaire entre deux images. Les images sont
+publiées au plus à la cadence d'affichage : si l'intégration d'une image
+dépasse la durée d'une image, les images intermédiaires sont sautées et, au
+besoin, le retard abandonné plutôt que rattrapé.
+
+L'horloge ne possède pas de thread : elle est pilotée par le thread de calcul
+du contrôleur (voir `SimulationWorker`).
+"""
+import math
+import time
+
+from src.model import config
+
+
+class SimulationClock:
+    """Horloge accélérée à sous-pas fixes et images plafonnées"""
+
+    def __init__(self, acceleration=None, substep_minutes=None, frame_rate=60.0, time_source=time.perf_counter):
+        """
+        Args:
+            acceleration: secondes simulées par seconde réelle (SIMULATION_CLOCK_ACCELERATION)
+            substep_minutes: durée d'un sous-pas physique (SIMULATION_CLOCK_SUBSTEP_MINUTES)
+            frame_rate: cadence maximale de publication des images (Hz)
+            time_source: horloge murale en secondes
+        """
+        self.acceleration = config.SIMULATION_CLOCK_ACCELERATION
+        self.substep_hours = config.SIMULATION_CLOCK_SUBSTEP_MINUTES / 60.0
+        self.set_rate(acceleration, substep_minutes)
+        self.frame_period = 1.0 / frame_rate
+        self.time_source = time_source
+        self.running = False
+
+        self.simulated_hours = 0.0
+        self.running_seconds = 0.0
+        self.substeps = 0
+        self.frames_published = 0
+        self.frames_skipped = 0
+        self.dropped_hours = 0.0
+        self._wall_origin = 0.0
+        self._hours_origin = 0.0
+        self._last_frame = 0.0
+
+    def set_rate(self, acceleration=None, substep_minutes=None):
+        """Change l'accélération et/ou la résolution ; le temps déjà écoulé est conservé"""
+        if acceleration is not None:
+            if not 0.0 < acceleration <= config.SIMULATION_CLOCK_MAX_ACCELERATION:
+                raise ValueError(f"Accélération hors limites : {acceleration} "
+                                 f"(maximum {config.SIMULATION_CLOCK_MAX_ACCELERATION})")
+            self.acceleration = float(acceleration)
+        if substep_minutes is not None:
+            if not 0.0 < substep_minutes <= config.SIMULATION_CLOCK_MAX_SUBSTEP_MINUTES:
+                raise ValueError(f"Sous-pas hors limites : {substep_minutes} min "
+                                 f"(maximum {config.SIMULATION_CLOCK_MAX_SUBSTEP_MINUTES} min)")
+            self.substep_hours = substep_minutes / 60.0
+        if getattr(self, "running", False):
+            self._rebase(self.time_source())
+
+    def start(self, acceleration=None, substep_minutes=None):
+        """Démarre (ou reprend) l'écoulement du temps simulé"""
+        self.set_rate(acceleration, substep_minutes)
+        if not self.running:
+            now = self.time_source()
+            self._wall_origin = now
+            self._hours_origin = self.simulated_hours
+            self._last_frame = now
+            self.running = True
+
+    def pause(self):
+        """Suspend l'écoulement du temps simulé"""
+        if self.running:
+            self.running_seconds += self.time_source() - self._wall_origin
+            self.running = False
+
+    def _rebase(self, now):
+        """Reprend la correspondance temps mural / temps simulé à partir de l'état actuel"""
+        if self.running:
+            self.running_seconds += now - self._wall_origin
+        self._wall_origin = now
+        self._hours_origin = self.simulated_hours
+
+    def target_hours(self, now):
+        """Temps simulé que l'horloge devrait avoir atteint à l'instant mural `now`"""
+        return self._hours_origin + (now - self._wall_origin) * self.acceleration / config.HOURS_TO_SECONDS
+
+    def due_substeps(self, now):
+        """Nombre de sous-pas entiers en retard sur l'horloge murale"""
+        if not self.running:
+            return 0
+        return max(0, math.floor((self.target_hours(now) - self.simulated_hours) / self.substep_hours + 1e-9))
+
+    def advance(self, advance_hours):
+        """
+        Intègre les sous-pas dus, dans la limite de la durée d'une image.
+
+        Args:
+            advance_hours: fonction faisant avancer le modèle d'une durée en heures
+
+        Returns:
+            int: nombre de sous-pas intégrés
+        """
+        now = self.time_source()
+        due = self.due_substeps(now)
+        deadline = now + self.frame_period
+        done = 0
+        while done < due:
+            advance_hours(self.substep_hours)
+            self.simulated_hours += self.substep_hours
+            done += 1
+            if self.time_source() >= deadline:
+                break
+        self.substeps += done
+        if done < due:
+            # Le modèle ne suit pas : le retard est abandonné (l'accélération
+            # effective baisse) au lieu de s'accumuler d'image en image
+            self.dropped_hours += (due - done) * self.substep_hours
+            self._rebase(self.time_source())
+        return done
+
+    def frame_due(self, now=None):
+        """Indique si une image peut être publiée sans dépasser la cadence d'affichage"""
+        now = self.time_source() if now is None else now
+        return now - self._last_frame >= self.frame_period
+
+    def frame_published(self, now=None):
+        """Enregistre la publication d'une image et compte les images sautées depuis la précédente"""
+        now = self.time_source() if now is None else now
+        if self.running:
+            self.frames_skipped += max(0, int((now - self._last_frame) / self.frame_period) - 1)
+        self.frames_published += 1
+        self._last_frame = now
+
+    def next_wakeup(self):
+        """Délai (s) avant le prochain sous-pas dû ou la prochaine image, None à l'arrêt"""
+        if not self.running:
+            return None
+        now = self.time_source()
+        next_substep = (self.simulated_hours + self.substep_hours - self.target_hours(now)) * \
+            config.HOURS_TO_SECONDS / self.acceleration
+        next_frame = self._last_frame + self.frame_period - now
+        return max(0.0, min(next_substep, next_frame))
+
+    def get_statistics(self):
+        """Temps simulé, accélération effective, sous-pas intégrés et images sautées"""
+        running_seconds = self.running_seconds
+        if self.running:
+            running_seconds += self.time_source() - self._wall_origin
+        return {
+            "running": self.running,
+            "acceleration": self.acceleration,
+            "substep_minutes": self.substep_hours * 60.0,
+            "simulated_hours": self.simulated_hours,
+            "effective_acceleration": (self.simulated_hours * config.HOURS_TO_SECONDS / running_seconds
+                                       if running_seconds > 0 else 0.0),
+            "substeps": self.substeps,
+            "frames_published": self.frames_published,
+            "frames_skipped": self.frames_skipped,
+            "dropped_hours": self.dropped_hours,
+        }
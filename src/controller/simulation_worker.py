@@ -0,0 +1,172 @@
+"""
+Thread de calcul du contrôleur et double tampon d'instantanés
+
+Toutes les commandes qui modifient le modèle (consignes, avance en temps,
+presets, analyses) sont exécutées dans l'ordre sur un thread unique, qui est
+seul à toucher au modèle. Après chaque lot de commandes, ce thread construit un
+`ReactorSnapshot`, en calcule les sections affichées, puis le publie dans un
+double tampon. L'interface ne lit que le dernier instantané complet : le coût
+du modèle ne bloque plus ni l'affichage ni la saisie.
+
+Lorsque l'horloge de simulation du contrôleur tourne, le thread intègre entre
+deux commandes les sous-pas dus et ne publie qu'à la cadence d'affichage.
+"""
+import queue
+import threading
+from concurrent.futures import Future
+
+from src.controller.reactor_snapshot import DISPLAY_SECTIONS
+
+
+class SnapshotBuffer:
+    """
+    Double tampon sans verrou : un écrivain (le thread de calcul), des lecteurs quelconques.
+
+    L'écrivain remplit l'emplacement arrière puis bascule l'indice de
+    l'emplacement avant ; cette affectation est atomique, c'est elle qui publie.
+    Les instantanés étant immuables, un lecteur qui détient une référence peut
+    la lire sans copie pendant que l'écrivain prépare le suivant.
+    """
+
+    def __init__(self):
+        self._slots = [None, None]
+        self._front = 0
+        self.published = 0
+
+    def publish(self, snapshot):
+        """Publie un instantané complet (thread de calcul uniquement)"""
+        back = 1 - self._front
+        self._slots[back] = snapshot
+        self._front = back
+        self.published += 1
+
+    def latest(self):
+        """Dernier instantané publié (None avant la première publication)"""
+        return self._slots[self._front]
+
+
+class SimulationWorker:
+    """
+    Thread de calcul propriétaire du modèle d'un `ReactorController`.
+
+    Les commandes sont des appelables exécutés dans l'ordre de soumission ;
+    celles qui arrivent pendant un calcul sont traitées en un seul lot, suivi
+    d'une seule publication. Le résultat de chaque commande est transmis par un
+    `Future`, résolu après la publication de l'instantané qui en tient compte.
+    """
+
+    def __init__(self, controller, buffer, sections=DISPLAY_SECTIONS):
+        self.controller = controller
+        self.buffer = buffer
+        self.sections = tuple(sections)
+        self.commands_processed = 0
+        self.batches_processed = 0
+        self._commands = queue.SimpleQueue()
+        self._stopping = False
+        self._submit_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="NeutroScope-simulation", daemon=True)
+
+    def start(self):
+        """Démarre le thread et publie l'état initial"""
+        self._thread.start()
+        self.submit(self.publish)
+
+    def stop(self, timeout=None):
+        """Termine les commandes en attente puis arrête le thread ; les soumissions suivantes sont refusées"""
+        with self._submit_lock:
+            if self._stopping:
+                return
+            self._stopping = True
+            if self._thread.is_alive():
+                self._commands.put(None)
+        self._thread.join(timeout)
+
+    def is_running(self):
+        """Indique si le thread de calcul tourne"""
+        return self._thread.is_alive()
+
+    def submit(self, function, *args):
+        """
+        Place une commande dans la file du thread de calcul.
+
+        Returns:
+            Future: résultat de `function(*args)`
+
+        Raises:
+            RuntimeError: si le thread est arrêté ou en cours d'arrêt
+        """
+        future = Future()
+        with self._submit_lock:
+            if self._stopping:
+                raise RuntimeError("Thread de calcul arrêté : commande refusée")
+            self._commands.put((function, args, future))
+        return future
+
+    def publish(self):
+        """
+        Matérialise et publie l'instantané de l'état courant s'il a changé.
+
+        Returns:
+            bool: True si un nouvel instantané a été publié
+        """
+        snapshot = self.controller.get_snapshot()
+        if snapshot is self.buffer.latest():
+            return False
+        self.buffer.publish(snapshot.materialize(self.sections))
+        return True
+
+    def _run(self):
+        """Boucle du thread : un lot de commandes, les sous-pas dus de l'horloge, une publication"""
+        clock = self.controller.clock
+        while True:
+            try:
+                batch = [self._commands.get(timeout=clock.next_wakeup())]
+            except queue.Empty:
+                batch = []
+            while True:
+                try:
+                    batch.append(self._commands.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = None in batch
+            if stop:
+                # Rien n'est exécuté après la demande d'arrêt
+                for command in batch[batch.index(None) + 1:]:
+                    command[2].cancel()
+                batch = batch[:batch.index(None)]
+            outcomes = []
+            for command in batch:
+                function, args, future = command
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    outcomes.append((future, function(*args), None))
+                except Exception as e:
+                    outcomes.append((future, None, e))
+
+            publish_error = None
+            try:
+                ticking = clock.running
+                if ticking:
+                    clock.advance(self.controller.model.advance_time)
+                # Horloge en marche : une image au plus par période d'affichage,
+                # sauf pour rendre compte des commandes du lot
+                if (outcomes or not ticking or clock.frame_due()) and self.publish() and ticking:
+                    clock.frame_published()
+            except Exception as e:
+                publish_error = e
+                clock.pause()
+                print(f"Erreur du thread de calcul: {e}")
+            self.commands_processed += len(outcomes)
+            if batch or stop:
+                self.batches_processed += 1
+
+            for future, result, error in outcomes:
+                error = error or publish_error
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(result)
+            if stop:
+                return
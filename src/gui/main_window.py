@@ -6,11 +6,12 @@ from PyQt6.QtWidgets import (
     QLabel, QSlider, QComboBox, QGroupBox, QDoubleSpinBox,
     QPushButton
 )
-from PyQt6.QtCore import Qt, QEvent
+from PyQt6.QtCore import Qt, QEvent, QTimer
 from PyQt6.QtGui import QKeySequence, QShortcut
 
 from src.controller.reactor_controller import ReactorController
 from src.gui.visualization import VisualizationPanel
+from src.gui.update_scheduler import UpdateScheduler
 from src.gui.widgets.info_panel import InfoPanel
 
 from src.gui.widgets.credits_button import CreditsButton
@@ -85,6 +86,24 @@ class MainWindow(QMainWindow):
 
         # Connect xenon dynamics controls
         self.connect_xenon_signals()
+        self.connect_uncertainty_signals()
+
+        # Le modèle tourne désormais sur le thread de calcul du contrôleur ;
+        # la fenêtre affiche le dernier instantané publié, à la cadence d'affichage
+        self._pending_results = []
+        self._last_command = None
+        self.update_scheduler = UpdateScheduler(
+            lambda values: self._submit(self.controller.update_parameters, values))
+        self._displayed_snapshot = None
+        self._preset_checked_snapshot = None
+        self._sections_request = None
+        self.controller.start_worker()
+        self._update_display_sections()
+        self.visualization_panel.tabs.currentChanged.connect(lambda index: self._update_display_sections())
+        self.visualization_panel.sections_requested.connect(self.on_sections_requested)
+        self.frame_timer = QTimer(self)
+        self.frame_timer.timeout.connect(self._on_frame)
+        self.frame_timer.start(round(1000 / gui_settings.get("display_refresh_rate_hz", 60)))
 
         # Initialize UI with a preset
         self.on_preset_changed("PMD en début de cycle")
@@ -122,9 +141,18 @@ class MainWindow(QMainWindow):
     def connect_xenon_signals(self):
         """Connecte les signaux des contrôles de dynamique Xénon"""
         xenon_controls = self.visualization_panel.get_xenon_controls()
-        xenon_controls.time_advance_requested.connect(self.on_time_advance)
+        xenon_controls.configure_clock(config.SIMULATION_CLOCK_ACCELERATION, config.SIMULATION_CLOCK_SUBSTEP_MINUTES,
+                                       config.SIMULATION_CLOCK_MAX_ACCELERATION,
+                                       config.SIMULATION_CLOCK_MAX_SUBSTEP_MINUTES)
+        xenon_controls.simulation_started.connect(self.on_simulation_started)
+        xenon_controls.simulation_paused.connect(self.on_simulation_paused)
         xenon_controls.reset_requested.connect(self.on_xenon_reset)
 
+    def connect_uncertainty_signals(self):
+        """Connecte les boutons de lancement des analyses d'incertitudes et de sensibilité"""
+        self.visualization_panel.uncertainty_widget.analysis_requested.connect(self.on_uncertainty_analysis)
+        self.visualization_panel.sensitivity_widget.analysis_requested.connect(self.on_sensitivity_analysis)
+
     def create_control_panel(self):
         """Crée le panneau de contrôle avec les contrôles des paramètres du réacteur"""
         control_panel = QWidget()
@@ -171,6 +199,13 @@ class MainWindow(QMainWindow):
         params_layout.addWidget(self.reactivity_label)
         params_layout.addWidget(self.doubling_time_label)
         params_layout.addWidget(self.delayed_neutron_label)
+        # Coefficients de réactivité (calcul analytique)
+        self.doppler_coefficient_label = QLabel("Coef. Doppler (pcm/°C): -")
+        self.moderator_coefficient_label = QLabel("Coef. modérateur (pcm/°C): -")
+        self.boron_worth_label = QLabel("Efficacité bore (pcm/ppm): -")
+        params_layout.addWidget(self.doppler_coefficient_label)
+        params_layout.addWidget(self.moderator_coefficient_label)
+        params_layout.addWidget(self.boron_worth_label)
         self.reactor_params_group.setLayout(params_layout)
 
         # Add all groups to control layout
@@ -246,14 +281,14 @@ class MainWindow(QMainWindow):
         """Reset tous les paramètres au preset actuellement sélectionné dans le combo"""
         selected_preset = self.preset_combo.currentText()
         if selected_preset and selected_preset != "Personnalisé":
-            config = self.controller.apply_preset(selected_preset)
-            if config:
-                self.update_ui_from_preset(config)
+            self.update_scheduler.discard()
+            self._submit(self.controller.apply_preset, selected_preset, on_result=self.update_ui_from_preset)
     
     def update_reset_button_state(self):
         """Met à jour l'état du bouton Reset selon si l'état actuel correspond au preset sélectionné"""
         selected_preset = self.preset_combo.currentText()
-        current_preset = self.controller.get_current_preset_name()
+        snapshot = self._displayed_snapshot
+        current_preset = snapshot.preset_name if snapshot is not None else selected_preset
         
         should_enable = (selected_preset and 
                         selected_preset != "Personnalisé" and
@@ -267,13 +302,13 @@ class MainWindow(QMainWindow):
             self.update_reset_button_state()
             return
             
-        config = self.controller.apply_preset(preset_name)
-        if config:
-            self.update_ui_from_preset(config)
-            self.update_reset_button_state()
+        self.update_scheduler.discard()
+        self._submit(self.controller.apply_preset, preset_name, on_result=self.update_ui_from_preset)
             
     def update_ui_from_preset(self, config):
         """Update all UI controls from a preset configuration"""
+        if not config:
+            return
         # Block signals to prevent feedback loops
         widgets = [
             self.rod_R_slider, self.rod_R_spinbox, self.rod_GCP_slider, self.rod_GCP_spinbox,
@@ -299,24 +334,76 @@ class MainWindow(QMainWindow):
         # Unblock signals
         for widget in widgets:
             widget.blockSignals(False)
-        
-        self.update_reactor_params(config["reactor_params"])
-        self.update_visualizations()
-        self.check_for_custom_preset()
+        self.update_reset_button_state()
     
     def check_for_custom_preset(self):
         """Check if current settings match a preset, otherwise set to 'Personnalisé'."""
-        current_preset_name = self.controller.get_current_preset_name()
+        current_preset_name = self._displayed_snapshot.preset_name
         if self.preset_combo.currentText() != current_preset_name:
             self.preset_combo.setCurrentText(current_preset_name)
         
         self.update_reset_button_state()
 
-    def _update_parameter_and_ui(self, controller_method, value):
-        params = controller_method(float(value))
-        self.update_reactor_params(params)
-        self.update_visualizations()
-        self.check_for_custom_preset()
+    def _submit(self, controller_method, *args, on_result=None, on_error=None):
+        """
+        Passe une commande au thread de calcul.
+
+        `on_result` (ou `on_error`) est appelé sur le thread de l'interface, à
+        la première image qui suit la fin de la commande.
+        """
+        future = self.controller.submit(controller_method, *args)
+        self._last_command = future
+        self._watch(future, controller_method, on_result, on_error)
+        return future
+
+    def _watch(self, future, controller_method, on_result=None, on_error=None):
+        """Transmet à `on_result` / `on_error`, sur le thread de l'interface, l'issue d'un Future"""
+        self._pending_results.append((future, controller_method, on_result, on_error))
+
+    def _on_frame(self):
+        """Image de la boucle d'affichage : résultats des commandes, consignes en attente, dernier instantané"""
+        pending, self._pending_results = self._pending_results, []
+        for entry in pending:
+            future, controller_method, on_result, on_error = entry
+            if not future.done():
+                self._pending_results.append(entry)
+                continue
+            error = future.exception()
+            if error is not None:
+                if on_error is not None:
+                    on_error(error)
+                else:
+                    print(f"Erreur lors de l'exécution de {controller_method.__name__}: {error}")
+            elif on_result is not None:
+                on_result(future.result())
+
+        # Au plus un recalcul des consignes par image
+        self.update_scheduler.flush()
+
+        snapshot = self.controller.latest_snapshot()
+        if snapshot is not None and snapshot is not self._displayed_snapshot:
+            self._displayed_snapshot = snapshot
+            self.update_reactor_params(snapshot.reactor_parameters)
+            self.update_visualizations(snapshot)
+            self.visualization_panel.get_xenon_controls().update_clock_status(
+                self.controller.get_clock_statistics(), snapshot.xenon_dynamics["time_hours"])
+
+        # Le preset n'est recherché que sur un instantané à jour de toutes les
+        # commandes : un état intermédiaire ferait réappliquer un preset dépassé
+        idle = ((self._last_command is None or self._last_command.done()) and
+                not self.update_scheduler.has_pending())
+        if idle and self._displayed_snapshot is not None and self._displayed_snapshot is not self._preset_checked_snapshot:
+            if self._displayed_snapshot is self.controller.latest_snapshot():
+                self._preset_checked_snapshot = self._displayed_snapshot
+                self.check_for_custom_preset()
+
+    def _schedule_parameter(self, param_name, value):
+        """Confie une nouvelle consigne au planificateur (appliquée à la prochaine image)"""
+        self.update_scheduler.request(param_name, float(value))
+
+    def get_update_statistics(self):
+        """Compteurs du planificateur de consignes (événements reçus, fusionnés, recalculs)"""
+        return self.update_scheduler.get_statistics()
 
     def on_rod_R_slider_changed(self, value):
         """Handle R group slider change"""
@@ -327,7 +414,7 @@ class MainWindow(QMainWindow):
         self.rod_R_spinbox.setValue(inverted_value)
         self.rod_R_spinbox.blockSignals(False)
         
-        self._update_parameter_and_ui(self.controller.update_rod_group_R_position, inverted_value)
+        self._schedule_parameter("rod_group_R_position", inverted_value)
     
     def on_rod_R_spinbox_changed(self, value):
         """Handle R group spinbox change"""
@@ -338,7 +425,7 @@ class MainWindow(QMainWindow):
         self.rod_R_slider.setValue(inverted_slider_value)
         self.rod_R_slider.blockSignals(False)
         
-        self._update_parameter_and_ui(self.controller.update_rod_group_R_position, value)
+        self._schedule_parameter("rod_group_R_position", value)
     
     def on_rod_GCP_slider_changed(self, value):
         """Handle GCP group slider change"""
@@ -349,7 +436,7 @@ class MainWindow(QMainWindow):
         self.rod_GCP_spinbox.setValue(inverted_value)
         self.rod_GCP_spinbox.blockSignals(False)
         
-        self._update_parameter_and_ui(self.controller.update_rod_group_GCP_position, inverted_value)
+        self._schedule_parameter("rod_group_GCP_position", inverted_value)
     
     def on_rod_GCP_spinbox_changed(self, value):
         """Handle GCP group spinbox change"""
@@ -360,70 +447,90 @@ class MainWindow(QMainWindow):
         self.rod_GCP_slider.setValue(inverted_slider_value)
         self.rod_GCP_slider.blockSignals(False)
         
-        self._update_parameter_and_ui(self.controller.update_rod_group_GCP_position, value)
+        self._schedule_parameter("rod_group_GCP_position", value)
 
     def on_boron_slider_changed(self, value):
         """Met à jour le spinbox depuis le slider."""
         self.boron_spinbox.blockSignals(True)
         self.boron_spinbox.setValue(float(value))
         self.boron_spinbox.blockSignals(False)
-        self._update_parameter_and_ui(self.controller.update_boron_concentration, value)
+        self._schedule_parameter("boron_concentration", value)
         
     def on_boron_spinbox_changed(self, value):
         """Met à jour le slider depuis le spinbox."""
         self.boron_slider.blockSignals(True)
         self.boron_slider.setValue(int(value))
         self.boron_slider.blockSignals(False)
-        self._update_parameter_and_ui(self.controller.update_boron_concentration, value)
+        self._schedule_parameter("boron_concentration", value)
     
     def on_power_slider_changed(self, value):
         """Met à jour le spinbox depuis le slider de puissance."""
         self.power_spinbox.blockSignals(True)
         self.power_spinbox.setValue(float(value))
         self.power_spinbox.blockSignals(False)
-        self._update_parameter_and_ui(self.controller.update_power_level, value)
+        self._schedule_parameter("power_level", value)
         
     def on_power_spinbox_changed(self, value):
         """Met à jour le slider depuis le spinbox de puissance."""
         self.power_slider.blockSignals(True)
         self.power_slider.setValue(int(value))
         self.power_slider.blockSignals(False)
-        self._update_parameter_and_ui(self.controller.update_power_level, value)
+        self._schedule_parameter("power_level", value)
 
-    def on_time_advance(self, hours):
-        """Handle time advancement for xenon dynamics"""
-        # Protection contre les appels multiples simultanés
-        if hasattr(self, '_advancing_time') and self._advancing_time:
-            return
-            
-        try:
-            self._advancing_time = True
-            params = self.controller.advance_time(hours)
-            self.update_reactor_params(params)
-            self.update_visualizations()
-            self.check_for_custom_preset()
-        except Exception as e:
-            print(f"Erreur lors de l'avancement temporel: {e}")
-        finally:
-            self._advancing_time = False
+    def on_simulation_started(self, acceleration, substep_minutes):
+        """Démarre (ou règle) l'horloge de simulation du thread de calcul"""
+        self._submit(self.controller.start_clock, acceleration, substep_minutes,
+                     on_error=lambda e: print(f"Erreur lors du démarrage de la simulation: {e}"))
+
+    def on_simulation_paused(self):
+        """Suspend l'horloge de simulation"""
+        self._submit(self.controller.pause_clock)
     
     def on_xenon_reset(self):
         """Handle xenon reset to equilibrium"""
-        # Protection contre les appels multiples simultanés
-        if hasattr(self, '_resetting_xenon') and self._resetting_xenon:
-            return
-        
-        try:
-            self._resetting_xenon = True
-            params = self.controller.reset_xenon_to_equilibrium()
-            self.update_reactor_params(params)
-            self.update_visualizations()
-            self.visualization_panel.xenon_widget.clear_history()
-            self.check_for_custom_preset()
-        except Exception as e:
-            print(f"Erreur lors de la réinitialisation xénon: {e}")
-        finally:
-            self._resetting_xenon = False
+        self._submit(self.controller.reset_xenon_to_equilibrium,
+                     on_result=lambda params: self._clear_xenon_history(),
+                     on_error=lambda e: print(f"Erreur lors de la réinitialisation xénon: {e}"))
+
+    def _clear_xenon_history(self):
+        """Efface les historiques xénon ; le prochain instantané y reprend à l'équilibre"""
+        # Les contrôles ont déjà été remis à zéro par leur bouton (leur remise à
+        # zéro émettrait une nouvelle demande de réinitialisation)
+        self.visualization_panel.clear_xenon_history()
+        self._displayed_snapshot = None
+
+    def on_uncertainty_analysis(self):
+        """Lance la propagation d'incertitudes sur l'état actuel et affiche les bandes de centiles"""
+        widget = self.visualization_panel.uncertainty_widget
+        widget.run_button.setEnabled(False)
+        widget.status_label.setText("Analyse en cours...")
+        self._watch(self.controller.start_uncertainty_analysis(), self.controller.start_uncertainty_analysis,
+                    on_result=lambda data: self._on_analysis_finished(
+                        widget, self.visualization_panel.update_uncertainty_plot, data),
+                    on_error=lambda e: self._on_analysis_failed(
+                        widget, f"Erreur lors de l'analyse d'incertitudes: {e}"))
+
+    def on_sensitivity_analysis(self):
+        """Calcule les indices de Sobol sur tout le domaine de fonctionnement"""
+        widget = self.visualization_panel.sensitivity_widget
+        widget.run_button.setEnabled(False)
+        widget.status_label.setText("Analyse en cours...")
+        self._watch(self.controller.start_sensitivity_analysis(), self.controller.start_sensitivity_analysis,
+                    on_result=lambda data: self._on_analysis_finished(
+                        widget, self.visualization_panel.update_sensitivity_plot, data),
+                    on_error=lambda e: self._on_analysis_failed(
+                        widget, f"Erreur lors de l'analyse de sensibilité: {e}"))
+
+    def _on_analysis_finished(self, widget, update_plot, data):
+        """Affiche le résultat d'une analyse terminée sur son thread"""
+        update_plot(data)
+        widget.run_button.setEnabled(True)
+
+    def _on_analysis_failed(self, widget, message):
+        """Signale l'échec d'une analyse"""
+        print(message)
+        widget.status_label.setText("Erreur lors de l'analyse")
+        widget.run_button.setEnabled(True)
 
     def update_reactor_params(self, params):
         """Update the display of reactor parameters"""
@@ -438,24 +545,38 @@ class MainWindow(QMainWindow):
             self.doubling_time_label.setText("Temps de doublement: ∞")
         else:
             self.doubling_time_label.setText(f"Temps de doublement: {doubling_time:.1f} s")
+
+    def update_reactivity_coefficients(self, coefficients):
+        """Met à jour l'affichage des coefficients de réactivité"""
+        self.doppler_coefficient_label.setText(f"Coef. Doppler (pcm/°C): {coefficients['doppler']:.2f}")
+        self.moderator_coefficient_label.setText(
+            f"Coef. modérateur (pcm/°C): {coefficients['moderator_temperature']:.2f}")
+        self.boron_worth_label.setText(f"Efficacité bore (pcm/ppm): {coefficients['boron']:.2f}")
             
-    def update_visualizations(self):
+    def update_visualizations(self, snapshot=None):
         """Update all plots with the latest data from the model"""
-        height, flux = self.controller.get_axial_flux_distribution()
-        equivalent_position = self.controller.model._get_equivalent_rod_position_percent()
-        self.visualization_panel.update_flux_plot(height, flux, equivalent_position)
-        
-        factors_data = self.controller.get_four_factors_data()
-        self.visualization_panel.update_factors_plot(factors_data)
-        
-        balance_data = self.controller.get_neutron_balance_data()
-        self.visualization_panel.update_neutron_balance_plot(balance_data)
-        
-        cycle_data = self.controller.get_neutron_cycle_data()
-        self.visualization_panel.update_neutron_cycle_plot(cycle_data)
-        
-        xenon_data = self.controller.get_xenon_dynamics_data()
-        self.visualization_panel.update_xenon_plot(xenon_data)
+        # Un seul instantané cohérent pour toutes les visualisations
+        if snapshot is None:
+            snapshot = self.controller.latest_snapshot()
+            if snapshot is None:
+                return
+        self.update_reactivity_coefficients(snapshot.reactivity_coefficients)
+        # Seul l'onglet visible est dessiné ; les historiques xénon sont toujours enregistrés
+        self.visualization_panel.show_snapshot(snapshot)
+
+    def _update_display_sections(self):
+        """Limite les sections calculées à chaque publication à celles affichées"""
+        self.controller.set_display_sections(
+            ("reactivity_coefficients", "preset_name") + self.visualization_panel.required_sections())
+
+    def on_sections_requested(self, sections):
+        """Calcule, sur le thread de calcul, les données d'un onglet qui vient d'être affiché"""
+        self._update_display_sections()
+        if self._sections_request is not None and not self._sections_request.done():
+            return
+        self._sections_request = self._submit(
+            self.controller.materialize_snapshot, self.visualization_panel.current_snapshot(), sections,
+            on_result=lambda snapshot: self.visualization_panel.refresh())
 
     def keyPressEvent(self, event):
         """Handle key press events for the main window"""
@@ -466,6 +587,8 @@ class MainWindow(QMainWindow):
     
     def closeEvent(self, event):
         """Ensure proper cleanup on close"""
+        self.frame_timer.stop()
+        self.controller.stop_worker(timeout=1.0)
         if self.info_manager:
             widgets_to_unregister = list(self.info_manager.get_registered_widgets().keys())
             for widget in widgets_to_unregister:
@@ -0,0 +1,83 @@
+"""
+Planificateur des mises à jour de consignes de l'interface
+
+Un glissement rapide de curseur émet des dizaines de `valueChanged` par
+seconde. Le planificateur ne garde que la dernière valeur de chaque paramètre
+et n'envoie au thread de calcul qu'une commande (un seul recalcul) par image,
+et seulement lorsque la précédente est terminée. Aucune valeur finale n'est
+perdue : tant qu'il reste des valeurs en attente, elles partent à l'image
+suivante.
+"""
+
+
+class UpdateScheduler:
+    """Regroupe les changements de consignes en au plus une commande par image"""
+
+    def __init__(self, submit):
+        """
+        Args:
+            submit: fonction recevant un dictionnaire paramètre -> valeur et
+                    retournant le Future de la commande correspondante
+        """
+        self._submit = submit
+        self._pending = {}
+        self._in_flight = None
+        self.received = 0
+        self.merged = 0
+        self.discarded = 0
+        self.applied = 0
+        self.commands = 0
+        self.deferred_frames = 0
+
+    def request(self, name, value):
+        """Enregistre la nouvelle valeur d'un paramètre (remplace une valeur non encore envoyée)"""
+        self.received += 1
+        if name in self._pending:
+            self.merged += 1
+        self._pending[name] = value
+
+    def has_pending(self):
+        """Indique s'il reste des valeurs à envoyer ou une commande en cours"""
+        return bool(self._pending) or (self._in_flight is not None and not self._in_flight.done())
+
+    def discard(self):
+        """Abandonne les valeurs en attente (par exemple avant l'application d'un preset)"""
+        self.discarded += len(self._pending)
+        self._pending = {}
+
+    def flush(self):
+        """
+        Envoie les dernières valeurs, à appeler une fois par image.
+
+        Returns:
+            Future or None: commande envoyée, None si rien à envoyer ou si la
+            commande précédente n'est pas terminée
+        """
+        if not self._pending:
+            return None
+        if self._in_flight is not None and not self._in_flight.done():
+            self.deferred_frames += 1
+            return None
+        values, self._pending = self._pending, {}
+        self.applied += len(values)
+        self.commands += 1
+        self._in_flight = self._submit(values)
+        return self._in_flight
+
+    def get_statistics(self):
+        """
+        Compteurs de diagnostic.
+
+        Returns:
+            dict: événements reçus, fusionnés (valeur remplacée avant envoi),
+            abandonnés, valeurs appliquées, commandes envoyées et images où
+            l'envoi a été différé faute de recalcul terminé
+        """
+        return {
+            "received": self.received,
+            "merged": self.merged,
+            "discarded": self.discarded,
+            "applied": self.applied,
+            "commands": self.commands,
+            "deferred_frames": self.deferred_frames,
+        }
@@ -19,16 +19,34 @@ from .widgets.info_panel import InfoPanel
 
 from .widgets.neutron_cycle_plot import NeutronCyclePlot
 from .widgets.xenon_plot import XenonVisualizationWidget
+from .widgets.axial_xenon_plot import AxialXenonPlot
+from .widgets.uncertainty_plot import UncertaintyWidget
+from .widgets.sensitivity_plot import SensitivityWidget
 from .widgets.info_manager import InfoManager
 
 
+# Sections de l'instantané enregistrées à chaque publication, même onglet masqué
+# (historiques xénon et déséquilibre axial : la section ne porte que des scalaires ;
+# les profils par maille de `axial_xenon` ne sont calculés que pour l'onglet visible)
+RECORDED_SECTIONS = ("xenon_dynamics",)
+
+
 class VisualizationPanel(QWidget):
     """
     Main panel for data visualization, containing multiple plots in a tabbed view.
+
+    Seul l'onglet visible est dessiné. Les onglets masqués sont simplement
+    périmés : ils sont redessinés, à partir du dernier instantané, lorsqu'ils
+    redeviennent visibles.
     """
+    # Sections manquantes de l'instantané courant pour l'onglet visible
+    sections_requested = pyqtSignal(tuple)
+
     def __init__(self, info_manager: InfoManager, parent=None):
         super().__init__(parent)
         self.info_manager = info_manager
+        self._snapshot = None
+        self._rendered_versions = {}
         self.setup_ui()
 
     def setup_ui(self):
@@ -42,6 +60,9 @@ class VisualizationPanel(QWidget):
         self.factors_plot = FourFactorsPlot(info_manager=self.info_manager)
         self.neutron_balance_plot = NeutronBalancePlot(info_manager=self.info_manager)
         self.xenon_widget = XenonVisualizationWidget(info_manager=self.info_manager)
+        self.axial_xenon_plot = AxialXenonPlot(info_manager=self.info_manager)
+        self.uncertainty_widget = UncertaintyWidget(info_manager=self.info_manager)
+        self.sensitivity_widget = SensitivityWidget(info_manager=self.info_manager)
         
         # --- Ajout du scroll pour le cycle neutronique ---
         neutron_cycle_scroll = QScrollArea()
@@ -59,9 +80,88 @@ class VisualizationPanel(QWidget):
         self.tabs.addTab(self.flux_plot, "Flux Axial")
         self.tabs.addTab(analysis_tab, "Analyse Neutronique")
         self.tabs.addTab(self.xenon_widget, "Dynamique Xénon")
+        self.tabs.addTab(self.axial_xenon_plot, "Xénon Axial")
+        self.tabs.addTab(self.uncertainty_widget, "Incertitudes")
+        self.tabs.addTab(self.sensitivity_widget, "Sensibilité")
+
+        # Sections de l'instantané et tracé de chaque onglet alimenté par le modèle
+        self._tab_renderers = {
+            self.tabs.indexOf(neutron_cycle_scroll): (
+                ("neutron_cycle",),
+                lambda snapshot: self.update_neutron_cycle_plot(snapshot.neutron_cycle)),
+            self.tabs.indexOf(self.flux_plot): (
+                ("axial_flux", "equivalent_rod_position"),
+                lambda snapshot: self.update_flux_plot(*snapshot.axial_flux, snapshot.equivalent_rod_position)),
+            self.tabs.indexOf(analysis_tab): (
+                ("four_factors", "neutron_balance"),
+                self._render_analysis_tab),
+            self.tabs.indexOf(self.xenon_widget): (
+                ("xenon_dynamics",),
+                lambda snapshot: self.xenon_widget.redraw()),
+            self.tabs.indexOf(self.axial_xenon_plot): (
+                ("axial_xenon",),
+                self._render_axial_xenon_tab),
+        }
+        self.tabs.currentChanged.connect(self.refresh)
         
         layout.addWidget(self.tabs)
 
+    def _render_analysis_tab(self, snapshot):
+        """Facteurs et bilan neutronique"""
+        self.update_factors_plot(snapshot.four_factors)
+        self.update_neutron_balance_plot(snapshot.neutron_balance)
+
+    def _render_axial_xenon_tab(self, snapshot):
+        """Profils axiaux du dernier instantané et historique du déséquilibre"""
+        self.axial_xenon_plot.set_profiles(snapshot.axial_xenon)
+        self.axial_xenon_plot.redraw()
+
+    def required_sections(self):
+        """Sections de l'instantané à calculer : historiques et onglet visible"""
+        sections, _ = self._tab_renderers.get(self.tabs.currentIndex(), ((), None))
+        return RECORDED_SECTIONS + tuple(name for name in sections if name not in RECORDED_SECTIONS)
+
+    def show_snapshot(self, snapshot):
+        """Enregistre les historiques puis ne dessine que l'onglet visible"""
+        self._snapshot = snapshot
+        self.xenon_widget.record(snapshot.xenon_dynamics)
+        self.axial_xenon_plot.record(snapshot.xenon_dynamics)
+        self.refresh()
+
+    def refresh(self):
+        """Dessine l'onglet visible s'il est périmé par rapport au dernier instantané"""
+        snapshot = self._snapshot
+        index = self.tabs.currentIndex()
+        if snapshot is None or index not in self._tab_renderers:
+            return
+        if self._rendered_versions.get(index) == snapshot.version:
+            return
+        sections, render = self._tab_renderers[index]
+        if not snapshot.has_sections(sections):
+            # Onglet masqué lors de la publication : ses données n'ont pas été calculées
+            self.sections_requested.emit(sections)
+            return
+        render(snapshot)
+        self._rendered_versions[index] = snapshot.version
+
+    def stale_tabs(self):
+        """Onglets dont le dernier tracé est antérieur au dernier instantané"""
+        if self._snapshot is None:
+            return []
+        return [index for index in self._tab_renderers
+                if self._rendered_versions.get(index) != self._snapshot.version]
+
+    def current_snapshot(self):
+        """Dernier instantané reçu"""
+        return self._snapshot
+
+    def clear_xenon_history(self):
+        """Efface les historiques xénon ; le prochain instantané les redémarre"""
+        self.xenon_widget.xenon_plot.clear_history()
+        self.axial_xenon_plot.clear_history()
+        for widget in (self.xenon_widget, self.axial_xenon_plot):
+            self._rendered_versions.pop(self.tabs.indexOf(widget), None)
+
     def resizeEvent(self, event):
         """Handle resize event to adjust layout"""
         # This can be used to switch to a different layout on smaller screens
@@ -90,6 +190,18 @@ class VisualizationPanel(QWidget):
         """Update the xenon dynamics plot."""
         self.xenon_widget.update_data(data)
 
+    def update_axial_xenon_plot(self, data):
+        """Update the axial xenon distribution plot."""
+        self.axial_xenon_plot.update_data(data)
+
+    def update_uncertainty_plot(self, data):
+        """Update the uncertainty propagation plot."""
+        self.uncertainty_widget.update_data(data)
+
+    def update_sensitivity_plot(self, data):
+        """Update the Sobol sensitivity indices plot."""
+        self.sensitivity_widget.update_data(data)
+
     def get_xenon_controls(self):
         """Get reference to xenon control widget for signal connections."""
         return self.xenon_widget.controls
@@ -0,0 +1,174 @@
+"""
+Matplotlib canvas for the axial xenon distribution and axial offset history
+"""
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
+from typing import Optional
+from ..widgets.info_manager import InfoManager
+from ..widgets.blit_manager import BlitManager, fit_limits
+from ..widgets.history_buffer import HistoryBuffer, minmax_indices
+from src.model import config
+
+
+class AxialXenonPlot(FigureCanvasQTAgg):
+    """Distribution axiale du Xénon-135 et historique du déséquilibre axial"""
+
+    def __init__(self, parent=None, width=8, height=6, dpi=100, info_manager: Optional[InfoManager] = None):
+        self.fig = Figure(figsize=(width, height), dpi=dpi)
+        super().__init__(self.fig)
+        self.setParent(parent)
+        self.info_manager = info_manager
+
+        self.profile_axes = self.fig.add_subplot(121)
+        self.offset_axes = self.fig.add_subplot(122)
+
+        # Profils axiaux (orientation verticale, comme le graphique du flux axial)
+        self.xenon_line, = self.profile_axes.plot([], [], color='#4ECDC4', linewidth=2, label='Xénon-135')
+        self.iodine_line, = self.profile_axes.plot([], [], color='#FF6B35', linewidth=1.5,
+                                                   linestyle='--', label='Iode-135')
+        self.flux_line, = self.profile_axes.plot([], [], color='#2C3E50', linewidth=1.5, label='Flux thermique')
+        self.profile_axes.set_ylabel('Hauteur relative du cœur')
+        self.profile_axes.set_xlabel('Valeur relative (moyenne = 1, flux : max = 1)')
+        self.profile_axes.set_title('Profils axiaux')
+        self.profile_axes.set_ylim(0, 1)
+        self.profile_axes.grid(True, alpha=0.3)
+        self.profile_axes.legend(loc='lower right', fontsize=8)
+
+        # Derniers profils enregistrés et historique du déséquilibre axial
+        self._profiles = None
+        self.history = HistoryBuffer(('time_hours', 'flux_offset', 'xenon_offset'), config.HISTORY_BUFFER_CAPACITY)
+        self.flux_offset_line, = self.offset_axes.plot([], [], color='#2C3E50', linewidth=2,
+                                                       label='Déséquilibre flux')
+        self.xenon_offset_line, = self.offset_axes.plot([], [], color='#4ECDC4', linewidth=2,
+                                                        label='Déséquilibre xénon')
+        self.offset_axes.axhline(y=0, color='black', linestyle='--', alpha=0.5)
+        self.offset_axes.set_xlabel('Temps (heures)')
+        self.offset_axes.set_ylabel('Déséquilibre axial (%)')
+        self.offset_axes.set_title('Oscillations axiales')
+        self.offset_axes.grid(True, alpha=0.3)
+        self.offset_axes.legend(loc='upper right', fontsize=8)
+
+        self.fig.suptitle('Xénon Axial', fontsize=14, fontweight='bold')
+        self.profile_axes.set_xlim(0.0, 1.5)
+        self.offset_axes.set_xlim(0.0, 1.0)
+        self.offset_axes.set_ylim(-5.0, 5.0)
+        self.fig.tight_layout()
+        self.blit_manager = BlitManager(self, [self.xenon_line, self.iodine_line, self.flux_line,
+                                               self.flux_offset_line, self.xenon_offset_line])
+
+        if self.info_manager:
+            self.mpl_connect('motion_notify_event', self.on_mouse_move)
+            self.mpl_connect('axes_leave_event', self.on_axes_leave)
+
+    def update_data(self, data):
+        """Met à jour les profils et ajoute un point à l'historique si le temps a avancé"""
+        self.set_profiles(data)
+        self.record(data)
+        self.redraw()
+
+    def set_profiles(self, data):
+        """Enregistre les profils axiaux à tracer (section `axial_xenon`, lue seulement onglet visible)"""
+        if data is not None:
+            self._profiles = data
+
+    def record(self, data):
+        """
+        Ajoute un point à l'historique du déséquilibre axial sans redessiner (onglet masqué).
+
+        Args:
+            data: dictionnaire contenant "time_hours", "flux_axial_offset" et
+                  "xenon_axial_offset" (section `xenon_dynamics` ou `axial_xenon`)
+        """
+        if data is None or data['flux_axial_offset'] is None:
+            return
+        time_hours = data['time_hours']
+        flux_offset = data['flux_axial_offset'] * 100.0
+        xenon_offset = data['xenon_axial_offset'] * 100.0
+        point = {'time_hours': time_hours, 'flux_offset': flux_offset, 'xenon_offset': xenon_offset}
+        if self.history and time_hours <= self.history.last('time_hours'):
+            # Même instant (changement de paramètre) : le dernier point est remplacé
+            self.history.replace_last(point)
+        else:
+            self.history.append(point)
+
+    def redraw(self):
+        """Trace les derniers profils enregistrés et l'historique"""
+        data = self._profiles
+        if data is None:
+            return
+
+        heights = data['heights']
+        xenon = data['xenon_concentration']
+        iodine = data['iodine_concentration']
+        xenon_mean = xenon.mean()
+        iodine_mean = iodine.mean()
+        self.xenon_line.set_data(xenon / xenon_mean if xenon_mean > 0 else xenon, heights)
+        self.iodine_line.set_data(iodine / iodine_mean if iodine_mean > 0 else iodine, heights)
+        self.flux_line.set_data(data['flux'], heights)
+
+        # Historique réduit à un nombre fixe de points, extrema conservés
+        times = self.history.column('time_hours')
+        offsets = []
+        for line, name in ((self.flux_offset_line, 'flux_offset'), (self.xenon_offset_line, 'xenon_offset')):
+            values = self.history.column(name)
+            kept = minmax_indices(values, config.HISTORY_BUFFER_DISPLAY_BUCKETS)
+            line.set_data(times[kept], values[kept])
+            offsets.append(values[kept])
+
+        # Échelles élargies par paliers : le fond n'est retracé que lorsqu'elles changent
+        profile_values = [line.get_xdata() for line in (self.xenon_line, self.iodine_line, self.flux_line)]
+        limits = [
+            (self.profile_axes.set_xlim,
+             fit_limits(self.profile_axes.get_xlim(), 0.0, max(values.max() for values in profile_values),
+                        lower_margin=0.0, min_span=0.5)),
+        ]
+        if self.history:
+            offset_min = min(values.min() for values in offsets)
+            offset_max = max(values.max() for values in offsets)
+            limits.append((self.offset_axes.set_xlim,
+                           fit_limits(self.offset_axes.get_xlim(), times[0], times[-1],
+                                      lower_margin=0.0, upper_margin=0.25, min_span=1.0)))
+            limits.append((self.offset_axes.set_ylim,
+                           fit_limits(self.offset_axes.get_ylim(), min(offset_min, 0.0), max(offset_max, 0.0),
+                                      min_span=2.0)))
+        rescaled = False
+        for set_limits, new_limits in limits:
+            if new_limits is not None:
+                set_limits(*new_limits)
+                rescaled = True
+        if rescaled:
+            self.blit_manager.invalidate()
+        self.blit_manager.update()
+
+    def clear_history(self):
+        """Efface l'historique du déséquilibre axial"""
+        self.history.clear()
+        self.flux_offset_line.set_data([], [])
+        self.xenon_offset_line.set_data([], [])
+        self.offset_axes.set_xlim(0.0, 1.0)
+        self.offset_axes.set_ylim(-5.0, 5.0)
+        self.blit_manager.invalidate()
+        self.draw_idle()
+
+    def on_mouse_move(self, event):
+        """Affiche les explications correspondant au graphique survolé"""
+        if event.inaxes == self.profile_axes:
+            info_text = ("Profils axiaux du Xénon-135\n\n"
+                         "Le xénon est calculé maille par maille le long de la hauteur du cœur, "
+                         "à partir de la puissance locale. Une zone de fort flux brûle son xénon, "
+                         "ce qui y augmente encore la réactivité locale.\n\n"
+                         "Les concentrations sont rapportées à leur moyenne ; le flux est rapporté à son maximum.")
+            self.info_manager.info_requested.emit(info_text)
+        elif event.inaxes == self.offset_axes:
+            info_text = ("Oscillations axiales du xénon\n\n"
+                         "Le déséquilibre axial compare la moitié haute et la moitié basse du cœur : "
+                         "(haut - bas) / (haut + bas).\n\n"
+                         "Après un mouvement de barres ou une variation de charge, le xénon et le flux "
+                         "peuvent osciller entre le haut et le bas du cœur avec une période d'environ "
+                         "un jour. Le pilotage en suivi de charge doit amortir ces oscillations.")
+            self.info_manager.info_requested.emit(info_text)
+
+    def on_axes_leave(self, event):
+        """Efface les informations quand la souris quitte les graphiques"""
+        if self.info_manager:
+            self.info_manager.info_cleared.emit()
@@ -0,0 +1,90 @@
+"""
+Mise à jour des graphiques matplotlib par blitting
+
+Les artistes qui changent à chaque mise à jour (courbes, barres, secteurs,
+textes) sont marqués « animés » et exclus du tracé normal. Après chaque tracé
+complet de la figure, le fond (axes, graduations, légendes, titres) est mis en
+cache ; une mise à jour ne fait ensuite que restaurer ce fond et redessiner
+les artistes animés. Un tracé complet n'est nécessaire qu'au redimensionnement
+ou lorsque les limites des axes changent.
+"""
+import math
+
+
+class BlitManager:
+    """Fond statique mis en cache et artistes animés d'un canevas matplotlib"""
+
+    def __init__(self, canvas, artists=()):
+        self.canvas = canvas
+        self._artists = []
+        self._background = None
+        for artist in artists:
+            self.add_artist(artist)
+        canvas.mpl_connect('draw_event', self._on_draw)
+
+    def add_artist(self, artist):
+        """Ajoute un artiste redessiné à chaque mise à jour"""
+        artist.set_animated(True)
+        self._artists.append(artist)
+
+    def set_artists(self, artists):
+        """Remplace les artistes animés (artistes recréés) ; le fond est à retracer"""
+        self._artists = []
+        for artist in artists:
+            self.add_artist(artist)
+        self.invalidate()
+
+    def _on_draw(self, event):
+        """Tracé complet : mise en cache du fond puis tracé des artistes animés"""
+        self._background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        """Redessine les artistes animés sur le fond courant"""
+        figure = self.canvas.figure
+        for artist in self._artists:
+            if artist.get_visible():
+                figure.draw_artist(artist)
+
+    def invalidate(self):
+        """Le fond a changé (limites, textes statiques) : le prochain update fera un tracé complet"""
+        self._background = None
+
+    def update(self):
+        """Affiche l'état courant des artistes animés"""
+        if self._background is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_animated()
+        self.canvas.blit(self.canvas.figure.bbox)
+
+
+def fit_limits(current, low, high, lower_margin=0.1, upper_margin=0.1, min_span=1.0, slack=4.0, log=False):
+    """
+    Limites d'axe couvrant [low, high], ou None si les limites actuelles conviennent.
+
+    Les nouvelles limites sont élargies d'une marge, pour que les mises à jour
+    suivantes tiennent sans retracer le fond ; elles sont resserrées lorsque les
+    données n'occupent plus qu'une fraction 1/slack de l'axe.
+
+    Args:
+        current: limites actuelles (bas, haut)
+        low, high: étendue des données
+        lower_margin, upper_margin: marges en fraction de l'étendue des données
+        min_span: étendue minimale (en décades si log)
+        slack: rapport maximal entre l'étendue de l'axe et celle des données
+        log: axe logarithmique (les marges s'appliquent aux logarithmes)
+    """
+    if log:
+        if low <= 0 or current[0] <= 0:
+            return None
+        current = (math.log10(current[0]), math.log10(current[1]))
+        low, high = math.log10(low), math.log10(high)
+    span = max(high - low, min_span)
+    if current[0] <= low and high <= current[1] and current[1] - current[0] <= slack * span:
+        return None
+    limits = (low - lower_margin * span, low + span + upper_margin * span)
+    if log:
+        return 10.0 ** limits[0], 10.0 ** limits[1]
+    return limits
@@ -6,6 +6,7 @@ from matplotlib.figure import Figure
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
 from typing import Optional
 from ..widgets.info_manager import InfoManager
+from ..widgets.blit_manager import BlitManager
 
 
 class FluxDistributionPlot(FigureCanvasQTAgg):
@@ -38,6 +39,8 @@ class FluxDistributionPlot(FigureCanvasQTAgg):
         self.fig.canvas.mpl_connect('axes_leave_event', self.on_axes_leave)
         
         self.fig.tight_layout()
+        # Limites fixes : chaque mise à jour se limite au blitting des deux courbes
+        self.blit_manager = BlitManager(self, [self.line, self.rod_line])
     
     def update_plot(self, height, flux, rod_position):
         """Update the flux distribution plot with new data"""
@@ -50,7 +53,7 @@ class FluxDistributionPlot(FigureCanvasQTAgg):
         rod_tip_height = 1.0 - rod_insertion_fraction  # Position des pointes des barres
         self.rod_line.set_ydata([rod_tip_height, rod_tip_height])
         
-        self.draw()
+        self.blit_manager.update()
     
     def on_mouse_move(self, event):
         """Handle mouse movement to update tooltip info"""
@@ -5,11 +5,14 @@ from matplotlib.figure import Figure
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
 from typing import Optional
 from ..widgets.info_manager import InfoManager
+from ..widgets.blit_manager import BlitManager, fit_limits
 
 
 class FourFactorsPlot(FigureCanvasQTAgg):
     """Matplotlib canvas for plotting the four factors"""
     
+    LABELS = ['η', 'ε', 'p', 'f', 'k∞', 'P_NL_th', 'P_NL_f', 'keff']
+    
     def __init__(self, parent=None, width=5, height=4, dpi=100, info_manager: Optional[InfoManager] = None):
         self.fig = Figure(figsize=(width, height), dpi=dpi)
         self.axes = self.fig.add_subplot(111)
@@ -17,19 +20,26 @@ class FourFactorsPlot(FigureCanvasQTAgg):
         self.setParent(parent)
         self.info_manager = info_manager
         
-        # Initial empty plot
-        self.bars = None
         self.tooltips = {}
         
-        # References to plot elements that need to be cleaned up
-        self.critical_line = None
-        self.value_annotations = []
-        
         self.axes.set_xlabel('Facteur')
         self.axes.set_ylabel('Valeur')
         self.axes.set_title('Facteurs du Cycle Neutronique')
         self.axes.grid(True, axis='y')
         
+        # Artistes créés une fois, mis à jour en place (hauteurs, textes)
+        colors = ['#3498db', '#2ecc71', '#f1c40f', '#e74c3c', '#9b59b6', '#1abc9c', '#d35400', '#2c3e50']
+        self.bars = self.axes.bar(self.LABELS, [0.0] * len(self.LABELS), color=colors)
+        self.value_annotations = {
+            i: self.axes.text(i, 0.0, '', ha='center', va='bottom', fontsize=9,
+                              bbox=dict(boxstyle='round,pad=0.3', fc='yellow', alpha=0.5))
+            for i, label in enumerate(self.LABELS) if label in ('k∞', 'keff')
+        }
+        # Line for critical (k_effective = 1)
+        self.critical_line = self.axes.axhline(y=1, color='r', linestyle='--', linewidth=1.5, label='Criticité (k=1)')
+        self.axes.set_ylim(0, 2.0)
+        self.blit_manager = BlitManager(self, list(self.bars) + list(self.value_annotations.values()))
+        
         # Connect mouse motion event
         self.fig.canvas.mpl_connect('motion_notify_event', self.on_mouse_move)
         self.fig.canvas.mpl_connect('axes_leave_event', self.on_axes_leave)
@@ -38,23 +48,6 @@ class FourFactorsPlot(FigureCanvasQTAgg):
     
     def update_plot(self, factors_data):
         """Update the four factors plot with new data"""
-        # Clean up previous elements first
-        if self.bars is not None:
-            for bar in self.bars:
-                bar.remove()
-        
-        # Clear old value annotations
-        for annotation in self.value_annotations:
-            annotation.remove()
-        self.value_annotations = []
-        
-        # Clean up old critical line
-        if self.critical_line:
-            self.critical_line.remove()
-            self.critical_line = None
-        
-        # Extract data
-        labels = ['η', 'ε', 'p', 'f', 'k∞', 'P_NL_th', 'P_NL_f', 'keff']
         values = [
             factors_data['eta'], 
             factors_data['epsilon'], 
@@ -78,27 +71,20 @@ class FourFactorsPlot(FigureCanvasQTAgg):
             7: ('keff', 'Facteur de multiplication effectif', 'k∞ × P_NL_th × P_NL_f (prend en compte les fuites)', values[7])
         }
         
-        # Create color map - first 4 are four factors, then k_inf, then leakage, then k_eff
-        colors = ['#3498db', '#2ecc71', '#f1c40f', '#e74c3c', '#9b59b6', '#1abc9c', '#d35400', '#2c3e50']
-        
-        # Create bars
-        self.bars = self.axes.bar(labels, values, color=colors)
-        
-        # Update axis limits
-        self.axes.set_ylim(0, max(values) * 1.1)
+        for bar, value in zip(self.bars, values):
+            bar.set_height(value)
+        for i, annotation in self.value_annotations.items():
+            annotation.set_position((i, values[i] + 0.02))
+            annotation.set_text(f'{values[i]:.4f}')
         
-        # Add annotations for important values
-        for i, bar in enumerate(self.bars):
-            if labels[i] in ['k∞', 'keff']:
-                annotation = self.axes.text(i, values[i] + 0.02, f'{values[i]:.4f}', 
-                                           ha='center', va='bottom', fontsize=9, 
-                                           bbox=dict(boxstyle='round,pad=0.3', fc='yellow', alpha=0.5))
-                self.value_annotations.append(annotation)
-
-        # Add line for critical (k_effective = 1)
-        self.critical_line = self.axes.axhline(y=1, color='r', linestyle='--', linewidth=1.5, label='Criticité (k=1)')
-
-        self.draw()
+        # L'échelle (10 % au-dessus du plus grand facteur) n'est changée, avec
+        # un tracé complet, que lorsque les barres en sortent ou s'y tassent
+        limits = fit_limits(self.axes.get_ylim(), 0.0, max(values), lower_margin=0.0, upper_margin=0.1,
+                            min_span=0.1, slack=1.5)
+        if limits is not None:
+            self.axes.set_ylim(*limits)
+            self.blit_manager.invalidate()
+        self.blit_manager.update()
 
     def on_mouse_move(self, event):
         """Handle mouse movement to show tooltips"""
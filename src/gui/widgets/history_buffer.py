@@ -0,0 +1,106 @@
+"""
+Historique des graphiques temporels : tampon circulaire NumPy et réduction min/max
+
+Les historiques (temps, concentrations, réactivité...) sont stockés par
+colonnes dans des tableaux NumPy préalloués : un ajout est une simple écriture,
+sans objet Python par point ni troncature de liste. Chaque échantillon est
+écrit deux fois, à l'indice i et i + capacité, de sorte que les `capacité`
+derniers échantillons forment toujours une vue contiguë et chronologique, même
+après le rebouclage du tampon.
+
+Pour l'affichage, `minmax_indices` réduit une série à un nombre fixe de points
+quelle que soit la longueur de l'historique, en conservant dans chaque paquet
+le minimum et le maximum : les extrema (pic xénon, creux d'iode) sont tracés
+exactement et les limites des axes calculées sur la série réduite sont celles
+de la série complète.
+"""
+import numpy as np
+
+
+class HistoryBuffer:
+    """Tampon circulaire à colonnes nommées, de capacité fixe"""
+
+    def __init__(self, columns, capacity):
+        """
+        Args:
+            columns: noms des colonnes
+            capacity: nombre maximal d'échantillons conservés (les plus anciens sont écrasés)
+        """
+        if capacity < 1:
+            raise ValueError(f"Capacité d'historique invalide : {capacity}")
+        self.columns = tuple(columns)
+        self.capacity = int(capacity)
+        self._index = {name: i for i, name in enumerate(self.columns)}
+        # Deux copies de chaque échantillon : la fenêtre des derniers points est toujours contiguë
+        self._data = np.empty((len(self.columns), 2 * self.capacity))
+        self._size = 0
+        self._next = 0
+        self.total = 0
+
+    def __len__(self):
+        return self._size
+
+    def append(self, values):
+        """Ajoute un échantillon (dictionnaire contenant au moins toutes les colonnes)"""
+        row = [values[name] for name in self.columns]
+        self._data[:, self._next] = row
+        self._data[:, self._next + self.capacity] = row
+        self._next = (self._next + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+        self.total += 1
+
+    def replace_last(self, values):
+        """Remplace les colonnes données du dernier échantillon"""
+        if not self._size:
+            raise IndexError("Historique vide")
+        last = (self._next - 1) % self.capacity
+        for name, value in values.items():
+            row = self._index[name]
+            self._data[row, last] = value
+            self._data[row, last + self.capacity] = value
+
+    def last(self, name):
+        """Dernière valeur d'une colonne"""
+        if not self._size:
+            raise IndexError("Historique vide")
+        return self._data[self._index[name], (self._next - 1) % self.capacity]
+
+    def column(self, name):
+        """Vue chronologique (sans copie) d'une colonne ; invalidée par les ajouts suivants"""
+        start = self._next if self._size == self.capacity else 0
+        return self._data[self._index[name], start:start + self._size]
+
+    def clear(self):
+        """Vide l'historique (la mémoire reste allouée)"""
+        self._size = 0
+        self._next = 0
+
+
+def minmax_indices(values, buckets):
+    """
+    Indices d'une série réduite à au plus 2 * buckets + 3 points.
+
+    La série est découpée en `buckets` paquets consécutifs de même taille (plus
+    un paquet résiduel) ; on garde l'indice du minimum et du maximum de chaque
+    paquet, ainsi que le premier et le dernier point. Les indices sont rendus
+    dans l'ordre chronologique.
+
+    Args:
+        values: série à réduire (tableau 1D)
+        buckets: nombre de paquets
+
+    Returns:
+        numpy.ndarray: indices croissants des points conservés
+    """
+    n = len(values)
+    if n <= 2 * buckets + 2:
+        return np.arange(n)
+    size = n // buckets
+    full = size * buckets
+    blocks = values[:full].reshape(buckets, size)
+    offsets = np.arange(0, full, size)
+    parts = [offsets + blocks.argmin(axis=1), offsets + blocks.argmax(axis=1), [0, n - 1]]
+    if full < n:
+        tail = values[full:]
+        parts.append([full + tail.argmin(), full + tail.argmax()])
+    return np.unique(np.concatenate(parts))
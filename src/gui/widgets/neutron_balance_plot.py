@@ -1,16 +1,22 @@
 """
 Matplotlib canvas for plotting neutron balance
 """
+import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
 from typing import Optional
 from ..widgets.info_manager import InfoManager
+from ..widgets.blit_manager import BlitManager
 
 
 class NeutronBalancePlot(FigureCanvasQTAgg):
     """Matplotlib canvas for plotting the neutron balance as a pie chart"""
     
+    START_ANGLE = 140
+    PCT_DISTANCE = 0.85
+    LABEL_DISTANCE = 1.05
+    
     def __init__(self, parent=None, width=5, height=4, dpi=100, info_manager: Optional[InfoManager] = None):
         self.fig = Figure(figsize=(width, height), dpi=dpi)
         self.axes = self.fig.add_subplot(111)
@@ -23,6 +29,11 @@ class NeutronBalancePlot(FigureCanvasQTAgg):
         # Store tooltips
         self.tooltips = []
         
+        # Secteurs créés au premier tracé puis mis à jour en place
+        self.labels = None
+        self.wedges, self.texts, self.autotexts = [], [], []
+        self.blit_manager = BlitManager(self)
+        
         # Connect mouse motion event
         self.fig.canvas.mpl_connect('motion_notify_event', self.on_mouse_move)
         self.fig.canvas.mpl_connect('axes_leave_event', self.on_axes_leave)
@@ -31,8 +42,6 @@ class NeutronBalancePlot(FigureCanvasQTAgg):
 
     def update_plot(self, balance_data):
         """Update the neutron balance pie chart with new data"""
-        self.axes.clear()
-        
         # Extract data from the dictionary
         def multiline_label(label):
             return '\n'.join(label.split())
@@ -41,24 +50,51 @@ class NeutronBalancePlot(FigureCanvasQTAgg):
         colors = [item['color'] for item in balance_data['sections']]
         self.tooltips = [item['tooltip'] for item in balance_data['sections']]
         
+        if labels != self.labels:
+            self._create_pie(sizes, labels, colors)
+            return
+        
+        # Même découpage : secteurs et textes déplacés en place (géométrie de Axes.pie)
+        total = float(sum(sizes))
+        theta1 = self.START_ANGLE / 360.0
+        for wedge, text, autotext, size in zip(self.wedges, self.texts, self.autotexts, sizes):
+            fraction = size / total if total > 0 else 0.0
+            theta2 = theta1 + fraction
+            wedge.set_theta1(360.0 * theta1)
+            wedge.set_theta2(360.0 * theta2)
+            middle = np.pi * (theta1 + theta2)
+            x, y = np.cos(middle), np.sin(middle)
+            text.set_position((self.LABEL_DISTANCE * x, self.LABEL_DISTANCE * y))
+            text.set_horizontalalignment('left' if x > 0 else 'right')
+            autotext.set_position((self.PCT_DISTANCE * x, self.PCT_DISTANCE * y))
+            autotext.set_text(f'{100.0 * fraction:.1f}%')
+            theta1 = theta2
+        self.blit_manager.update()
+
+    def _create_pie(self, sizes, labels, colors):
+        """Crée les secteurs et leurs textes (premier tracé ou sections différentes)"""
+        self.axes.clear()
+        
         # Create pie chart
-        wedges, texts, autotexts = self.axes.pie(
+        self.wedges, self.texts, self.autotexts = self.axes.pie(
             sizes, 
             labels=labels, 
             colors=colors, 
             autopct='%1.1f%%', 
-            startangle=140,
-            pctdistance=0.85,
-            labeldistance=1.05
+            startangle=self.START_ANGLE,
+            pctdistance=self.PCT_DISTANCE,
+            labeldistance=self.LABEL_DISTANCE
         )
+        self.labels = labels
         
         # Style the plot
         self.axes.axis('equal')  # Equal aspect ratio ensures that pie is drawn as a circle.
-        plt.setp(autotexts, size=8, weight="bold", color="white")
-        plt.setp(texts, size=10)
+        plt.setp(self.autotexts, size=8, weight="bold", color="white")
+        plt.setp(self.texts, size=10)
         self.axes.set_title('Bilan Neutronique (Destin des Neutrons)')
         
-        self.draw()
+        self.blit_manager.set_artists(self.wedges + self.texts + self.autotexts)
+        self.blit_manager.update()
 
     def on_mouse_move(self, event):
         """Handle mouse movement to show tooltips"""
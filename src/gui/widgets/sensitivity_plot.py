@@ -0,0 +1,108 @@
+"""
+Global sensitivity widget: first-order and total Sobol indices per input
+"""
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel
+from PyQt6.QtCore import pyqtSignal
+from typing import Optional
+from ..widgets.info_manager import InfoManager
+
+# Titres des graphiques pour chaque grandeur étudiée
+OUTPUT_TITLES = {
+    "k_effective": "k-effectif",
+    "reactivity_pcm": "Réactivité (pcm)",
+    "xenon_reactivity_pcm": "Anti-réactivité xénon (pcm)",
+}
+
+
+class SensitivityPlot(FigureCanvasQTAgg):
+    """Diagrammes en barres des indices de Sobol, un graphique par grandeur"""
+
+    def __init__(self, parent=None, width=8, height=6, dpi=100, info_manager: Optional[InfoManager] = None):
+        self.fig = Figure(figsize=(width, height), dpi=dpi)
+        super().__init__(self.fig)
+        self.setParent(parent)
+        self.info_manager = info_manager
+        self.axes_list = []
+        self.fig.suptitle('Sensibilité globale (indices de Sobol)', fontsize=14, fontweight='bold')
+
+        if self.info_manager:
+            self.mpl_connect('motion_notify_event', self.on_mouse_move)
+            self.mpl_connect('axes_leave_event', self.on_axes_leave)
+
+    def update_data(self, data):
+        """Trace les indices de premier ordre et totaux, entrées triées par indice total"""
+        if data is None:
+            return
+        self.fig.clear()
+        self.fig.suptitle('Sensibilité globale (indices de Sobol)', fontsize=14, fontweight='bold')
+        outputs = data['outputs']
+        self.axes_list = [self.fig.add_subplot(1, len(outputs), i + 1) for i in range(len(outputs))]
+        labels = np.array(data['labels'])
+
+        for axes, name in zip(self.axes_list, outputs):
+            first_order = data[name]['first_order']
+            total_order = data[name]['total_order']
+            order = np.argsort(total_order)
+            positions = np.arange(len(order))
+            axes.barh(positions + 0.2, total_order[order], height=0.4, color='#4ECDC4', label='Total (ST)')
+            axes.barh(positions - 0.2, first_order[order], height=0.4, color='#E74C3C', label='Premier ordre (S)')
+            axes.set_yticks(positions)
+            axes.set_yticklabels(labels[order], fontsize=7)
+            axes.set_xlim(0.0, 1.0)
+            axes.set_xlabel('Part de la variance')
+            axes.set_title(OUTPUT_TITLES.get(name, name))
+            axes.grid(True, axis='x', alpha=0.3)
+            axes.legend(loc='lower right', fontsize=8)
+
+        self.fig.tight_layout()
+        self.draw_idle()
+
+    def on_mouse_move(self, event):
+        """Affiche l'explication des indices lorsque la souris survole un graphique"""
+        if event.inaxes in self.axes_list:
+            info_text = ("Indices de Sobol\n\n"
+                         "Les paramètres de fonctionnement sont tirés dans toute leur plage de réglage "
+                         "et les coefficients du modèle selon leurs incertitudes.\n\n"
+                         "Indice de premier ordre (S) : part de la variance de la grandeur expliquée "
+                         "par ce paramètre seul.\n"
+                         "Indice total (ST) : part de la variance qui disparaîtrait si ce paramètre "
+                         "était fixé, interactions comprises.\n\n"
+                         "Un écart entre ST et S signale des interactions avec d'autres paramètres.")
+            self.info_manager.info_requested.emit(info_text)
+
+    def on_axes_leave(self, event):
+        """Efface les informations quand la souris quitte les graphiques"""
+        if self.info_manager:
+            self.info_manager.info_cleared.emit()
+
+
+class SensitivityWidget(QWidget):
+    """Graphique des indices de Sobol et bouton de lancement de l'analyse"""
+
+    analysis_requested = pyqtSignal()
+
+    def __init__(self, parent=None, info_manager: Optional[InfoManager] = None):
+        super().__init__(parent)
+        self.info_manager = info_manager
+
+        layout = QVBoxLayout(self)
+        self.sensitivity_plot = SensitivityPlot(self, info_manager=info_manager)
+        layout.addWidget(self.sensitivity_plot, stretch=1)
+
+        controls = QHBoxLayout()
+        self.run_button = QPushButton("Lancer l'analyse")
+        self.run_button.clicked.connect(self.analysis_requested.emit)
+        controls.addWidget(self.run_button)
+        self.status_label = QLabel("Analyse non lancée")
+        self.status_label.setStyleSheet("color: #2E8B57; font-style: italic;")
+        controls.addWidget(self.status_label, stretch=1)
+        layout.addLayout(controls)
+
+    def update_data(self, data):
+        """Affiche le résultat d'une analyse"""
+        self.sensitivity_plot.update_data(data)
+        self.status_label.setText(f"{data['evaluations']} évaluations du modèle "
+                                  f"({data['base_samples']} tirages de base)")
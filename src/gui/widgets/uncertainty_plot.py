@@ -0,0 +1,130 @@
+"""
+Uncertainty propagation widget: percentile bands around the nominal curves
+"""
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel
+from PyQt6.QtCore import pyqtSignal
+from typing import Optional
+from ..widgets.info_manager import InfoManager
+
+
+class UncertaintyPlot(FigureCanvasQTAgg):
+    """Trajectoire xénon et distribution de k-effectif avec leurs bandes de centiles"""
+
+    def __init__(self, parent=None, width=8, height=6, dpi=100, info_manager: Optional[InfoManager] = None):
+        self.fig = Figure(figsize=(width, height), dpi=dpi)
+        super().__init__(self.fig)
+        self.setParent(parent)
+        self.info_manager = info_manager
+
+        self.xenon_axes = self.fig.add_subplot(121)
+        self.k_axes = self.fig.add_subplot(122)
+        self._setup_axes()
+        self.fig.suptitle('Propagation des incertitudes', fontsize=14, fontweight='bold')
+        self.fig.tight_layout()
+
+        if self.info_manager:
+            self.mpl_connect('motion_notify_event', self.on_mouse_move)
+            self.mpl_connect('axes_leave_event', self.on_axes_leave)
+
+    def _setup_axes(self):
+        """Titres et grilles des deux graphiques"""
+        self.xenon_axes.set_xlabel('Temps après l\'échelon (heures)')
+        self.xenon_axes.set_ylabel('Anti-réactivité xénon (pcm)')
+        self.xenon_axes.set_title('Trajectoire xénon')
+        self.xenon_axes.grid(True, alpha=0.3)
+        self.k_axes.set_xlabel('k-effectif')
+        self.k_axes.set_ylabel('Nombre de tirages')
+        self.k_axes.set_title('Distribution de k-effectif')
+        self.k_axes.grid(True, alpha=0.3)
+
+    def update_data(self, data):
+        """Trace les courbes nominales et les bandes de centiles d'une analyse"""
+        if data is None:
+            return
+        self.xenon_axes.clear()
+        self.k_axes.clear()
+        self._setup_axes()
+
+        percentiles = data['percentiles']
+        low, high = percentiles[0], percentiles[-1]
+
+        # Trajectoire xénon : bande entre le premier et le dernier centile
+        hours = data['xenon_time_hours']
+        xenon = data['xenon_reactivity_pcm']
+        self.xenon_axes.fill_between(hours, xenon['percentiles'][0], xenon['percentiles'][-1],
+                                     color='#4ECDC4', alpha=0.3, label=f'Centiles {low:g}-{high:g} %')
+        self.xenon_axes.plot(hours, xenon['nominal'], color='#E74C3C', linewidth=2, label='Nominal')
+        if len(percentiles) > 2:
+            self.xenon_axes.plot(hours, xenon['percentiles'][len(percentiles) // 2], color='#2C3E50',
+                                 linewidth=1, linestyle='--',
+                                 label=f'Centile {percentiles[len(percentiles) // 2]:g} %')
+        self.xenon_axes.set_title(f"Trajectoire xénon ({data['initial_power_level']:g} % → "
+                                  f"{data['final_power_level']:g} %)")
+        self.xenon_axes.legend(loc='lower right', fontsize=8)
+
+        # k-effectif : histogramme, valeur nominale et centiles
+        k_effective = data['k_effective']
+        self.k_axes.hist(k_effective['samples'], bins=80, color='#4ECDC4', alpha=0.7)
+        self.k_axes.axvline(k_effective['nominal'], color='#E74C3C', linewidth=2, label='Nominal')
+        for value, percentile in zip(k_effective['percentiles'], percentiles):
+            self.k_axes.axvline(value, color='#2C3E50', linewidth=1, linestyle='--')
+            self.k_axes.annotate(f'{percentile:g} %', xy=(value, 1.0), xycoords=('data', 'axes fraction'),
+                                 ha='center', va='bottom', fontsize=8)
+        self.k_axes.set_title(f"Distribution de k-effectif (σ = {k_effective['std'] * 1e5:.0f} pcm)")
+        self.k_axes.legend(loc='upper right', fontsize=8)
+
+        self.fig.tight_layout()
+        self.draw_idle()
+
+    def on_mouse_move(self, event):
+        """Affiche les explications correspondant au graphique survolé"""
+        if event.inaxes == self.xenon_axes:
+            info_text = ("Trajectoire xénon incertaine\n\n"
+                         "Les rendements, constantes de décroissance et la section efficace du xénon "
+                         "ne sont connus qu'avec une certaine précision. Chaque tirage Monte-Carlo "
+                         "recalcule l'évolution du xénon après l'échelon de puissance.\n\n"
+                         "La bande contient les trajectoires comprises entre les centiles indiqués ; "
+                         "la courbe rouge est le calcul avec les coefficients nominaux.")
+            self.info_manager.info_requested.emit(info_text)
+        elif event.inaxes == self.k_axes:
+            info_text = ("Distribution de k-effectif\n\n"
+                         "Les coefficients du modèle (quatre facteurs, fuites, xénon) sont tirés selon "
+                         "les lois déclarées dans config.json. L'histogramme montre la dispersion de "
+                         "k-effectif qui en résulte pour l'état actuel du réacteur.\n\n"
+                         "σ est l'écart-type, exprimé en pcm.")
+            self.info_manager.info_requested.emit(info_text)
+
+    def on_axes_leave(self, event):
+        """Efface les informations quand la souris quitte les graphiques"""
+        if self.info_manager:
+            self.info_manager.info_cleared.emit()
+
+
+class UncertaintyWidget(QWidget):
+    """Graphique des incertitudes et bouton de lancement de l'analyse"""
+
+    analysis_requested = pyqtSignal()
+
+    def __init__(self, parent=None, info_manager: Optional[InfoManager] = None):
+        super().__init__(parent)
+        self.info_manager = info_manager
+
+        layout = QVBoxLayout(self)
+        self.uncertainty_plot = UncertaintyPlot(self, info_manager=info_manager)
+        layout.addWidget(self.uncertainty_plot, stretch=1)
+
+        controls = QHBoxLayout()
+        self.run_button = QPushButton("Lancer l'analyse")
+        self.run_button.clicked.connect(self.analysis_requested.emit)
+        controls.addWidget(self.run_button)
+        self.status_label = QLabel("Analyse non lancée")
+        self.status_label.setStyleSheet("color: #2E8B57; font-style: italic;")
+        controls.addWidget(self.status_label, stretch=1)
+        layout.addLayout(controls)
+
+    def update_data(self, data):
+        """Affiche le résultat d'une analyse"""
+        self.uncertainty_plot.update_data(data)
+        self.status_label.setText(f"{data['samples']} tirages - état au moment du lancement")
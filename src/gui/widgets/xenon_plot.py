@@ -5,32 +5,56 @@ This widget displays the evolution of Iodine-135 and Xenon-135 concentrations ov
 along with their effect on reactor reactivity.
 """
 import matplotlib.pyplot as plt
+import numpy as np
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
 from matplotlib.figure import Figure
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QSpinBox
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, pyqtSignal
 from typing import Optional
 from ..widgets.info_manager import InfoManager
+from ..widgets.blit_manager import BlitManager, fit_limits
+from ..widgets.history_buffer import HistoryBuffer, minmax_indices
+from src.model import config
 
 class XenonPlot(FigureCanvasQTAgg):
+    # Colonnes de l'historique, dans l'ordre des données de `xenon_dynamics`
+    HISTORY_COLUMNS = ('time_hours', 'iodine_concentration', 'xenon_concentration',
+                       'xenon_reactivity_pcm', 'power_level')
+
     def __init__(self, parent=None, width=8, height=6, dpi=100, info_manager: Optional[InfoManager] = None):
         self.fig = Figure(figsize=(width, height), dpi=dpi)
         super().__init__(self.fig)
         self.setParent(parent)
         
         self.info_manager = info_manager
-        self.data_history = []  # Stockage de l'historique des données
+        # Historique complet (tampon circulaire), réduit à un nombre fixe de points pour le tracé
+        self.data_history = HistoryBuffer(self.HISTORY_COLUMNS, config.HISTORY_BUFFER_CAPACITY)
+        self.display_buckets = config.HISTORY_BUFFER_DISPLAY_BUCKETS
         
         # Configuration des sous-graphiques
         self.ax1 = self.fig.add_subplot(211)  # Concentrations
         self.ax2 = self.fig.add_subplot(212)  # Effet sur la réactivité
         
         self.fig.suptitle('Dynamique Xénon-135', fontsize=14, fontweight='bold')
-        self.fig.tight_layout()
         
         # Configuration de l'affichage
         self._setup_plots()
         
+        # Courbes créées une fois, mises à jour en place par blitting
+        self.iodine_line, = self.ax1.plot([], [], color=self.iodine_color, linewidth=2,
+                                          label='Iode-135', marker='o', markersize=4, markevery=0.05)
+        self.xenon_line, = self.ax1.plot([], [], color=self.xenon_color, linewidth=2,
+                                         label='Xénon-135', marker='s', markersize=4, markevery=0.05)
+        self.ax1.legend(loc='upper right')
+        self.reactivity_line, = self.ax2.plot([], [], color=self.reactivity_color, linewidth=2,
+                                              label='Anti-réactivité Xe-135', marker='^',
+                                              markersize=4, markevery=0.05)
+        self.ax2.axhline(y=0, color='black', linestyle='--', alpha=0.5)
+        self.ax2.legend(loc='upper right')
+        self._reset_limits()
+        self.fig.tight_layout()
+        self.blit_manager = BlitManager(self, [self.iodine_line, self.xenon_line, self.reactivity_line])
+        
         # Connexion des événements de survol
         if self.info_manager:
             self.mpl_connect('motion_notify_event', self.on_mouse_move)
@@ -57,72 +81,75 @@ class XenonPlot(FigureCanvasQTAgg):
 
     def update_data(self, data):
         """Ajoute un nouveau point de données à l'historique et met à jour l'affichage"""
-        # Ajouter le nouveau point à l'historique
-        self.data_history.append({
-            'time_hours': data['time_hours'],
-            'iodine_concentration': data['iodine_concentration'],
-            'xenon_concentration': data['xenon_concentration'],
-            'xenon_reactivity_pcm': data['xenon_reactivity_pcm'],
-            'power_level': data['power_level']
-        })
-        
-        # Limiter l'historique à 100 points pour la performance
-        if len(self.data_history) > 100:
-            self.data_history = self.data_history[-100:]
-        
+        self.record(data)
+        self._plot_data()
+
+    def record(self, data):
+        """Ajoute un point à l'historique sans redessiner (onglet masqué)"""
+        self.data_history.append(data)
+
+    def redraw(self):
+        """Redessine l'historique enregistré"""
         self._plot_data()
 
+    def _reset_limits(self):
+        """Limites initiales des axes (historique vide)"""
+        for ax in (self.ax1, self.ax2):
+            ax.set_xlim(0.0, 1.0)
+        self.ax1.set_ylim(1e13, 1e17)
+        self.ax2.set_ylim(-100.0, 100.0)
+
     def _plot_data(self):
-        """Redessine les graphiques avec l'historique complet des données"""
+        """Met à jour les courbes avec l'historique ; le fond n'est retracé que si les échelles changent"""
         if not self.data_history:
             return
             
-        # Extraction des données pour le plotting
-        times = [d['time_hours'] for d in self.data_history]
-        iodine_conc = [d['iodine_concentration'] for d in self.data_history]
-        xenon_conc = [d['xenon_concentration'] for d in self.data_history]
-        reactivity = [d['xenon_reactivity_pcm'] for d in self.data_history]
-        
-        # Nettoyage des axes
-        self.ax1.clear()
-        self.ax2.clear()
-        
-        # Reconfiguration après nettoyage
-        self._setup_plots()
-        
-        # Graphique des concentrations
-        if iodine_conc and max(iodine_conc) > 0:
-            self.ax1.plot(times, iodine_conc, color=self.iodine_color, linewidth=2, 
-                         label='Iode-135', marker='o', markersize=4)
-        if xenon_conc and max(xenon_conc) > 0:
-            self.ax1.plot(times, xenon_conc, color=self.xenon_color, linewidth=2, 
-                         label='Xénon-135', marker='s', markersize=4)
-        
-        self.ax1.legend(loc='upper right')
-        
-        # Graphique de l'anti-réactivité
-        if reactivity:
-            self.ax2.plot(times, reactivity, color=self.reactivity_color, linewidth=2, 
-                         label='Anti-réactivité Xe-135', marker='^', markersize=4)
-            self.ax2.axhline(y=0, color='black', linestyle='--', alpha=0.5)
-        
-        self.ax2.legend(loc='upper right')
-        
-        # Ajustement automatique des échelles
-        if times:
-            for ax in [self.ax1, self.ax2]:
-                ax.set_xlim(min(times), max(times) if max(times) > min(times) else min(times) + 1)
-        
-        self.fig.tight_layout()
-        self.draw()
+        # Chaque courbe est réduite séparément ; ses extrema sont conservés exactement
+        times = self.data_history.column('time_hours')
+        curves = []
+        for line, name in ((self.iodine_line, 'iodine_concentration'),
+                           (self.xenon_line, 'xenon_concentration'),
+                           (self.reactivity_line, 'xenon_reactivity_pcm')):
+            values = self.data_history.column(name)
+            kept = minmax_indices(values, self.display_buckets)
+            line.set_data(times[kept], values[kept])
+            curves.append(values[kept])
+        iodine_conc, xenon_conc, reactivity = curves
+        
+        # Échelles : élargies par paliers pour que la plupart des pas se limitent au blitting
+        rescaled = False
+        x_limits = fit_limits(self.ax1.get_xlim(), times.min(), times.max(),
+                              lower_margin=0.0, upper_margin=0.25, min_span=1.0)
+        if x_limits is not None:
+            for ax in (self.ax1, self.ax2):
+                ax.set_xlim(*x_limits)
+            rescaled = True
+        concentrations = np.concatenate((iodine_conc, xenon_conc))
+        positive = concentrations[concentrations > 0]
+        if positive.size:
+            y_limits = fit_limits(self.ax1.get_ylim(), positive.min(), positive.max(), min_span=0.5, log=True)
+            if y_limits is not None:
+                self.ax1.set_ylim(*y_limits)
+                rescaled = True
+        y_limits = fit_limits(self.ax2.get_ylim(), min(reactivity.min(), 0.0), max(reactivity.max(), 0.0),
+                              min_span=10.0)
+        if y_limits is not None:
+            self.ax2.set_ylim(*y_limits)
+            rescaled = True
+        
+        if rescaled:
+            self.fig.tight_layout()
+            self.blit_manager.invalidate()
+        self.blit_manager.update()
 
     def clear_history(self):
         """Efface l'historique des données et remet à zéro les graphiques"""
         self.data_history.clear()
-        self.ax1.clear()
-        self.ax2.clear()
-        self._setup_plots()
-        self.draw()
+        for line in (self.iodine_line, self.xenon_line, self.reactivity_line):
+            line.set_data([], [])
+        self._reset_limits()
+        self.blit_manager.invalidate()
+        self.draw_idle()
 
     def on_mouse_move(self, event):
         """Gestion du survol de la souris pour afficher des informations"""
@@ -153,15 +180,14 @@ class XenonPlot(FigureCanvasQTAgg):
 
 
 class XenonControlWidget(QWidget):
-    """Widget de contrôle pour la simulation temporelle automatique du Xénon"""
+    """Widget de contrôle de l'horloge de simulation du Xénon (lecture accélérée)"""
     
-    time_advance_requested = pyqtSignal(float)  # Signal émis pour avancer le temps
+    simulation_started = pyqtSignal(float, float)  # accélération, résolution (min)
+    simulation_paused = pyqtSignal()
     reset_requested = pyqtSignal()  # Signal pour remettre à l'équilibre
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.simulation_timer = QTimer()
-        self.simulation_timer.timeout.connect(self._advance_simulation_step)
         self.is_running = False
         self._setup_ui()
         
@@ -190,37 +216,57 @@ class XenonControlWidget(QWidget):
         
         layout.addLayout(control_layout)
         
-        # Paramètres de simulation
+        # Paramètres de l'horloge (modifiables en cours de simulation)
         params_layout = QVBoxLayout()
         
-        # Pas de temps de simulation (modifiable en temps réel)
         step_layout = QHBoxLayout()
-        step_layout.addWidget(QLabel("Pas de temps:"))
-        self.time_step_spinbox = QSpinBox()
-        self.time_step_spinbox.setMinimum(1)
-        self.time_step_spinbox.setMaximum(24)
-        self.time_step_spinbox.setValue(1)
-        self.time_step_spinbox.setSuffix(" h")
-        self.time_step_spinbox.valueChanged.connect(self._update_simulation_params)
-        step_layout.addWidget(self.time_step_spinbox)
-        
-        # Vitesse de simulation (intervalle entre pas)
-        step_layout.addWidget(QLabel("Vitesse:"))
-        self.speed_spinbox = QSpinBox()
-        self.speed_spinbox.setMinimum(100)
-        self.speed_spinbox.setMaximum(5000)
-        self.speed_spinbox.setValue(1000)
-        self.speed_spinbox.setSuffix(" ms")
-        self.speed_spinbox.valueChanged.connect(self._update_simulation_params)
-        step_layout.addWidget(self.speed_spinbox)
+        # Résolution physique : durée d'un sous-pas d'intégration
+        step_layout.addWidget(QLabel("Résolution:"))
+        self.substep_spinbox = QSpinBox()
+        self.substep_spinbox.setMinimum(1)
+        self.substep_spinbox.setMaximum(60)
+        self.substep_spinbox.setValue(1)
+        self.substep_spinbox.setSuffix(" min")
+        self.substep_spinbox.valueChanged.connect(self._update_simulation_params)
+        step_layout.addWidget(self.substep_spinbox)
+        
+        # Accélération : secondes simulées par seconde réelle
+        step_layout.addWidget(QLabel("Accélération:"))
+        self.acceleration_spinbox = QSpinBox()
+        self.acceleration_spinbox.setMinimum(1)
+        self.acceleration_spinbox.setMaximum(100000)
+        self.acceleration_spinbox.setValue(8640)
+        self.acceleration_spinbox.setPrefix("×")
+        self.acceleration_spinbox.valueChanged.connect(self._update_simulation_params)
+        step_layout.addWidget(self.acceleration_spinbox)
         
         params_layout.addLayout(step_layout)
+        self.rate_label = QLabel()
+        self.rate_label.setStyleSheet("color: #555555; font-size: 11px;")
+        params_layout.addWidget(self.rate_label)
         layout.addLayout(params_layout)
+        self._update_rate_label()
         
         # Info sur l'état actuel
         self.status_label = QLabel("État: Prêt - Appuyez sur Play pour démarrer")
         self.status_label.setStyleSheet("color: #2E8B57; font-style: italic; margin-top: 10px;")
         layout.addWidget(self.status_label)
+
+    def configure_clock(self, acceleration, substep_minutes, max_acceleration, max_substep_minutes):
+        """Applique les valeurs par défaut et les limites de l'horloge (config.json)"""
+        for spinbox, value, maximum in ((self.acceleration_spinbox, acceleration, max_acceleration),
+                                        (self.substep_spinbox, substep_minutes, max_substep_minutes)):
+            spinbox.blockSignals(True)
+            spinbox.setMaximum(int(maximum))
+            spinbox.setValue(int(value))
+            spinbox.blockSignals(False)
+        self._update_rate_label()
+        
+    def _update_rate_label(self):
+        """Affiche la durée simulée par seconde réelle"""
+        hours_per_second = self.acceleration_spinbox.value() / 3600.0
+        self.rate_label.setText(f"1 s = {hours_per_second:.2f} h simulées "
+                                f"({72.0 / hours_per_second:.0f} s pour 72 h)")
         
     def _toggle_simulation(self):
         """Démarre ou met en pause la simulation"""
@@ -230,14 +276,12 @@ class XenonControlWidget(QWidget):
             self._pause_simulation()
     
     def _start_simulation(self):
-        """Démarre la simulation automatique"""
+        """Démarre l'horloge de simulation"""
         self.is_running = True
         self.play_button.setText("⏸ Pause")
         self.play_button.setStyleSheet("background-color: #FF9800; color: white; font-weight: bold;")
         
-        # Configurer le timer avec la vitesse actuelle
-        interval_ms = self.speed_spinbox.value()
-        self.simulation_timer.start(interval_ms)
+        self.simulation_started.emit(float(self.acceleration_spinbox.value()), float(self.substep_spinbox.value()))
         
         self.status_label.setText("État: Simulation en cours...")
         self.status_label.setStyleSheet("color: #4CAF50; font-style: italic; margin-top: 10px;")
@@ -248,16 +292,16 @@ class XenonControlWidget(QWidget):
         self.play_button.setText("▶ Play")
         self.play_button.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold;")
         
-        self.simulation_timer.stop()
+        self.simulation_paused.emit()
         
         self.status_label.setText("État: Simulation en pause")
         self.status_label.setStyleSheet("color: #FF9800; font-style: italic; margin-top: 10px;")
     
     def _stop_and_reset(self):
         """Arrête la simulation et remet à l'équilibre"""
-        # Arrêter le timer d'abord
-        if self.simulation_timer.isActive():
-            self.simulation_timer.stop()
+        # Arrêter l'horloge d'abord
+        if self.is_running:
+            self.simulation_paused.emit()
         
         # S'assurer que l'état est cohérent
         self.is_running = False
@@ -270,44 +314,25 @@ class XenonControlWidget(QWidget):
         self.status_label.setText("État: Arrêté et remis à l'équilibre")
         self.status_label.setStyleSheet("color: #2E8B57; font-style: italic; margin-top: 10px;")
     
-    
-    def _advance_simulation_step(self):
-        """Avance la simulation d'un pas (appelée par le timer)"""
-        # Vérifier que la simulation est toujours active et que le timer tourne
-        if self.is_running and self.simulation_timer.isActive():
-            try:
-                hours = self.time_step_spinbox.value()
-                self.time_advance_requested.emit(hours)
-            except Exception as e:
-                # En cas d'erreur, arrêter la simulation pour éviter les plantages
-                print(f"Erreur lors de l'avancement temporel: {e}")
-                self._stop_and_reset()
-    
     def _update_simulation_params(self):
-        """Met à jour les paramètres de simulation en temps réel"""
+        """Met à jour l'horloge en temps réel"""
+        self._update_rate_label()
         if self.is_running:
-            # Redémarrer le timer avec le nouveau délai
-            interval_ms = self.speed_spinbox.value()
-            self.simulation_timer.start(interval_ms)
+            self.simulation_started.emit(float(self.acceleration_spinbox.value()),
+                                         float(self.substep_spinbox.value()))
+
+    def update_clock_status(self, statistics, time_hours):
+        """Affiche le temps simulé, l'accélération effective et les images sautées"""
+        if not self.is_running:
+            return
+        self.status_label.setText(
+            f"État: t = {time_hours:.1f} h - accélération effective "
+            f"×{statistics['effective_acceleration']:.0f} - "
+            f"{statistics['frames_skipped']} images sautées")
     
     def reset_status(self):
         """Remet à zéro le statut (compatibilité)"""
         self._stop_and_reset()
-    
-    def closeEvent(self, event):
-        """Nettoyage lors de la fermeture du widget"""
-        if hasattr(self, 'simulation_timer') and self.simulation_timer.isActive():
-            self.simulation_timer.stop()
-        super().closeEvent(event)
-    
-    def __del__(self):
-        """Destructeur pour s'assurer que le timer est arrêté"""
-        try:
-            if hasattr(self, 'simulation_timer') and self.simulation_timer and self.simulation_timer.isActive():
-                self.simulation_timer.stop()
-        except (RuntimeError, AttributeError):
-            # Objet Qt déjà détruit, ignorer l'erreur
-            pass
 
 
 class XenonVisualizationWidget(QWidget):
@@ -333,6 +358,14 @@ class XenonVisualizationWidget(QWidget):
     def update_data(self, data):
         """Met à jour les données du graphique"""
         self.xenon_plot.update_data(data)
+
+    def record(self, data):
+        """Enregistre un point de l'historique sans redessiner"""
+        self.xenon_plot.record(data)
+
+    def redraw(self):
+        """Redessine le graphique à partir de l'historique"""
+        self.xenon_plot.redraw()
         
     def clear_history(self):
         """Efface l'historique"""
@@ -2,4 +2,10 @@
 Model package - Contains the physics models and calculations for the application
 """
 from .reactor_model import ReactorModel
-from .preset_model import PresetManager, PresetData, PresetType, PresetCategory
\ No newline at end of file
+from .preset_model import PresetManager, PresetData, PresetType, PresetCategory
+from .batch_evaluation import evaluate_batch, BATCH_INPUT_DTYPE, BATCH_INPUT_FIELDS, BATCH_OUTPUT_FIELDS
+from .reactivity_coefficients import evaluate_jacobian, reactivity_coefficients, REACTIVITY_COEFFICIENT_UNITS
+from .response_surface import ResponseSurface
+from .depletion import deplete_cycle, boron_letdown
+from .uncertainty import propagate_uncertainty
+from .sensitivity import sobol_indices
@@ -0,0 +1,226 @@
+"""
+Diffusion axiale à deux groupes : forme du flux le long de la hauteur du cœur
+
+Le cœur est représenté par un cylindre de hauteur H discrétisé en mailles
+axiales ; la fuite radiale est prise en compte par le laplacien radial
+(2.405 / R)². Les constantes sont exprimées par absorption dans le combustible
+(Σa,comb = 1), de sorte qu'un cœur homogène redonne exactement le k-effectif du
+modèle à quatre facteurs :
+
+    -D1 φ1'' + (Σr1 + D1 Br²) φ1 = (η ε / k) φ2
+    -D2 φ2'' + (Σa2(z) + D2 Br²) φ2 = p Σr1 φ1
+
+avec Σr1 = 1, Σa2(z) = 1 + A(z) (A : rapports d'absorption non-combustible,
+barres comprises là où elles sont insérées), D1 = L1² et D2 = L2² (1 + A moyen).
+
+Chaque opérateur A1, A2 est tridiagonal symétrique défini positif et factorisé
+une fois par résolution (Cholesky en bande). L'opérateur de fission
+T = ηε p A2⁻¹ A1⁻¹ n'est jamais formé : la valeur propre est obtenue par
+itération inverse décalée (Wielandt), dont chaque pas résout
+
+    (σ I - T) x = s   <=>   x = A1 (σ A2 A1 - ηε p I)⁻¹ A2 s
+
+avec A2 A1 pentadiagonale : chaque pas coûte O(mailles), quelle que soit la
+finesse du maillage. L'itération repart du flux et du k de l'appel précédent ;
+le décalage σ est une borne supérieure de k, ce qui garantit la convergence
+vers le mode fondamental en quelques itérations.
+"""
+import numpy as np
+from scipy.linalg import cholesky_banded, cho_solve_banded, solve_banded
+
+from . import config
+
+
+class AxialDiffusionSolver:
+    """
+    Solveur de valeur propre de la diffusion axiale à deux groupes.
+
+    Les tableaux de travail et de sortie sont alloués une fois à la création ;
+    les tableaux retournés par `solve` sont réutilisés à l'appel suivant.
+    """
+
+    def __init__(self, mesh_points=None):
+        self.mesh_points = config.AXIAL_MESH_POINTS if mesh_points is None else int(mesh_points)
+        if self.mesh_points < 3:
+            raise ValueError("Le maillage axial doit comporter au moins 3 mailles")
+        self.tolerance = config.AXIAL_DIFFUSION_TOLERANCE
+        self.max_iterations = config.AXIAL_DIFFUSION_MAX_ITERATIONS
+
+        n = self.mesh_points
+        self.core_height = config.CORE_HEIGHT_M
+        self.cell_height = self.core_height / n
+        self.radial_buckling = (config.BESSEL_J0_FIRST_ZERO / (config.CORE_DIAMETER_M / 2.0))**2
+
+        # Hauteurs relatives des centres de mailles (0 = bas du cœur, 1 = haut)
+        self.heights = (np.arange(n) + 0.5) / n
+
+        # Tampons réutilisés d'un appel à l'autre
+        self.fast_flux = np.empty(n)
+        self.thermal_flux = np.empty(n)
+        self.relative_flux = np.empty(n)
+        self.thermal_absorption = np.empty(n)
+        self._source = np.empty(n)
+        self._fast_band = np.empty((2, n))
+        self._thermal_band = np.empty((2, n))
+        self._product_band = np.empty((5, n))
+        self._shifted_band = np.empty((5, n))
+
+        self.k_effective = None
+        self.iterations = 0
+        self.reset()
+
+    def reset(self):
+        """Oublie la solution précédente : la prochaine résolution part d'un flux plat."""
+        self.fast_flux.fill(1.0)
+        self.thermal_flux.fill(1.0)
+        self.k_effective = None
+
+    def _factorize(self, band, diffusion, removal):
+        """
+        Assemble (forme bande supérieure, conservée dans `band`) et factorise
+        l'opérateur -D d²/dz² + Σ. Les faces du cœur sont à flux nul, à une
+        demi-maille du centre des mailles de bord.
+        """
+        coupling = diffusion / self.cell_height**2
+        band[0, 0] = 0.0
+        band[0, 1:] = -coupling
+        band[1] = 2.0 * coupling + removal
+        band[1, [0, -1]] += coupling
+        return cholesky_banded(band)
+
+    @staticmethod
+    def _band_product(left, right, out):
+        """
+        Produit de deux matrices tridiagonales symétriques (forme bande supérieure),
+        rangé dans `out` au format (2, 2) de solve_banded : out[2 + i - j, j] = (G D)[i, j].
+        """
+        g, d = left[1], right[1]
+        g_off, d_off = left[0, 1:], right[0, 1:]
+        out.fill(0.0)
+        out[0, 2:] = g_off[:-1] * d_off[1:]
+        out[1, 1:] = g[:-1] * d_off + g_off * d[1:]
+        out[2] = g * d
+        out[2, 1:] += g_off * d_off
+        out[2, :-1] += g_off * d_off
+        out[3, :-1] = g_off * d[:-1] + g[1:] * d_off
+        out[4, :-2] = g_off[1:] * d_off[:-1]
+        return out
+
+    @staticmethod
+    def _band_multiply(band, vector):
+        """Produit d'une matrice tridiagonale symétrique (forme bande supérieure) par un vecteur."""
+        result = band[1] * vector
+        result[:-1] += band[0, 1:] * vector[1:]
+        result[1:] += band[0, 1:] * vector[:-1]
+        return result
+
+    def _rodded_absorption(self, rod_absorption):
+        """Remplit self.thermal_absorption avec la contribution locale des groupes de barres."""
+        absorption = self.thermal_absorption
+        absorption.fill(0.0)
+        for ratio, insertion in rod_absorption:
+            # Les barres entrent par le haut : les mailles au-dessus de la pointe sont barrées,
+            # la maille contenant la pointe l'est au prorata de sa partie insérée
+            tip = (1.0 - insertion) * self.mesh_points
+            rodded = np.clip(np.arange(1, self.mesh_points + 1) - tip, 0.0, 1.0)
+            absorption += ratio * rodded
+        return absorption
+
+    def solve(self, fission_yield, resonance_escape, absorption_ratio, rod_absorption=(),
+              density_ratio=1.0, extra_absorption=None):
+        """
+        Calcule le mode fondamental axial.
+
+        Args:
+            fission_yield: η·ε, neutrons rapides produits par absorption dans le combustible
+            resonance_escape: probabilité p d'échapper aux résonances
+            absorption_ratio: rapport d'absorption non-combustible uniforme (hors barres)
+            rod_absorption: couples (rapport d'absorption du groupe entièrement inséré,
+                fraction insérée depuis le haut), un par groupe de barres
+            density_ratio: rapport de densité du modérateur (aires de diffusion en d²)
+            extra_absorption: rapport d'absorption supplémentaire par maille (optionnel)
+
+        Returns:
+            dict: "heights", "flux" (flux thermique relatif, maximum à 1),
+                "fast_flux", "thermal_flux", "k_effective", "axial_offset"
+                et "iterations". Les tableaux sont les tampons du solveur.
+        """
+        absorption = self._rodded_absorption(rod_absorption)
+        absorption += absorption_ratio
+        if extra_absorption is not None:
+            absorption += extra_absorption
+        mean_absorption = absorption.mean()
+        absorption += 1.0  # absorption dans le combustible
+
+        fast_diffusion = config.FAST_DIFFUSION_AREA_M2 * density_ratio**2
+        thermal_diffusion = config.THERMAL_DIFFUSION_AREA_M2 * density_ratio**2 * (1.0 + mean_absorption)
+        fast_factor = self._factorize(self._fast_band, fast_diffusion,
+                                      1.0 + fast_diffusion * self.radial_buckling)
+        thermal_factor = self._factorize(self._thermal_band, thermal_diffusion,
+                                         absorption + thermal_diffusion * self.radial_buckling)
+
+        # Opérateur de fission T = ηε p A2⁻¹ A1⁻¹ (source -> source de la génération
+        # suivante), à coefficients positifs, les A étant des M-matrices ; seul le produit
+        # pentadiagonal A2 A1 est formé
+        fission_gain = fission_yield * resonance_escape
+        product = self._band_product(self._thermal_band, self._fast_band, self._product_band)
+        shifted = self._shifted_band
+
+        def fission_operator(vector):
+            vector = cho_solve_banded((fast_factor, False), vector, check_finite=False)
+            vector = cho_solve_banded((thermal_factor, False), vector, check_finite=False, overwrite_b=True)
+            vector *= fission_gain
+            return vector
+
+        # Itération inverse décalée (Wielandt) à partir de la solution précédente. Pour une
+        # source positive s, min(Ts/s) <= k <= max(Ts/s) (Collatz-Wielandt) : le décalage pris
+        # sur la borne haute reste au-dessus du mode fondamental, vers lequel l'itération converge
+        k = self.k_effective if self.k_effective is not None else 1.0
+        source = self._source
+        np.multiply(self.thermal_flux, fission_yield, out=source)
+        source /= source.sum()
+
+        self.iterations = 0
+        while self.iterations < self.max_iterations:
+            self.iterations += 1
+            generation = fission_operator(source)
+            k_new = generation.sum()
+            shift = np.max(generation / source) * (1.0 + self.tolerance)
+            previous_source = source.copy()
+            # (σ I - T)⁻¹ s = A1 (σ A2 A1 - ηε p I)⁻¹ A2 s : une factorisation en bande O(mailles)
+            np.multiply(product, shift, out=shifted)
+            shifted[2] -= fission_gain
+            source[:] = self._band_multiply(
+                self._fast_band,
+                solve_banded((2, 2), shifted, self._band_multiply(self._thermal_band, source),
+                             overwrite_ab=True, overwrite_b=True, check_finite=False))
+            source /= source.sum()
+            change = np.max(np.abs(source - previous_source)) * self.mesh_points
+
+            converged = abs(k_new - k) < self.tolerance and change < self.tolerance
+            k = k_new
+            if converged:
+                break
+        self.k_effective = k
+
+        # Flux des deux groupes ; normalisation : source de fission totale égale à la longueur du maillage
+        fast_flux, thermal_flux = self.fast_flux, self.thermal_flux
+        fast_flux[:] = cho_solve_banded((fast_factor, False), source / k, check_finite=False)
+        thermal_flux[:] = cho_solve_banded((thermal_factor, False), resonance_escape * fast_flux,
+                                           check_finite=False)
+        scale = self.mesh_points / (fission_yield * thermal_flux.sum())
+        fast_flux *= scale
+        thermal_flux *= scale
+
+        np.divide(thermal_flux, thermal_flux.max(), out=self.relative_flux)
+        half = self.mesh_points // 2
+        top, bottom = thermal_flux[half:].sum(), thermal_flux[:half].sum()
+        return {
+            "heights": self.heights,
+            "flux": self.relative_flux,
+            "fast_flux": fast_flux,
+            "thermal_flux": thermal_flux,
+            "k_effective": k,
+            "axial_offset": (top - bottom) / (top + bottom),
+            "iterations": self.iterations,
+        }
@@ -0,0 +1,94 @@
+"""
+Modèle nodal axial de l'Iode-135 et du Xénon-135
+
+Les concentrations sont portées par maille axiale (mêmes mailles que le
+solveur de diffusion axiale). Le couplage avec la forme du flux est explicite
+par sous-pas : la distribution de puissance est recalculée avec le xénon de
+chaque maille, puis chaque maille est avancée avec la solution exacte de la
+chaîne I/Xe (`advance_iodine_xenon`, vectorisée sur toutes les mailles).
+C'est ce couplage qui produit les oscillations axiales du xénon.
+
+Les fonctions retournent de nouveaux tableaux plutôt que de modifier ceux
+reçus, de sorte qu'un instantané de l'état ne voit jamais ses concentrations
+changer après coup.
+"""
+import math
+
+import numpy as np
+
+from . import config
+from .xenon_solver import advance_iodine_xenon, equilibrium_iodine_xenon
+
+
+def xenon_absorption_ratios(xenon, eta):
+    """
+    Rapport d'absorption du xénon par maille, comme `ReactorModel._calculate_f_xenon_absorption`.
+
+    Args:
+        xenon: concentrations de Xe-135 par maille (atomes/cm³)
+        eta: facteur de reproduction (uniforme)
+    """
+    derived = config.DERIVED
+    if eta <= 1e-9:
+        return np.zeros_like(xenon)
+    return xenon * (derived.xenon_microscopic_absorption_cm2 * eta / derived.fuel_absorption_times_eta)
+
+
+def local_power_levels(power_level, thermal_flux):
+    """Niveau de puissance (%) de chaque maille : puissance moyenne répartie selon le flux thermique."""
+    mean_flux = thermal_flux.mean()
+    if mean_flux <= 0.0:
+        return np.zeros_like(thermal_flux)
+    return power_level * thermal_flux / mean_flux
+
+
+def axial_offset(values):
+    """Déséquilibre axial (haut - bas) / (haut + bas) d'une distribution par maille."""
+    half = len(values) // 2
+    top, bottom = float(np.sum(values[half:])), float(np.sum(values[:half]))
+    total = top + bottom
+    return (top - bottom) / total if total > 0.0 else 0.0
+
+
+def equilibrium_axial_xenon(solve_flux, power_level, iterations=None):
+    """
+    Distribution d'équilibre auto-cohérente : le xénon d'équilibre de chaque
+    maille dépend de la puissance locale, qui dépend elle-même du xénon.
+
+    Args:
+        solve_flux: fonction (xénon par maille) -> résultat de AxialDiffusionSolver.solve
+        power_level: niveau de puissance moyen (%)
+        iterations: nombre d'itérations de point fixe (config par défaut)
+
+    Returns:
+        tuple: (iode, xénon) par maille
+    """
+    iterations = config.AXIAL_XENON_EQUILIBRIUM_ITERATIONS if iterations is None else iterations
+    xenon = None  # premier calcul du flux avec le xénon uniforme du modèle ponctuel
+    for _ in range(max(int(iterations), 1)):
+        thermal_flux = solve_flux(xenon)["thermal_flux"]
+        iodine, xenon = equilibrium_iodine_xenon(local_power_levels(power_level, thermal_flux))
+    return iodine, xenon
+
+
+def advance_axial_xenon(solve_flux, iodine, xenon, power_level, duration, time_step=None):
+    """
+    Avance les concentrations nodales sur une durée, à puissance moyenne constante.
+
+    Args:
+        solve_flux: fonction (xénon par maille) -> résultat de AxialDiffusionSolver.solve
+        iodine, xenon: concentrations par maille au début de l'intervalle
+        power_level: niveau de puissance moyen (%)
+        duration: durée à simuler (secondes)
+        time_step: sous-pas de recalcul du flux (AXIAL_XENON_TIME_STEP par défaut)
+
+    Returns:
+        tuple: (iode, xénon) par maille à la fin de l'intervalle
+    """
+    time_step = config.AXIAL_XENON_TIME_STEP if time_step is None else time_step
+    substeps = max(math.ceil(duration / time_step), 1)
+    dt = duration / substeps
+    for _ in range(substeps):
+        local_power = local_power_levels(power_level, solve_flux(xenon)["thermal_flux"])
+        iodine, xenon = advance_iodine_xenon(iodine, xenon, local_power, dt)
+    return iodine, xenon
@@ -0,0 +1,198 @@
+"""
+Évaluation vectorisée et sans état du modèle des six facteurs
+
+`evaluate_batch` reproduit les calculs de `ReactorModel.calculate_all` sur des
+tableaux NumPy : chaque entrée peut être un scalaire ou un tableau, et toutes
+les entrées sont combinées par diffusion (broadcasting). Cela permet de balayer
+des millions d'états sans créer ni modifier d'objet `ReactorModel`.
+
+Les coefficients de calibration de config.json peuvent aussi être remplacés
+par des tableaux (`coefficients`), diffusés avec les entrées : un même appel
+évalue alors un échantillon de jeux de coefficients.
+"""
+import numpy as np
+from . import config
+from .xenon_solver import equilibrium_iodine_xenon, xenon_absorption_cm2
+
+# Entrées du modèle, dans l'ordre des champs du tableau structuré
+BATCH_INPUT_FIELDS = (
+    "rod_group_R_position",
+    "rod_group_GCP_position",
+    "boron_concentration",
+    "average_temperature",
+    "power_level",
+    "fuel_enrichment",
+    "xenon_concentration",
+)
+
+# Type NumPy pour passer un lot d'états sous forme de tableau structuré
+BATCH_INPUT_DTYPE = np.dtype([(name, np.float64) for name in BATCH_INPUT_FIELDS])
+
+# Sorties produites par evaluate_batch
+BATCH_OUTPUT_FIELDS = (
+    "fuel_temperature",
+    "eta",
+    "epsilon",
+    "p",
+    "f",
+    "fast_non_leakage_prob",
+    "thermal_non_leakage_prob",
+    "k_infinite",
+    "k_effective",
+    "reactivity",
+    "doubling_time",
+)
+
+
+def _resolve_coefficients(coefficients):
+    """Valide les coefficients remplacés et les convertit en tableaux (None si aucun)."""
+    if not coefficients:
+        return None
+    unknown = set(coefficients) - set(config.OVERRIDABLE_COEFFICIENTS)
+    if unknown:
+        raise ValueError(f"Coefficients non remplaçables : {sorted(unknown)} "
+                         f"(valeurs possibles : {', '.join(config.OVERRIDABLE_COEFFICIENTS)})")
+    return {name: np.asarray(value, dtype=float) for name, value in coefficients.items()}
+
+
+def _resolve_inputs(states, inputs, coefficients=None):
+    """
+    Fusionne le tableau structuré éventuel, les arguments nommés et l'état par défaut.
+
+    Le xénon absent est pris à l'équilibre pour le niveau de puissance demandé
+    (et les coefficients éventuellement remplacés), comme à l'initialisation de
+    `ReactorModel`.
+    """
+    unknown = set(inputs) - set(BATCH_INPUT_FIELDS)
+    if unknown:
+        raise ValueError(f"Entrées inconnues pour evaluate_batch : {sorted(unknown)}")
+
+    values = {}
+    if states is not None:
+        states = np.asarray(states)
+        if states.dtype.names is None:
+            raise ValueError("'states' doit être un tableau structuré (voir BATCH_INPUT_DTYPE)")
+        for name in states.dtype.names:
+            if name not in BATCH_INPUT_FIELDS:
+                raise ValueError(f"Champ inconnu dans le tableau structuré : {name}")
+            values[name] = states[name]
+
+    for name, value in inputs.items():
+        if value is not None:
+            values[name] = value
+
+    defaults = config.default_state
+    for name in BATCH_INPUT_FIELDS:
+        if name not in values and name != "xenon_concentration":
+            values[name] = defaults[name]
+
+    values = {name: np.asarray(value, dtype=float) for name, value in values.items()}
+    if "xenon_concentration" not in values:
+        values["xenon_concentration"] = equilibrium_iodine_xenon(values["power_level"], coefficients)[1]
+    return values
+
+
+def _doubling_time(reactivity):
+    """Version vectorisée de `ReactorModel.calculate_doubling_time`."""
+    beta = config.DELAYED_NEUTRON_FRACTION
+    with np.errstate(divide='ignore', invalid='ignore'):
+        delayed_period = beta / (reactivity * config.EFFECTIVE_DECAY_CONSTANT)
+        prompt_period = config.PROMPT_NEUTRON_LIFETIME / (reactivity - beta)
+
+    doubling_time = np.full(reactivity.shape, np.inf)
+    delayed = (reactivity > 0) & (reactivity < beta)
+    prompt = reactivity > beta
+    doubling_time[delayed] = delayed_period[delayed] * config.DERIVED.ln2
+    doubling_time[prompt] = prompt_period[prompt] * config.DERIVED.ln2
+    doubling_time[reactivity == beta] = 0.0
+    return doubling_time
+
+
+def evaluate_batch(states=None, coefficients=None, **inputs):
+    """
+    Évalue les facteurs neutroniques, k-effectif, la réactivité et le temps de doublement
+    pour un lot d'états.
+
+    Args:
+        states: tableau structuré optionnel de type BATCH_INPUT_DTYPE (ou sous-ensemble de ses champs)
+        **inputs: entrées nommées (voir BATCH_INPUT_FIELDS), scalaires ou tableaux ;
+            elles remplacent les champs de même nom de `states`. Les entrées absentes
+            prennent la valeur de `default_state`, le xénon étant pris à l'équilibre.
+        coefficients: dictionnaire optionnel remplaçant des coefficients de calibration
+            (voir config.OVERRIDABLE_COEFFICIENTS) par des scalaires ou des tableaux
+
+    Returns:
+        dict: tableaux NumPy (forme diffusée des entrées) pour chaque nom de BATCH_OUTPUT_FIELDS
+    """
+    c = _resolve_coefficients(coefficients)
+    v = _resolve_inputs(states, inputs, c)
+    derived = config.DERIVED
+    shape = np.broadcast_shapes(*(value.shape for value in v.values()),
+                                *(value.shape for value in (c or {}).values()))
+
+    def coefficient(name):
+        return config.get_coefficient(name, c)
+
+    average_temperature = v["average_temperature"]
+    fuel_temperature = average_temperature + v["power_level"] * coefficient("POWER_TO_FUEL_TEMP_COEFF")
+
+    # η - facteur de reproduction
+    eta = (coefficient("ETA_BASE") +
+           coefficient("ETA_ENRICHMENT_COEFF") * (v["fuel_enrichment"] - config.ETA_ENRICHMENT_REF) /
+           config.ETA_ENRICHMENT_SCALE)
+
+    # ε - facteur de fission rapide
+    epsilon = np.broadcast_to(coefficient("EPSILON"), shape)
+
+    # p - effet Doppler et effet de la température du modérateur
+    sqrt_T_diff = np.sqrt(fuel_temperature + config.CELSIUS_TO_KELVIN) - derived.sqrt_p_ref_temp_k
+    doppler_effect = np.exp(-coefficient("P_DOPPLER_COEFF") * sqrt_T_diff)
+    moderator_effect = 1.0 - coefficient("P_MOD_TEMP_COEFF") * (average_temperature - config.P_REF_MOD_TEMP_C)
+    p = coefficient("P_BASE") * doppler_effect * moderator_effect
+
+    # f - rapports d'absorption non-combustible
+    base_abs_ratio = coefficient("F_BASE_ABS_RATIO") * (
+        1 + coefficient("F_MOD_TEMP_ABS_COEFF") * (average_temperature - config.F_REF_MOD_TEMP_C))
+
+    total_worth_fraction = ((100 - v["rod_group_R_position"]) / 100 * derived.rod_worth_R +
+                            (100 - v["rod_group_GCP_position"]) / 100 * derived.rod_worth_GCP)
+    rod_abs_ratio = coefficient("F_CONTROL_ROD_WORTH") * total_worth_fraction
+
+    boron_abs_ratio = coefficient("F_BORON_WORTH_PER_PPM") * v["boron_concentration"]
+
+    sigma_a_xenon = v["xenon_concentration"] * xenon_absorption_cm2(c)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sigma_a_fuel_nominal = np.where(eta > 1e-9, derived.fuel_absorption_times_eta / eta, 1.0)
+        xenon_abs_ratio = np.where(sigma_a_fuel_nominal > 1e-9, sigma_a_xenon / sigma_a_fuel_nominal, 0.0)
+
+    f = 1.0 / (1.0 + base_abs_ratio + rod_abs_ratio + boron_abs_ratio + xenon_abs_ratio)
+
+    # Fuites - théorie de la diffusion à deux groupes
+    geometric_buckling = derived.geometric_buckling
+    density_ratio = 1.0 / (1.0 - coefficient("MODERATOR_DENSITY_COEFF") *
+                           (average_temperature - config.F_REF_MOD_TEMP_C))
+    fast_non_leakage_prob = 1.0 / (1.0 + geometric_buckling * coefficient("FAST_DIFFUSION_AREA_M2") * density_ratio**2)
+    thermal_non_leakage_prob = 1.0 / (1.0 + geometric_buckling * coefficient("THERMAL_DIFFUSION_AREA_M2") *
+                                      density_ratio**2)
+
+    k_infinite = eta * epsilon * p * f
+    k_effective = k_infinite * fast_non_leakage_prob * thermal_non_leakage_prob
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        reactivity = np.where(k_effective > 0, (k_effective - 1.0) / k_effective, -np.inf)
+
+    results = {
+        "fuel_temperature": fuel_temperature,
+        "eta": eta,
+        "epsilon": epsilon,
+        "p": p,
+        "f": f,
+        "fast_non_leakage_prob": fast_non_leakage_prob,
+        "thermal_non_leakage_prob": thermal_non_leakage_prob,
+        "k_infinite": k_infinite,
+        "k_effective": k_effective,
+        "reactivity": reactivity,
+    }
+    results = {name: np.broadcast_to(value, shape).copy() for name, value in results.items()}
+    results["doubling_time"] = _doubling_time(results["reactivity"])
+    return results
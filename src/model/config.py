@@ -5,8 +5,13 @@ This module loads the reactor's physical and operational parameters
 from the 'config.json' file located in the project's root directory.
 """
 
+import hashlib
+import importlib
 import json
+import math
 import os
+import sys
+from dataclasses import dataclass
 from pathlib import Path
 
 def _load_config():
@@ -85,7 +90,6 @@ try:
     THERMAL_DIFFUSION_AREA_M2 = _leakage["THERMAL_DIFFUSION_AREA_M2"]
     FAST_DIFFUSION_AREA_M2 = _leakage["FAST_DIFFUSION_AREA_M2"]
     MODERATOR_DENSITY_COEFF = _leakage["MODERATOR_DENSITY_COEFF"]
-    CONTROL_ROD_EFFECT_COEFF = _leakage["CONTROL_ROD_EFFECT_COEFF"]
 
     # Thermo-hydraulique
     _thermo = _config["thermal_hydraulics"]
@@ -97,14 +101,122 @@ try:
 
     # Dynamique Xénon-135
     _xenon = _config["xenon_dynamics"]
-    IODINE_YIELD = _xenon["IODINE_YIELD"]
-    XENON_YIELD_DIRECT = _xenon["XENON_YIELD_DIRECT"]
-    IODINE_DECAY_CONSTANT = _xenon["IODINE_DECAY_CONSTANT"]  # s^-1
-    XENON_DECAY_CONSTANT = _xenon["XENON_DECAY_CONSTANT"]    # s^-1
-    XENON_ABSORPTION_CROSS_SECTION = _xenon["XENON_ABSORPTION_CROSS_SECTION"]  # barns
     THERMAL_FLUX_NOMINAL = _xenon["THERMAL_FLUX_NOMINAL"]     # n/cm²/s
     FISSION_RATE_COEFF = _xenon["FISSION_RATE_COEFF"]
     XENON_REACTIVITY_CONVERSION_FACTOR = _xenon["XENON_REACTIVITY_CONVERSION_FACTOR"]
+    XENON_INTEGRATOR = _xenon["INTEGRATOR"]  # "exact" (exponentielle de matrice) ou "rk4"
+
+    # Chaînes de poisons produits de fission (I-135/Xe-135, Pm-149/Sm-149, ...)
+    _poison_chains = _config["poison_chains"]
+    POISON_NUCLIDES = _poison_chains["NUCLIDES"]  # rendement, λ (s⁻¹), σa (barns), produit de décroissance
+    POISON_IODINE = _poison_chains["IODINE"]
+    POISON_XENON = _poison_chains["XENON"]
+    IODINE_YIELD = POISON_NUCLIDES[POISON_IODINE]["FISSION_YIELD"]
+    XENON_YIELD_DIRECT = POISON_NUCLIDES[POISON_XENON]["FISSION_YIELD"]
+    IODINE_DECAY_CONSTANT = POISON_NUCLIDES[POISON_IODINE]["DECAY_CONSTANT"]  # s^-1
+    XENON_DECAY_CONSTANT = POISON_NUCLIDES[POISON_XENON]["DECAY_CONSTANT"]    # s^-1
+    XENON_ABSORPTION_CROSS_SECTION = POISON_NUCLIDES[POISON_XENON]["ABSORPTION_BARNS"]  # barns
+
+    # Cinétique ponctuelle à six groupes (abondances relatives et constantes λi en s^-1)
+    _kinetics = _config["point_kinetics"]
+    KINETICS_GROUP_FRACTIONS = _kinetics["GROUP_FRACTIONS"]
+    KINETICS_GROUP_DECAY_CONSTANTS = _kinetics["GROUP_DECAY_CONSTANTS"]
+    KINETICS_TIME_STEP = _kinetics["TIME_STEP"]  # s
+    KINETICS_PROPAGATOR_CACHE_SIZE = _kinetics["PROPAGATOR_CACHE_SIZE"]
+
+    # Recherche de criticité (bore / position critique des barres)
+    _criticality_search = _config["criticality_search"]
+    CRITICALITY_SEARCH_TOLERANCE = _criticality_search["TOLERANCE_K"]
+    CRITICALITY_SEARCH_MAX_ITERATIONS = _criticality_search["MAX_ITERATIONS"]
+
+    # Diffusion axiale à deux groupes (forme axiale du flux)
+    _axial_diffusion = _config["axial_diffusion"]
+    AXIAL_MESH_POINTS = _axial_diffusion["MESH_POINTS"]
+    AXIAL_DIFFUSION_TOLERANCE = _axial_diffusion["TOLERANCE"]
+    AXIAL_DIFFUSION_MAX_ITERATIONS = _axial_diffusion["MAX_ITERATIONS"]
+
+    # Diffusion à deux groupes en géométrie r-z
+    _rz_diffusion = _config["rz_diffusion"]
+    RZ_RADIAL_MESH_POINTS = _rz_diffusion["RADIAL_MESH_POINTS"]
+    RZ_AXIAL_MESH_POINTS = _rz_diffusion["AXIAL_MESH_POINTS"]
+    RZ_DIFFUSION_TOLERANCE = _rz_diffusion["TOLERANCE"]
+    RZ_ROD_RADIAL_ZONES = _rz_diffusion["ROD_RADIAL_ZONES"]  # rayons relatifs [intérieur, extérieur[
+
+    # Modèle nodal axial I-135 / Xe-135 (oscillations axiales du xénon)
+    _axial_xenon = _config["axial_xenon"]
+    AXIAL_XENON_ENABLED = _axial_xenon["ENABLED"]
+    AXIAL_XENON_TIME_STEP = _axial_xenon["TIME_STEP"]  # s, sous-pas de recalcul du flux
+    AXIAL_XENON_EQUILIBRIUM_ITERATIONS = _axial_xenon["EQUILIBRIUM_ITERATIONS"]
+
+    # Évolution du combustible (chaîne réduite de noyaux lourds, courbe de dilution du bore)
+    _depletion = _config["depletion"]
+    DEPLETION_NUCLIDES = _depletion["NUCLIDES"]  # sections efficaces à un groupe (barns), ν, λ (s⁻¹)
+    DEPLETION_FISSION_PRODUCT = _depletion["FISSION_PRODUCT"]
+    DEPLETION_HEAVY_METAL_MOLAR_MASS = _depletion["HEAVY_METAL_MOLAR_MASS"]  # g/mol
+    DEPLETION_AVOGADRO = _depletion["AVOGADRO"]
+    DEPLETION_ENERGY_PER_FISSION_J = _depletion["ENERGY_PER_FISSION_J"]
+    DEPLETION_SPECIFIC_POWER = _depletion["SPECIFIC_POWER_W_PER_G"]  # W par g de métal lourd
+    DEPLETION_CYCLE_LENGTH_DAYS = _depletion["CYCLE_LENGTH_DAYS"]
+    DEPLETION_TIME_STEP_DAYS = _depletion["TIME_STEP_DAYS"]
+    DEPLETION_BATCHES = _depletion["BATCHES"]
+    DEPLETION_ETA_FEEDBACK_FRACTION = _depletion["ETA_FEEDBACK_FRACTION"]
+
+    # Propagation d'incertitudes Monte-Carlo sur les coefficients de calibration
+    _uncertainty = _config["uncertainty"]
+    UNCERTAINTY_SAMPLES = _uncertainty["SAMPLES"]
+    UNCERTAINTY_CHUNK_SIZE = _uncertainty["CHUNK_SIZE"]  # échantillons par tâche du pool de processus
+    UNCERTAINTY_WORKERS = _uncertainty["WORKERS"]  # 0 : un processus par cœur, 1 : sans pool
+    UNCERTAINTY_SEED = _uncertainty["SEED"]
+    UNCERTAINTY_PERCENTILES = _uncertainty["PERCENTILES"]
+    UNCERTAINTY_XENON_TRAJECTORY_HOURS = _uncertainty["XENON_TRAJECTORY_HOURS"]
+    UNCERTAINTY_XENON_TRAJECTORY_POINTS = _uncertainty["XENON_TRAJECTORY_POINTS"]
+    UNCERTAINTY_XENON_TRAJECTORY_POWER_LEVEL = _uncertainty["XENON_TRAJECTORY_POWER_LEVEL"]  # %
+    UNCERTAINTY_DISTRIBUTIONS = _uncertainty["DISTRIBUTIONS"]
+
+    # Analyse de sensibilité globale (indices de Sobol, plan de Saltelli)
+    _sensitivity = _config["sensitivity"]
+    SENSITIVITY_BASE_SAMPLES = _sensitivity["BASE_SAMPLES"]  # puissance de 2 (suite de Sobol)
+    SENSITIVITY_WORKERS = _sensitivity["WORKERS"]  # 0 : un processus par cœur, 1 : sans pool
+    SENSITIVITY_SEED = _sensitivity["SEED"]
+    SENSITIVITY_DIRECTORY = _sensitivity["DIRECTORY"]  # plans d'échantillonnage, relatif à la racine du projet
+    SENSITIVITY_OPERATING_INPUTS = _sensitivity["OPERATING_INPUTS"]  # entrée du modèle -> plage de parameters_config
+    SENSITIVITY_COEFFICIENTS = _sensitivity["COEFFICIENTS"]  # lois prises dans uncertainty.DISTRIBUTIONS
+    SENSITIVITY_OUTPUTS = _sensitivity["OUTPUTS"]
+
+    # Scénarios sans interface graphique (python -m src.cli)
+    _scenario = _config["scenario"]
+    SCENARIO_RECORD_INTERVAL_HOURS = _scenario["RECORD_INTERVAL_HOURS"]
+    SCENARIO_RAMP_STEP_HOURS = _scenario["RAMP_STEP_HOURS"]  # paliers des rampes linéaires
+    SCENARIO_RECORDED_QUANTITIES = _scenario["RECORDED_QUANTITIES"]
+    SCENARIO_WORKERS = _scenario["WORKERS"]  # 0 : un processus par cœur, 1 : sans pool
+    SCENARIO_OUTPUT_FORMAT = _scenario["OUTPUT_FORMAT"]  # "csv" ou "npz"
+
+    # Horloge de simulation de l'interface (lecture accélérée du transitoire xénon)
+    _simulation_clock = _config["simulation_clock"]
+    SIMULATION_CLOCK_ACCELERATION = _simulation_clock["ACCELERATION"]  # secondes simulées par seconde
+    SIMULATION_CLOCK_MAX_ACCELERATION = _simulation_clock["MAX_ACCELERATION"]
+    SIMULATION_CLOCK_SUBSTEP_MINUTES = _simulation_clock["SUBSTEP_MINUTES"]  # résolution physique
+    SIMULATION_CLOCK_MAX_SUBSTEP_MINUTES = _simulation_clock["MAX_SUBSTEP_MINUTES"]
+
+    # Historiques des graphiques temporels (tampon circulaire, réduction pour l'affichage)
+    _history_buffer = _config["history_buffer"]
+    HISTORY_BUFFER_CAPACITY = _history_buffer["CAPACITY"]  # échantillons conservés
+    HISTORY_BUFFER_DISPLAY_BUCKETS = _history_buffer["DISPLAY_BUCKETS"]  # paquets min/max tracés
+
+    # Cache des évaluations quantifiées
+    _evaluation_cache = _config["evaluation_cache"]
+    EVALUATION_CACHE_ENABLED = _evaluation_cache["ENABLED"]
+    EVALUATION_CACHE_MAX_SIZE = _evaluation_cache["MAX_SIZE"]
+    EVALUATION_CACHE_EVICTION_POLICY = _evaluation_cache["EVICTION_POLICY"]
+    EVALUATION_CACHE_QUANTIZATION = _evaluation_cache["QUANTIZATION"]
+
+    # Table de réponse précalculée (projetée en mémoire)
+    _response_surface = _config["response_surface"]
+    RESPONSE_SURFACE_ENABLED = _response_surface["ENABLED"]
+    RESPONSE_SURFACE_DIRECTORY = _response_surface["DIRECTORY"]  # relatif à la racine du projet
+    RESPONSE_SURFACE_GRID_POINTS = _response_surface["GRID_POINTS"]
+    RESPONSE_SURFACE_XENON_RANGE = _response_surface["XENON_RANGE"]  # atomes/cm³
+    RESPONSE_SURFACE_ERROR_SAMPLES = _response_surface["ERROR_SAMPLES"]
 
     # Configuration de l'interface et des paramètres
     gui_settings = _config["gui_settings"]
@@ -120,4 +232,122 @@ except KeyError as e:
     raise KeyError(
         f"Clé de configuration manquante ou incorrecte dans config.json : {e}. "
         "Assurez-vous que la structure du fichier est complète et valide."
-    ) 
\ No newline at end of file
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class DerivedConstants:
+    """
+    Constantes dérivées de config.json, calculées une seule fois au chargement.
+    
+    Les méthodes de calcul intensif lisent ces attributs plats au lieu de
+    recombiner les coefficients (ou de parcourir les dictionnaires imbriqués)
+    à chaque appel. L'objet est figé : toute modification de la configuration
+    passe par reload_config(), qui reconstruit une nouvelle instance.
+    """
+    config_hash: str
+
+    # Fuites : laplacien géométrique du cylindre B² (m⁻²)
+    geometric_buckling: float
+
+    # Effet Doppler : racine de la température de référence (K^1/2)
+    sqrt_p_ref_temp_k: float
+
+    # Xénon
+    xenon_microscopic_absorption_cm2: float   # σXe (cm²)
+    fuel_absorption_times_eta: float          # Σa_fuel * η = ν * Σf nominal
+    xenon_reactivity_pcm_per_atom: float      # pcm par atome/cm³ de Xe-135
+    fission_rate_per_percent: float           # Σf * Φ par % de puissance
+    thermal_flux_per_percent: float           # Φ (n/cm²/s) par % de puissance
+
+    # Barres de contrôle
+    rod_worth_R: float
+    rod_worth_GCP: float
+
+    # Temps de doublement
+    ln2: float
+
+
+def compile_derived_constants(cfg):
+    """
+    Construit les constantes dérivées à partir d'un dictionnaire de configuration
+    ayant la structure de config.json.
+    """
+    phys = cfg["physical_constants"]
+    units = cfg["unit_conversions"]
+    leakage = cfg["neutron_leakage"]
+    xenon = cfg["xenon_dynamics"]
+    params = cfg["parameters_config"]
+
+    radius = leakage["CORE_DIAMETER_M"] / 2.0
+    chains = cfg["poison_chains"]
+    sigma_xenon_cm2 = chains["NUCLIDES"][chains["XENON"]]["ABSORPTION_BARNS"] * units["BARNS_TO_CM2"]
+    sigma_f_nominal = xenon["FISSION_RATE_COEFF"] * 100.0  # Σf à 100 % de puissance
+
+    return DerivedConstants(
+        config_hash=hashlib.sha256(json.dumps(cfg, sort_keys=True).encode('utf-8')).hexdigest(),
+        geometric_buckling=(math.pi / leakage["CORE_HEIGHT_M"])**2 + (phys["BESSEL_J0_FIRST_ZERO"] / radius)**2,
+        sqrt_p_ref_temp_k=math.sqrt(cfg["four_factors"]["p"]["REF_TEMP_K"]),
+        xenon_microscopic_absorption_cm2=sigma_xenon_cm2,
+        fuel_absorption_times_eta=sigma_f_nominal * phys["NEUTRONS_PER_THERMAL_FISSION_U235"],
+        xenon_reactivity_pcm_per_atom=(sigma_xenon_cm2 * xenon["THERMAL_FLUX_NOMINAL"] *
+                                       xenon["XENON_REACTIVITY_CONVERSION_FACTOR"]),
+        fission_rate_per_percent=xenon["FISSION_RATE_COEFF"] * xenon["THERMAL_FLUX_NOMINAL"],
+        thermal_flux_per_percent=xenon["THERMAL_FLUX_NOMINAL"] / units["PERCENT_TO_FRACTION"],
+        rod_worth_R=params["rod_group_R"]["worth_fraction"],
+        rod_worth_GCP=params["rod_group_GCP"]["worth_fraction"],
+        ln2=math.log(2),
+    )
+
+
+try:
+    DERIVED = compile_derived_constants(_config)
+except KeyError as e:
+    raise KeyError(
+        f"Clé de configuration manquante pour les constantes dérivées : {e}. "
+        "Assurez-vous que la structure du fichier est complète et valide."
+    )
+
+
+# Coefficients de calibration pouvant être remplacés, échantillon par échantillon,
+# dans les calculs vectorisés (propagation d'incertitudes, analyses de sensibilité)
+OVERRIDABLE_COEFFICIENTS = (
+    # four_factors
+    "ETA_BASE", "ETA_ENRICHMENT_COEFF", "EPSILON", "P_BASE", "P_DOPPLER_COEFF", "P_MOD_TEMP_COEFF",
+    "F_BASE_ABS_RATIO", "F_MOD_TEMP_ABS_COEFF", "F_CONTROL_ROD_WORTH", "F_BORON_WORTH_PER_PPM",
+    # neutron_leakage
+    "THERMAL_DIFFUSION_AREA_M2", "FAST_DIFFUSION_AREA_M2", "MODERATOR_DENSITY_COEFF",
+    # thermal_hydraulics
+    "POWER_TO_FUEL_TEMP_COEFF",
+    # xenon_dynamics et chaîne I-135/Xe-135 de poison_chains
+    "IODINE_YIELD", "XENON_YIELD_DIRECT", "IODINE_DECAY_CONSTANT", "XENON_DECAY_CONSTANT",
+    "XENON_ABSORPTION_CROSS_SECTION", "XENON_REACTIVITY_CONVERSION_FACTOR",
+)
+
+
+def get_coefficient(name, overrides=None):
+    """
+    Valeur d'un coefficient de calibration, éventuellement remplacée.
+
+    Args:
+        name: nom de la constante du module (voir OVERRIDABLE_COEFFICIENTS)
+        overrides: dictionnaire optionnel nom -> valeur (scalaire ou tableau)
+    """
+    if overrides is not None and name in overrides:
+        return overrides[name]
+    return globals()[name]
+
+
+def reload_config():
+    """
+    Relit config.json et reconstruit toutes les constantes du module, y compris DERIVED.
+    
+    Les modules qui accèdent aux constantes via `config.NOM` voient immédiatement
+    les nouvelles valeurs ; l'ancienne instance de DerivedConstants est invalidée.
+    
+    Returns:
+        DerivedConstants: les nouvelles constantes dérivées
+    """
+    module = importlib.reload(sys.modules[__name__])
+    return module.DERIVED
+
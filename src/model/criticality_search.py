@@ -0,0 +1,142 @@
+"""
+Recherche de criticité : bore critique et position critique des groupes de barres
+
+Résout, pour un lot d'états, la valeur du bore ou de la position d'un groupe de
+barres qui donne un k-effectif (ou une réactivité) cible. La méthode est un
+Newton encadré : chaque itération utilise la dérivée analytique de k-effectif
+par rapport au paramètre recherché et retombe sur une bissection dès que le pas
+de Newton sort de l'intervalle d'encadrement. Toutes les itérations sont
+vectorisées avec `evaluate_batch`.
+"""
+import numpy as np
+from . import config
+from .batch_evaluation import evaluate_batch, _resolve_inputs
+
+# Paramètres recherchables -> entrée de parameters_config donnant la plage admissible
+SEARCH_PARAMETERS = {
+    "boron_concentration": "boron",
+    "rod_group_R_position": "rod_group_R",
+    "rod_group_GCP_position": "rod_group_GCP",
+}
+
+
+def _absorption_ratio_derivative(parameter):
+    """
+    Dérivée du rapport d'absorption non-combustible A par rapport au paramètre.
+    Le paramètre n'intervient dans k-effectif qu'à travers f = 1 / (1 + A).
+    """
+    derived = config.DERIVED
+    if parameter == "boron_concentration":
+        return config.F_BORON_WORTH_PER_PPM
+    if parameter == "rod_group_R_position":
+        return -config.F_CONTROL_ROD_WORTH * derived.rod_worth_R / 100.0
+    if parameter == "rod_group_GCP_position":
+        return -config.F_CONTROL_ROD_WORTH * derived.rod_worth_GCP / 100.0
+    raise ValueError(f"Paramètre de recherche inconnu : {parameter} "
+                     f"(valeurs possibles : {', '.join(SEARCH_PARAMETERS)})")
+
+
+def k_effective_derivative(parameter, results):
+    """
+    Dérivée analytique de k-effectif par rapport à un paramètre de recherche.
+
+    Args:
+        parameter: nom du paramètre (voir SEARCH_PARAMETERS)
+        results: sorties de evaluate_batch au point considéré
+
+    Returns:
+        np.ndarray: dk_eff / d(paramètre)
+    """
+    # k = K0 / (1 + A)  =>  dk/dx = -k * f * dA/dx
+    return -results["k_effective"] * results["f"] * _absorption_ratio_derivative(parameter)
+
+
+def find_critical(parameter, target_k_effective=1.0, target_reactivity=None, states=None,
+                  tolerance=None, max_iterations=None, **inputs):
+    """
+    Recherche la valeur d'un paramètre donnant le k-effectif cible pour un lot d'états.
+
+    Args:
+        parameter: "boron_concentration", "rod_group_R_position" ou "rod_group_GCP_position"
+        target_k_effective: k-effectif recherché (1.0 par défaut)
+        target_reactivity: réactivité absolue recherchée ; remplace target_k_effective si fournie
+        states: tableau structuré optionnel (voir BATCH_INPUT_DTYPE)
+        tolerance: écart toléré sur k-effectif (config par défaut)
+        max_iterations: nombre maximal d'itérations (config par défaut)
+        **inputs: autres entrées du modèle, comme pour evaluate_batch. La valeur
+            fournie pour le paramètre recherché sert de point de départ.
+
+    Returns:
+        dict: "value" (solution, NaN si la cible n'est pas atteignable dans la plage),
+            "k_effective", "converged" (booléens), "iterations" et "evaluations"
+    """
+    _absorption_ratio_derivative(parameter)  # validation du nom du paramètre
+    tolerance = config.CRITICALITY_SEARCH_TOLERANCE if tolerance is None else tolerance
+    max_iterations = config.CRITICALITY_SEARCH_MAX_ITERATIONS if max_iterations is None else max_iterations
+    if target_reactivity is not None:
+        target_k_effective = 1.0 / (1.0 - target_reactivity)
+
+    values = _resolve_inputs(states, inputs)
+    shape = np.broadcast_shapes(*(value.shape for value in values.values()),
+                                np.shape(target_k_effective))
+    # Les itérations travaillent sur des vecteurs aplatis ; la forme est restaurée à la fin
+    values = {name: np.broadcast_to(value, shape).ravel() for name, value in values.items()}
+    target = np.broadcast_to(np.asarray(target_k_effective, dtype=float), shape).ravel()
+    size = target.size
+
+    low_bound, high_bound = (float(bound) for bound in config.parameters_config[SEARCH_PARAMETERS[parameter]]['range'])
+    low = np.full(size, low_bound)
+    high = np.full(size, high_bound)
+
+    # Encadrement : k-effectif est monotone en bore comme en position de barres
+    evaluations = 1
+    bounds_k = evaluate_batch(**{**values, parameter: np.stack([low, high])})["k_effective"]
+    residual_low = bounds_k[0] - target
+    residual_high = bounds_k[1] - target
+    bracketed = residual_low * residual_high <= 0.0
+
+    x = np.clip(values[parameter], low, high).astype(float)
+    residual = np.full(size, np.inf)
+    active = bracketed.copy()
+    iterations = 0
+
+    while np.any(active) and iterations < max_iterations:
+        iterations += 1
+        evaluations += 1
+        current = {name: value[active] for name, value in values.items()}
+        current[parameter] = x[active]
+        results = evaluate_batch(**current)
+        res = results["k_effective"] - target[active]
+        residual[active] = res
+
+        # Resserrement de l'encadrement selon le signe du résidu
+        lo, hi, rl = low[active], high[active], residual_low[active]
+        same_side_as_low = np.sign(res) == np.sign(rl)
+        lo = np.where(same_side_as_low, x[active], lo)
+        hi = np.where(same_side_as_low, hi, x[active])
+        low[active], high[active] = lo, hi
+        residual_low[active] = np.where(same_side_as_low, res, rl)
+
+        # Pas de Newton, remplacé par une bissection s'il sort de l'encadrement
+        derivative = k_effective_derivative(parameter, results)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            newton = x[active] - res / derivative
+        inside = np.isfinite(newton) & (newton > lo) & (newton < hi)
+        x[active] = np.where(inside, newton, 0.5 * (lo + hi))
+
+        done = np.abs(res) <= tolerance
+        still_active = active.copy()
+        still_active[active] = ~done
+        # Les états convergés conservent la valeur évaluée, pas le pas suivant
+        x[active & ~still_active] = current[parameter][done]
+        active = still_active
+
+    converged = bracketed & (np.abs(residual) <= tolerance)
+    k_at_solution = np.where(converged, target + residual, np.nan)
+    return {
+        "value": np.where(bracketed, x, np.nan).reshape(shape),
+        "k_effective": k_at_solution.reshape(shape),
+        "converged": converged.reshape(shape),
+        "iterations": iterations,
+        "evaluations": evaluations,
+    }
@@ -0,0 +1,258 @@
+"""
+Évolution du combustible sur un cycle : chaîne réduite de noyaux lourds
+
+Les concentrations par gramme de métal lourd de la chaîne déclarée dans
+config.json (U-235, U-238, Pu-239/240/241 et un pseudo-produit de fission
+regroupé) suivent le système de Bateman à un groupe :
+
+    dN/dt = (Φ R + Λ) N
+
+où R regroupe les sections efficaces (disparition par absorption, formation
+par capture et par fission) et Λ les décroissances. Sur un pas de temps, Φ est
+constant et le système est avancé exactement par exponentielle de matrice
+(`scipy.linalg.expm`, Padé avec mise à l'échelle), pour tout un lot
+d'enrichissements à la fois (matrices empilées). À puissance spécifique
+constante, le flux dépend de l'inventaire fissile : chaque pas est un
+prédicteur-correcteur (flux de début de pas, puis flux moyen du pas).
+
+Le cœur est géré par lots : au temps t du cycle, il contient des assemblages
+d'âges t, t + T, ..., t + (n - 1) T. Le facteur η du cœur (neutrons produits
+par absorption dans le combustible) est rapporté à sa valeur de début de
+cycle ; une fraction configurable de cette variation est transmise au η du
+modèle à quatre facteurs, exprimée sous forme d'enrichissement équivalent.
+"""
+import math
+
+import numpy as np
+from scipy.linalg import expm
+
+from . import config
+from .batch_evaluation import evaluate_batch
+from .criticality_search import find_critical
+
+_DAYS_TO_SECONDS = 86400.0
+
+
+def nuclide_names():
+    """Noms des noyaux suivis, dans l'ordre des vecteurs de concentrations."""
+    return tuple(config.DEPLETION_NUCLIDES)
+
+
+def _cross_sections():
+    """Sections efficaces de fission et de capture (cm²), ν et constantes de décroissance."""
+    nuclides = config.DEPLETION_NUCLIDES.values()
+    barns = config.BARNS_TO_CM2
+    fission = np.array([data["FISSION_BARNS"] for data in nuclides]) * barns
+    capture = np.array([data["CAPTURE_BARNS"] for data in nuclides]) * barns
+    nu = np.array([data["NU"] for data in nuclides], dtype=float)
+    decay = np.array([data["DECAY_CONSTANT"] for data in nuclides], dtype=float)
+    return fission, capture, nu, decay
+
+
+def burnup_matrices():
+    """
+    Matrices du système de Bateman de la chaîne.
+
+    Returns:
+        tuple: (R, matrice de réaction par unité de flux en cm² ; Λ, matrice de décroissance en s⁻¹)
+    """
+    names = nuclide_names()
+    index = {name: i for i, name in enumerate(names)}
+    fission, capture, _, decay = _cross_sections()
+
+    reaction = np.diag(-(fission + capture))
+    for i, name in enumerate(names):
+        product = config.DEPLETION_NUCLIDES[name]["CAPTURE_PRODUCT"]
+        if product is not None:
+            reaction[index[product], i] += capture[i]
+    # Une paire de produits de fission par fission
+    reaction[index[config.DEPLETION_FISSION_PRODUCT], :] += fission
+    return reaction, np.diag(-decay)
+
+
+def fresh_fuel_composition(enrichment):
+    """
+    Concentrations (atomes par gramme de métal lourd) d'un combustible neuf.
+
+    Args:
+        enrichment: enrichissement en U-235 (%), scalaire ou tableau
+
+    Returns:
+        np.ndarray: forme enrichment.shape + (nombre de noyaux,)
+    """
+    enrichment = np.asarray(enrichment, dtype=float)
+    names = nuclide_names()
+    heavy_metal_atoms = config.DEPLETION_AVOGADRO / config.DEPLETION_HEAVY_METAL_MOLAR_MASS
+    composition = np.zeros(enrichment.shape + (len(names),))
+    composition[..., names.index("U235")] = enrichment / 100.0 * heavy_metal_atoms
+    composition[..., names.index("U238")] = (1.0 - enrichment / 100.0) * heavy_metal_atoms
+    return composition
+
+
+def _flux(composition, fission):
+    """Flux (n/cm²/s) maintenant la puissance spécifique pour une composition donnée."""
+    fission_rate = config.DEPLETION_SPECIFIC_POWER / config.DEPLETION_ENERGY_PER_FISSION_J
+    return fission_rate / (composition @ fission)
+
+
+def deplete(enrichment, duration_days, time_step_days=None):
+    """
+    Fait évoluer un lot de combustibles neufs à puissance spécifique constante.
+
+    Args:
+        enrichment: enrichissements initiaux (%), scalaire ou tableau 1-D
+        duration_days: durée d'irradiation (jours)
+        time_step_days: pas de temps maximal (TIME_STEP_DAYS par défaut)
+
+    Returns:
+        dict: "time_days" (pas,), "composition" (pas, lot, noyaux) en atomes/g
+            et "flux" (pas, lot)
+    """
+    time_step_days = config.DEPLETION_TIME_STEP_DAYS if time_step_days is None else time_step_days
+    enrichment = np.atleast_1d(np.asarray(enrichment, dtype=float))
+    if enrichment.ndim != 1:
+        raise ValueError("Les enrichissements doivent former un tableau à une dimension")
+    steps = max(math.ceil(duration_days / time_step_days - 1e-9), 1)
+    dt = duration_days / steps * _DAYS_TO_SECONDS
+
+    reaction, decay = burnup_matrices()
+    fission = _cross_sections()[0]
+
+    composition = np.empty((steps + 1,) + enrichment.shape + (len(fission),))
+    flux = np.empty((steps + 1,) + enrichment.shape)
+    composition[0] = fresh_fuel_composition(enrichment)
+    flux[0] = _flux(composition[0], fission)
+
+    for step in range(steps):
+        current = composition[step]
+        start_flux = flux[step]
+        # Prédicteur : flux de début de pas
+        propagator = expm((start_flux[:, None, None] * reaction + decay) * dt)
+        predicted = np.einsum('bij,bj->bi', propagator, current)
+        # Correcteur : flux moyen du pas
+        mean_flux = 0.5 * (start_flux + _flux(predicted, fission))
+        propagator = expm((mean_flux[:, None, None] * reaction + decay) * dt)
+        composition[step + 1] = np.einsum('bij,bj->bi', propagator, current)
+        flux[step + 1] = _flux(composition[step + 1], fission)
+
+    return {
+        "time_days": np.linspace(0.0, duration_days, steps + 1),
+        "composition": composition,
+        "flux": flux,
+    }
+
+
+def _eta_from_enrichment(enrichment):
+    """Loi η(enrichissement) du modèle à quatre facteurs."""
+    return (config.ETA_BASE + config.ETA_ENRICHMENT_COEFF *
+            (enrichment - config.ETA_ENRICHMENT_REF) / config.ETA_ENRICHMENT_SCALE)
+
+
+def _enrichment_from_eta(eta):
+    """Inverse de `_eta_from_enrichment` : enrichissement équivalent à un η donné."""
+    return (config.ETA_ENRICHMENT_REF +
+            (eta - config.ETA_BASE) * config.ETA_ENRICHMENT_SCALE / config.ETA_ENRICHMENT_COEFF)
+
+
+def deplete_cycle(enrichment, cycle_length_days=None, time_step_days=None, batches=None):
+    """
+    Évolution du cœur sur un cycle à l'équilibre et rétroaction sur η.
+
+    Args:
+        enrichment: enrichissement de recharge (%), scalaire ou tableau 1-D
+        cycle_length_days: durée du cycle (CYCLE_LENGTH_DAYS par défaut)
+        time_step_days: pas de temps maximal (TIME_STEP_DAYS par défaut)
+        batches: nombre de lots du cœur (BATCHES par défaut)
+
+    Returns:
+        dict: "time_days" et "cycle_burnup" (MWj/kg) le long du cycle ; pour chaque
+            enrichissement : "core_eta_ratio", "eta" (modèle à quatre facteurs) et
+            "equivalent_enrichment" ; la trajectoire d'un assemblage neuf jusqu'à la
+            décharge ("fuel_time_days", "fuel_composition" en fraction atomique) ;
+            "discharge_burnup", "initial_enrichment" et "nuclides"
+    """
+    cycle_length_days = config.DEPLETION_CYCLE_LENGTH_DAYS if cycle_length_days is None else cycle_length_days
+    time_step_days = config.DEPLETION_TIME_STEP_DAYS if time_step_days is None else time_step_days
+    batches = config.DEPLETION_BATCHES if batches is None else int(batches)
+    if batches < 1:
+        raise ValueError("Le cœur doit comporter au moins un lot")
+
+    scalar = np.ndim(enrichment) == 0
+    enrichment = np.atleast_1d(np.asarray(enrichment, dtype=float))
+
+    # Même pas pour tous les lots : le cycle contient un nombre entier de pas
+    steps_per_cycle = max(math.ceil(cycle_length_days / time_step_days - 1e-9), 1)
+    fuel = deplete(enrichment, batches * cycle_length_days, cycle_length_days / steps_per_cycle)
+    composition = fuel["composition"]
+
+    fission, capture, nu, _ = _cross_sections()
+    production = composition @ (nu * fission)
+    absorption = composition @ (fission + capture)
+
+    # Au pas s du cycle, le cœur contient les assemblages d'âges s, s + T, ...
+    cycle_steps = np.arange(steps_per_cycle + 1)
+    ages = cycle_steps[:, None] + steps_per_cycle * np.arange(batches)
+    core_eta = production[ages].sum(axis=1) / absorption[ages].sum(axis=1)
+    core_eta_ratio = core_eta / core_eta[0]
+
+    eta = _eta_from_enrichment(enrichment) * (1.0 + config.DEPLETION_ETA_FEEDBACK_FRACTION * (core_eta_ratio - 1.0))
+    equivalent_enrichment = _enrichment_from_eta(eta)
+
+    time_days = fuel["time_days"][:steps_per_cycle + 1]
+    heavy_metal_atoms = config.DEPLETION_AVOGADRO / config.DEPLETION_HEAVY_METAL_MOLAR_MASS
+    specific_power = config.DEPLETION_SPECIFIC_POWER  # W/g = MW/t : MWj/t par jour
+    unpack = (lambda values: values[..., 0]) if scalar else (lambda values: values)
+    return {
+        "time_days": time_days,
+        "cycle_burnup": time_days * specific_power / 1000.0,
+        "core_eta_ratio": unpack(core_eta_ratio),
+        "eta": unpack(eta),
+        "equivalent_enrichment": unpack(equivalent_enrichment),
+        "fuel_time_days": fuel["time_days"],
+        "fuel_composition": (composition[:, 0] if scalar else composition) / heavy_metal_atoms,
+        "discharge_burnup": batches * cycle_length_days * specific_power / 1000.0,
+        "initial_enrichment": float(enrichment[0]) if scalar else enrichment,
+        "nuclides": nuclide_names(),
+    }
+
+
+def boron_letdown(cycle, **inputs):
+    """
+    Courbe de dilution du bore : bore critique le long du cycle.
+
+    Args:
+        cycle: résultat de deplete_cycle pour un seul enrichissement
+        **inputs: autres entrées du modèle (barres, température, puissance, xénon),
+            comme pour evaluate_batch ; l'enrichissement et le bore sont imposés
+
+    Returns:
+        dict: "time_days", "cycle_burnup", "boron_concentration" (ppm, NaN lorsque
+            le cœur n'est plus critique bore nul) et "cycle_end_days" (instant où
+            le bore critique atteint zéro, None s'il n'est pas atteint)
+    """
+    enrichment = np.asarray(cycle["equivalent_enrichment"], dtype=float)
+    if enrichment.ndim != 1:
+        raise ValueError("La courbe de dilution se calcule pour un seul enrichissement de recharge")
+    inputs = {name: value for name, value in inputs.items()
+              if name not in ("fuel_enrichment", "boron_concentration")}
+
+    search = find_critical("boron_concentration", fuel_enrichment=enrichment,
+                           boron_concentration=np.zeros_like(enrichment), **inputs)
+    boron = np.where(search["converged"], search["value"], np.nan)
+
+    # Fin de cycle naturelle : k-effectif à bore nul redescend à 1
+    excess = evaluate_batch(fuel_enrichment=enrichment, boron_concentration=0.0,
+                            **inputs)["k_effective"] - 1.0
+    time_days = cycle["time_days"]
+    cycle_end_days = None
+    crossing = np.flatnonzero((excess[:-1] > 0.0) & (excess[1:] <= 0.0))
+    if crossing.size:
+        i = crossing[0]
+        cycle_end_days = float(time_days[i] + (time_days[i + 1] - time_days[i]) *
+                               excess[i] / (excess[i] - excess[i + 1]))
+    return {
+        "time_days": time_days,
+        "cycle_burnup": cycle["cycle_burnup"],
+        "boron_concentration": boron,
+        "cycle_end_days": cycle_end_days,
+    }
@@ -0,0 +1,134 @@
+"""
+Cache des évaluations complètes du réacteur, indexé sur les entrées quantifiées
+
+Lorsqu'on fait glisser les curseurs (barres, bore, puissance) dans un sens puis
+dans l'autre, les mêmes états reviennent en permanence. Ce cache mémorise, pour
+chaque tuple d'entrées quantifiées (Xénon et Iode compris), les grandeurs
+calculées par `ReactorModel` ainsi que les sections de visualisation déjà
+construites, afin que ces états revisités ne soient jamais recalculés.
+"""
+import math
+from collections import OrderedDict
+from . import config
+
+# Politiques d'éviction disponibles
+EVICTION_POLICIES = ("lru", "fifo")
+
+# Entrées du modèle quantifiées avec un pas absolu
+_ABSOLUTE_KEY_FIELDS = (
+    "rod_group_R_position",
+    "rod_group_GCP_position",
+    "boron_concentration",
+    "average_temperature",
+    "power_level",
+    "fuel_enrichment",
+)
+
+# Concentrations quantifiées avec une résolution relative (elles couvrent plusieurs décades)
+_RELATIVE_KEY_FIELDS = (
+    "xenon_concentration",
+    "iodine_concentration",
+)
+
+
+class EvaluationCache:
+    """
+    Cache borné des évaluations du modèle, avec statistiques de succès/échecs.
+
+    Chaque entrée est un dictionnaire contenant les grandeurs calculées
+    ("outputs") et les sections de visualisation déjà construites ("sections").
+    """
+
+    def __init__(self, max_size=None, eviction_policy=None, quantization=None):
+        self.max_size = config.EVALUATION_CACHE_MAX_SIZE if max_size is None else int(max_size)
+        self.eviction_policy = (config.EVALUATION_CACHE_EVICTION_POLICY
+                                if eviction_policy is None else eviction_policy)
+        if self.eviction_policy not in EVICTION_POLICIES:
+            raise ValueError(f"Politique d'éviction inconnue : {self.eviction_policy} "
+                             f"(valeurs possibles : {', '.join(EVICTION_POLICIES)})")
+        if self.max_size < 1:
+            raise ValueError("La taille du cache doit être au moins de 1 entrée")
+
+        steps = dict(config.EVALUATION_CACHE_QUANTIZATION)
+        steps.update(quantization or {})
+        self._absolute_steps = tuple((name, steps[name]) for name in _ABSOLUTE_KEY_FIELDS)
+        self._relative_resolution = steps["concentration_relative"]
+
+        self._entries = OrderedDict()
+        self._config_hash = config.DERIVED.config_hash
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _quantize_relative(self, value):
+        """Quantifie une concentration avec une résolution relative (chiffres significatifs)."""
+        if value <= 0.0:
+            return 0
+        exponent = math.floor(math.log10(value))
+        return exponent, round(value / 10.0**exponent / self._relative_resolution)
+
+    def make_key(self, state):
+        """Construit la clé quantifiée d'un état (objet exposant les attributs du modèle)."""
+        key = [round(getattr(state, name) / step) for name, step in self._absolute_steps]
+        key.extend(self._quantize_relative(getattr(state, name)) for name in _RELATIVE_KEY_FIELDS)
+        return tuple(key)
+
+    def get(self, key):
+        """
+        Retourne l'entrée associée à la clé, ou None.
+
+        Le cache est vidé si la configuration a été rechargée depuis sa création.
+        """
+        if self._config_hash != config.DERIVED.config_hash:
+            self.clear()
+            self._config_hash = config.DERIVED.config_hash
+
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        if self.eviction_policy == "lru":
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key, outputs):
+        """
+        Mémorise les grandeurs calculées pour une clé et retourne la nouvelle entrée.
+        """
+        entry = {"outputs": outputs, "sections": {}}
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            # Les deux politiques retirent la tête de file : la moins récemment
+            # utilisée en LRU, la plus ancienne insérée en FIFO.
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return entry
+
+    def clear(self):
+        """Vide le cache (les statistiques sont conservées)."""
+        self._entries.clear()
+
+    def reset_statistics(self):
+        """Remet à zéro les compteurs de succès, d'échecs et d'évictions."""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_statistics(self):
+        """Retourne les statistiques d'utilisation du cache."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "eviction_policy": self.eviction_policy,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+    def __len__(self):
+        return len(self._entries)
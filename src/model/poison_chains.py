@@ -0,0 +1,183 @@
+"""
+Chaînes de poisons produits de fission déclarées dans config.json
+
+Chaque noyau de `poison_chains.NUCLIDES` est décrit par son rendement de
+fission, sa constante de décroissance, sa section efficace d'absorption et
+le noyau qu'il forme en décroissant. À puissance constante, l'ensemble des
+chaînes forme un système linéaire :
+
+    dN/dt = (T - diag(λ + σa Φ)) N + γ Σf Φ
+
+où T est la matrice creuse des filiations par décroissance. La matrice est
+assemblée une fois ; seule la diagonale d'absorption dépend du flux. Un lot
+d'états (par exemple plusieurs niveaux de puissance) est traité comme un seul
+système creux diagonal par blocs, avancé exactement par exponentielle de
+matrice appliquée à un vecteur (`expm_multiply`) sur le système augmenté
+d'une composante constante qui porte les sources. Ajouter un noyau ne change
+que la taille de ces matrices, pas le nombre d'opérations Python. Les chaînes
+courtes sont avancées par exponentielle dense de chaque bloc (Padé, matrices
+empilées), ce qui évite le coût fixe d'`expm_multiply`.
+"""
+import numpy as np
+import scipy.sparse as sp
+from scipy.linalg import expm
+from scipy.sparse.linalg import expm_multiply, spsolve
+
+from . import config
+
+# En deçà de ce nombre de noyaux, chaque état est avancé par l'exponentielle dense
+# de sa matrice augmentée (matrices empilées) : pour quelques noyaux, c'est bien
+# plus rapide que l'estimation de normes d'expm_multiply
+_DENSE_CHAIN_SIZE = 32
+
+
+class PoisonChain:
+    """
+    Système de Bateman des poisons produits de fission.
+
+    Les concentrations sont des tableaux de forme (..., nombre de noyaux), en
+    atomes/cm³, dans l'ordre de `names`.
+    """
+
+    def __init__(self, nuclides=None):
+        nuclides = config.POISON_NUCLIDES if nuclides is None else nuclides
+        self.names = tuple(nuclides)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        size = len(self.names)
+
+        self.yields = np.array([data["FISSION_YIELD"] for data in nuclides.values()], dtype=float)
+        self.decay_constants = np.array([data["DECAY_CONSTANT"] for data in nuclides.values()], dtype=float)
+        self.absorption_cm2 = (np.array([data["ABSORPTION_BARNS"] for data in nuclides.values()], dtype=float) *
+                               config.BARNS_TO_CM2)
+
+        parents, products = [], []
+        for i, data in enumerate(nuclides.values()):
+            product = data["DECAY_PRODUCT"]
+            if product is not None:
+                if product not in self.index:
+                    raise ValueError(f"Produit de décroissance inconnu dans poison_chains : {product}")
+                parents.append(i)
+                products.append(self.index[product])
+        transfer = sp.csr_matrix((self.decay_constants[parents], (products, parents)), shape=(size, size))
+        # Filiations et décroissances, indépendantes du flux
+        self.decay_matrix = (transfer - sp.diags(self.decay_constants)).tocsr()
+        self._dense_decay_matrix = self.decay_matrix.toarray()
+
+    @staticmethod
+    def _rates(power_level):
+        """Taux de fission (Σf Φ) et flux thermique pour un niveau de puissance (%)."""
+        derived = config.DERIVED
+        power_level = np.asarray(power_level, dtype=float)
+        return power_level * derived.fission_rate_per_percent, power_level * derived.thermal_flux_per_percent
+
+    def _block_system(self, power_level, states):
+        """
+        Matrice creuse diagonale par blocs et sources pour un lot d'états.
+
+        Returns:
+            tuple: (matrice (états·noyaux)², sources (états·noyaux,))
+        """
+        fission_rate, thermal_flux = self._rates(np.broadcast_to(power_level, (states,)))
+        matrix = (sp.kron(sp.identity(states, format='csr'), self.decay_matrix, format='csr') -
+                  sp.diags((thermal_flux[:, None] * self.absorption_cm2).ravel()))
+        sources = (fission_rate[:, None] * self.yields).ravel()
+        return matrix, sources
+
+    def derivatives(self, concentrations, power_level):
+        """
+        Dérivées temporelles dN/dt.
+
+        Args:
+            concentrations: tableau (..., noyaux)
+            power_level: niveau de puissance (%), diffusé sur les états
+        """
+        concentrations = np.asarray(concentrations, dtype=float)
+        fission_rate, thermal_flux = self._rates(power_level)
+        return (self.decay_matrix @ concentrations[..., None])[..., 0] \
+            - np.asarray(thermal_flux)[..., None] * self.absorption_cm2 * concentrations \
+            + np.asarray(fission_rate)[..., None] * self.yields
+
+    def advance(self, concentrations, power_level, dt):
+        """
+        Avance exactement les concentrations sur dt, à puissance constante.
+
+        Args:
+            concentrations: tableau (..., noyaux)
+            power_level: niveau de puissance (%), scalaire ou un par état
+            dt: durée (secondes)
+
+        Returns:
+            np.ndarray: nouvelles concentrations, même forme que l'entrée
+        """
+        concentrations = np.asarray(concentrations, dtype=float)
+        shape = concentrations.shape
+        size = len(self.names)
+        flat = concentrations.reshape(-1, size)
+        if size <= _DENSE_CHAIN_SIZE:
+            return self._advance_dense(flat, power_level, dt).reshape(shape)
+        matrix, sources = self._block_system(np.ravel(power_level), flat.shape[0])
+
+        # Système augmenté : la dernière composante vaut 1 et porte les sources
+        augmented = sp.bmat([[matrix, sources[:, None]], [None, sp.csr_matrix((1, 1))]], format='csr')
+        vector = np.append(flat.ravel(), 1.0)
+        result = expm_multiply(augmented * dt, vector)[:-1]
+        return np.maximum(result, 0.0).reshape(shape)
+
+    def _advance_dense(self, flat, power_level, dt):
+        """Avance un lot d'états (états, noyaux) par exponentielles denses empilées."""
+        states, size = flat.shape
+        fission_rate, thermal_flux = self._rates(np.broadcast_to(np.ravel(power_level), (states,)))
+        augmented = np.zeros((states, size + 1, size + 1))
+        augmented[:, :size, :size] = self._dense_decay_matrix
+        diagonal = np.arange(size)
+        augmented[:, diagonal, diagonal] -= thermal_flux[:, None] * self.absorption_cm2
+        augmented[:, :size, size] = fission_rate[:, None] * self.yields
+        propagator = expm(augmented * dt)
+        result = propagator[:, :size, :size] @ flat[..., None] + propagator[:, :size, size:]
+        return np.maximum(result[..., 0], 0.0)
+
+    def equilibrium(self, power_level, concentrations=None):
+        """
+        Concentrations d'équilibre pour un niveau de puissance.
+
+        Les noyaux sans disparition (stables et non irradiés, par exemple le
+        Sm-149 à puissance nulle) n'ont pas d'équilibre : ils gardent la valeur
+        fournie dans `concentrations` (zéro par défaut).
+
+        Args:
+            power_level: niveau de puissance (%), scalaire ou un par état
+            concentrations: tableau (..., noyaux) optionnel des valeurs actuelles
+        """
+        size = len(self.names)
+        power_level = np.asarray(power_level, dtype=float)
+        if concentrations is None:
+            concentrations = np.zeros(power_level.shape + (size,))
+        concentrations = np.asarray(concentrations, dtype=float)
+        shape = concentrations.shape
+        flat = concentrations.reshape(-1, size)
+        states = flat.shape[0]
+        matrix, sources = self._block_system(np.ravel(power_level), states)
+
+        _, thermal_flux = self._rates(np.broadcast_to(np.ravel(power_level), (states,)))
+        removal = (self.decay_constants + thermal_flux[:, None] * self.absorption_cm2).ravel()
+        active = removal > 0.0
+        fixed = flat.ravel() * ~active
+        result = fixed.copy()
+        if active.any():
+            rhs = -(sources + matrix @ fixed)[active]
+            result[active] = spsolve(matrix[active][:, active].tocsc(), rhs)
+        return np.maximum(result, 0.0).reshape(shape)
+
+    def reactivity_effects(self, concentrations):
+        """
+        Antiréactivité (pcm) de chaque noyau absorbant, avec la même conversion
+        que `ReactorModel.get_xenon_reactivity_effect` (flux nominal de référence).
+
+        Returns:
+            dict: nom du noyau -> antiréactivité en pcm (valeurs négatives)
+        """
+        concentrations = np.asarray(concentrations, dtype=float)
+        pcm_per_atom = (self.absorption_cm2 * config.THERMAL_FLUX_NOMINAL *
+                        config.XENON_REACTIVITY_CONVERSION_FACTOR)
+        return {name: -concentrations[..., i] * pcm_per_atom[i]
+                for i, name in enumerate(self.names) if pcm_per_atom[i] > 0.0}
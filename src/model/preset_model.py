@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Union, Any
 from dataclasses import dataclass, asdict
 from enum import Enum
+from .config import get_project_root
 
 class PresetCategory(Enum):
     """Catégories de presets pour l'organisation"""
@@ -143,8 +144,9 @@ class PresetManager:
     
     def __init__(self, system_presets_file: str = "config.json", 
                  user_presets_file: str = "user_presets.json"):
-        self.system_presets_file = Path(system_presets_file)
-        self.user_presets_file = Path(user_presets_file)
+        # Chemins relatifs à la racine du projet, quel que soit le répertoire courant
+        self.system_presets_file = get_project_root() / system_presets_file
+        self.user_presets_file = get_project_root() / user_presets_file
         self._presets: Dict[str, PresetData] = {}
         self._load_all_presets()
     
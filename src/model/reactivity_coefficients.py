@@ -0,0 +1,140 @@
+"""
+Jacobien analytique de k-effectif et coefficients de réactivité
+
+Les dérivées de k-effectif par rapport à chaque entrée du modèle sont obtenues
+en une seule passe à partir des expressions fermées de η, p, f et des
+probabilités de non-fuite (voir `ReactorModel._calculate_eta`, `_calculate_p`,
+`_calculate_f` et `_calculate_leakage`). Comme k = η·ε·p·f·Pnf·Pnt, on a :
+
+    d ln k / dx = d ln η / dx + d ln p / dx + d ln f / dx + d ln Pnf / dx + d ln Pnt / dx
+
+et la réactivité ρ = 1 - 1/k vérifie dρ/dx = (d ln k / dx) / k. On évite ainsi
+les 2N évaluations complètes d'un calcul par perturbations.
+"""
+import numpy as np
+from . import config
+from .batch_evaluation import evaluate_batch, _resolve_inputs, BATCH_INPUT_FIELDS
+
+# Coefficients de réactivité exposés, avec leur unité (réactivité en pcm)
+REACTIVITY_COEFFICIENT_UNITS = {
+    "doppler": "pcm/°C",
+    "moderator_temperature": "pcm/°C",
+    "isothermal_temperature": "pcm/°C",
+    "power": "pcm/%",
+    "boron": "pcm/ppm",
+    "rod_group_R": "pcm/%",
+    "rod_group_GCP": "pcm/%",
+    "fuel_enrichment": "pcm/%",
+}
+
+
+def _log_derivatives(v, results):
+    """
+    Dérivées logarithmiques de k-effectif par rapport à chaque entrée du modèle,
+    ainsi que celle par rapport à la température combustible seule (effet Doppler).
+    """
+    derived = config.DERIVED
+    zero = np.zeros_like(results["k_effective"])
+    eta, f = results["eta"], results["f"]
+    average_temperature = v["average_temperature"]
+
+    # η : linéaire en enrichissement
+    deta_denrichment = config.ETA_ENRICHMENT_COEFF / config.ETA_ENRICHMENT_SCALE
+    with np.errstate(divide='ignore', invalid='ignore'):
+        dln_eta_denrichment = np.where(eta > 1e-9, deta_denrichment / eta, 0.0)
+
+    # p : Doppler en exp(-c·sqrt(Tc)) et terme linéaire en température modérateur
+    fuel_temperature_K = results["fuel_temperature"] + config.CELSIUS_TO_KELVIN
+    dln_p_dfuel_temperature = -config.P_DOPPLER_COEFF / (2.0 * np.sqrt(fuel_temperature_K))
+    moderator_effect = 1.0 - config.P_MOD_TEMP_COEFF * (average_temperature - config.P_REF_MOD_TEMP_C)
+    dln_p_dmoderator = -config.P_MOD_TEMP_COEFF / moderator_effect
+
+    # f = 1 / (1 + A)  =>  d ln f / dx = -f · dA/dx
+    # Le rapport d'absorption du xénon vaut X·σXe·η / (Σf·ν), d'où sa dépendance en η
+    xenon_abs_per_atom_per_eta = derived.xenon_microscopic_absorption_cm2 / derived.fuel_absorption_times_eta
+    valid_eta = eta > 1e-9
+    dA = {
+        "rod_group_R_position": -config.F_CONTROL_ROD_WORTH * derived.rod_worth_R / 100.0,
+        "rod_group_GCP_position": -config.F_CONTROL_ROD_WORTH * derived.rod_worth_GCP / 100.0,
+        "boron_concentration": config.F_BORON_WORTH_PER_PPM,
+        "average_temperature": config.F_BASE_ABS_RATIO * config.F_MOD_TEMP_ABS_COEFF,
+        "xenon_concentration": np.where(valid_eta, xenon_abs_per_atom_per_eta * eta, 0.0),
+        "fuel_enrichment": np.where(valid_eta,
+                                    v["xenon_concentration"] * xenon_abs_per_atom_per_eta * deta_denrichment, 0.0),
+    }
+
+    # Fuites : Pn = 1 / (1 + B²·L²·d²) avec d = 1 / (1 - c·ΔT)
+    #  =>  d ln Pn / dT = -(1 - Pn) · 2 · d ln d / dT = -(1 - Pn) · 2c·d
+    density_ratio = 1.0 / (1.0 - config.MODERATOR_DENSITY_COEFF * (average_temperature - config.F_REF_MOD_TEMP_C))
+    dln_density_dT = config.MODERATOR_DENSITY_COEFF * density_ratio
+    dln_leakage_dT = -2.0 * dln_density_dT * ((1.0 - results["fast_non_leakage_prob"]) +
+                                              (1.0 - results["thermal_non_leakage_prob"]))
+
+    dln_k = {name: -f * dA[name] + zero for name in dA}
+    # La température combustible suit la température moyenne et la puissance
+    dln_k["average_temperature"] = (dln_k["average_temperature"] + dln_p_dfuel_temperature +
+                                    dln_p_dmoderator + dln_leakage_dT)
+    dln_k["power_level"] = dln_p_dfuel_temperature * config.POWER_TO_FUEL_TEMP_COEFF + zero
+    dln_k["fuel_enrichment"] = dln_k["fuel_enrichment"] + dln_eta_denrichment
+    return dln_k, dln_p_dfuel_temperature + zero
+
+
+def evaluate_jacobian(states=None, **inputs):
+    """
+    Évalue k-effectif, la réactivité et leurs dérivées par rapport à toutes les
+    entrées du modèle, pour un lot d'états.
+
+    Le xénon est traité comme une entrée indépendante : s'il n'est pas fourni,
+    il est pris à l'équilibre comme dans evaluate_batch, mais sa dérivée par
+    rapport à la puissance n'est pas incluse.
+
+    Args:
+        states, **inputs: comme pour evaluate_batch
+
+    Returns:
+        dict: "outputs" (sorties de evaluate_batch), "k_effective" et
+            "reactivity" (dictionnaires {entrée: dérivée}, une entrée par nom
+            de BATCH_INPUT_FIELDS) et "doppler" (dρ/dT combustible)
+    """
+    values = _resolve_inputs(states, inputs)
+    results = evaluate_batch(**values)
+    dln_k, dln_k_dfuel_temperature = _log_derivatives(values, results)
+
+    k_effective = results["k_effective"]
+    return {
+        "outputs": results,
+        "k_effective": {name: k_effective * dln_k[name] for name in BATCH_INPUT_FIELDS},
+        "reactivity": {name: dln_k[name] / k_effective for name in BATCH_INPUT_FIELDS},
+        "doppler": dln_k_dfuel_temperature / k_effective,
+    }
+
+
+def reactivity_coefficients(states=None, **inputs):
+    """
+    Coefficients de réactivité usuels, en pcm par unité (voir REACTIVITY_COEFFICIENT_UNITS).
+
+    - doppler : effet de la seule température combustible
+    - moderator_temperature : effet de la seule température modérateur (p, f, fuites)
+    - isothermal_temperature : combustible et modérateur variant ensemble
+    - power : coefficient de puissance (échauffement du combustible)
+    - boron, rod_group_R, rod_group_GCP : efficacités différentielles
+
+    Args:
+        states, **inputs: comme pour evaluate_batch
+
+    Returns:
+        dict: tableaux NumPy de coefficients en pcm par unité
+    """
+    jacobian = evaluate_jacobian(states, **inputs)
+    d_rho = {name: value * config.REACTIVITY_TO_PCM for name, value in jacobian["reactivity"].items()}
+    doppler = jacobian["doppler"] * config.REACTIVITY_TO_PCM
+    return {
+        "doppler": doppler,
+        "moderator_temperature": d_rho["average_temperature"] - doppler,
+        "isothermal_temperature": d_rho["average_temperature"],
+        "power": d_rho["power_level"],
+        "boron": d_rho["boron_concentration"],
+        "rod_group_R": d_rho["rod_group_R_position"],
+        "rod_group_GCP": d_rho["rod_group_GCP_position"],
+        "fuel_enrichment": d_rho["fuel_enrichment"],
+    }
@@ -2,14 +2,65 @@
 Modèle de physique des réacteurs pour les calculs de neutronique
 """
 import numpy as np
+from collections import Counter
 from . import config
 from .preset_model import PresetManager, PresetData, PresetCategory, PresetType
+from .poison_chains import PoisonChain
+from .evaluation_cache import EvaluationCache
+from .point_kinetics import PointKineticsSolver
+from .criticality_search import find_critical
+from .reactivity_coefficients import reactivity_coefficients
+from .response_surface import ResponseSurface
+from .axial_diffusion import AxialDiffusionSolver
+from .rz_diffusion import RZDiffusionSolver
+from .depletion import deplete_cycle, boron_letdown
+from .uncertainty import propagate_uncertainty
+from .sensitivity import sobol_indices
+from .axial_xenon import (xenon_absorption_ratios, equilibrium_axial_xenon, advance_axial_xenon,
+                          axial_offset)
 
 class ReactorModel:
     """
     Modèle de réacteur de base implémentant les calculs de neutronique pour un REP
     """
     
+    # Graphe de dépendances : grandeur calculée -> entrées et grandeurs dont elle dépend.
+    # L'ordre des clés est un ordre topologique valide pour le recalcul.
+    _DEPENDENCIES = {
+        "fuel_temperature": ("average_temperature", "power_level"),
+        "eta": ("fuel_enrichment",),
+        "epsilon": (),
+        "p": ("fuel_temperature", "average_temperature"),
+        "f": ("average_temperature", "rod_group_R_position", "rod_group_GCP_position",
+              "boron_concentration", "xenon_concentration", "eta"),
+        "leakage": ("average_temperature",),
+        "k_infinite": ("eta", "epsilon", "p", "f"),
+        "k_effective": ("k_infinite", "leakage"),
+        "reactivity": ("k_effective",),
+        "doubling_time": ("reactivity",),
+    }
+    
+    # Méthode de calcul associée à chaque grandeur du graphe
+    _CALCULATORS = {
+        "fuel_temperature": "_update_temperatures",
+        "eta": "_calculate_eta",
+        "epsilon": "_calculate_epsilon",
+        "p": "_calculate_p",
+        "f": "_calculate_f",
+        "leakage": "_calculate_leakage",
+        "k_infinite": "_calculate_k_infinite",
+        "k_effective": "_calculate_k_effective_analytical",
+        "reactivity": "calculate_reactivity",
+        "doubling_time": "calculate_doubling_time",
+    }
+    
+    # Attributs produits par le graphe, mémorisés par le cache d'évaluations
+    _CACHED_OUTPUTS = (
+        "fuel_temperature", "eta", "epsilon", "p", "f",
+        "fast_non_leakage_prob", "thermal_non_leakage_prob",
+        "k_infinite", "k_effective", "reactivity", "doubling_time",
+    )
+    
     def __init__(self):
         # Paramètres par défaut chargés depuis la configuration
         defaults = config.default_state
@@ -32,6 +83,15 @@ class ReactorModel:
         self.xenon_concentration = 0.0   # Xe-135 concentration
         self.simulation_time = 0.0       # temps de simulation en secondes
         
+        # Chaînes de poisons déclarées dans config.json (I/Xe, Pm/Sm, ...) ;
+        # les entrées I-135/Xe-135 du vecteur sont reprises des deux attributs ci-dessus
+        self.poison_chain = PoisonChain()
+        self.poison_concentrations = np.zeros(len(self.poison_chain.names))
+        
+        # Concentrations I-135/Xe-135 par maille axiale (None : équilibre calculé au prochain recompute())
+        self.axial_iodine_concentration = None
+        self.axial_xenon_concentration = None
+        
         # Paramètres calculés
         self.k_effective = 1.0
         self.k_infinite = 1.0
@@ -51,6 +111,39 @@ class ReactorModel:
         # Nouveau système de gestion des presets avancé
         self.preset_manager = PresetManager()
         
+        # Cinétique ponctuelle à six groupes, alimentée par la réactivité du modèle
+        self.point_kinetics = PointKineticsSolver()
+        
+        # Diffusion axiale à deux groupes (forme du flux), redémarrée depuis la solution précédente
+        self.axial_solver = AxialDiffusionSolver()
+        
+        # Diffusion r-z, créée à la première demande (cours avancé)
+        self.rz_solver = None
+        
+        # Évolution du combustible : dernier calcul de cycle et instant du cycle appliqué (jours)
+        self.depletion = None
+        self.cycle_time_days = 0.0
+        
+        # Recalcul incrémental : grandeurs à recalculer et compteur des recalculs effectués
+        self._dirty = set(self._DEPENDENCIES)
+        self.recompute_counts = Counter()
+        self.last_recomputed = ()
+        
+        # Version de l'état, incrémentée à chaque recalcul (utilisée par les instantanés du contrôleur)
+        self.state_version = 0
+        
+        # Cache optionnel des évaluations complètes (désactivé par défaut)
+        self.evaluation_cache = None
+        self.cache_entry = None
+        if config.EVALUATION_CACHE_ENABLED:
+            self.enable_evaluation_cache()
+        
+        # Table de réponse précalculée optionnelle (interpolation au lieu du calcul analytique)
+        self.response_surface = None
+        self._outputs_interpolated = False
+        if config.RESPONSE_SURFACE_ENABLED:
+            self.response_surface = ResponseSurface.load_or_build()
+        
         # Calcul initial et initialisation des concentrations Xénon à l'équilibre
         self._update_temperatures()
         self.calculate_xenon_equilibrium()  # Initialiser à l'équilibre pour le niveau de puissance actuel
@@ -62,10 +155,133 @@ class ReactorModel:
 
     def calculate_all(self):
         """Calcule tous les paramètres du réacteur en fonction des entrées actuelles"""
-        self.calculate_four_factors()
-        self.calculate_k_effective()
-        self.calculate_reactivity()
+        self._dirty.update(self._DEPENDENCIES)
+        self.recompute()
+
+    @classmethod
+    def get_downstream_quantities(cls, name):
+        """
+        Retourne l'ensemble des grandeurs calculées qui dépendent (directement ou non)
+        d'une entrée ou d'une grandeur du graphe.
+        """
+        downstream = set()
+        pending = [name]
+        while pending:
+            current = pending.pop()
+            for quantity, dependencies in cls._DEPENDENCIES.items():
+                if current in dependencies and quantity not in downstream:
+                    downstream.add(quantity)
+                    pending.append(quantity)
+        return downstream
+
+    def mark_dirty(self, *names):
+        """
+        Signale la modification d'entrées : seules les grandeurs en aval
+        seront recalculées au prochain appel de recompute().
+        """
+        for name in names:
+            self._dirty.update(_DOWNSTREAM_QUANTITIES[name])
+
+    def recompute(self):
+        """
+        Recalcule uniquement les grandeurs marquées comme obsolètes, dans l'ordre du graphe.
+        
+        Returns:
+            tuple: noms des grandeurs recalculées
+        """
+        cache = self.evaluation_cache
+        entry = None
+        if cache is not None:
+            key = cache.make_key(self)
+            entry = cache.get(key)
+
+        if entry is not None:
+            # État déjà évalué : restauration des grandeurs mémorisées
+            for name, value in entry["outputs"].items():
+                setattr(self, name, value)
+            recomputed = ()
+        else:
+            if self._interpolate_from_response_surface():
+                recomputed = ()
+            else:
+                if self._outputs_interpolated:
+                    # Les grandeurs interpolées ne servent pas de base à un recalcul partiel
+                    self._dirty.update(self._DEPENDENCIES)
+                    self._outputs_interpolated = False
+                recomputed = tuple(name for name in self._DEPENDENCIES if name in self._dirty)
+                for name in recomputed:
+                    getattr(self, self._CALCULATORS[name])()
+            if cache is not None:
+                entry = cache.put(key, {name: getattr(self, name) for name in self._CACHED_OUTPUTS})
+
+        self.cache_entry = entry
+        self._dirty.clear()
+        # Distribution nodale remise à l'équilibre (preset, remise à zéro) : calculée
+        # ici, sur le modèle, pour que les lectures restent sans effet de bord
+        self._ensure_axial_xenon()
+        self.recompute_counts.update(recomputed)
+        self.last_recomputed = recomputed
+        self.state_version += 1
+        return recomputed
+
+    def reset_recompute_counts(self):
+        """Remet à zéro le compteur des recalculs."""
+        self.recompute_counts.clear()
+
+    def _interpolate_from_response_surface(self):
+        """
+        Remplit les grandeurs calculées par interpolation dans la table de réponse,
+        si elle est active et couvre l'état courant.
+        
+        Returns:
+            bool: True si l'état a été interpolé
+        """
+        surface = self.response_surface
+        if surface is None:
+            return False
+        inputs = self.get_model_inputs()
+        if not surface.covers(**inputs):
+            return False
+
+        for name, value in surface.interpolate(**inputs).items():
+            setattr(self, name, float(value))
+        self._update_temperatures()
+        self.k_infinite = self.eta * self.epsilon * self.p * self.f
         self.calculate_doubling_time()
+        self._outputs_interpolated = True
+        return True
+
+    def enable_response_surface(self, rebuild=False):
+        """
+        Active la table de réponse précalculée (construite au premier appel pour
+        la configuration courante, puis projetée en mémoire).
+        
+        Args:
+            rebuild: force la reconstruction de la table
+        """
+        self.response_surface = ResponseSurface.load_or_build(rebuild=rebuild)
+        self.calculate_all()
+
+    def disable_response_surface(self):
+        """Revient au calcul analytique."""
+        self.response_surface = None
+        self.calculate_all()
+
+    def enable_evaluation_cache(self, max_size=None, eviction_policy=None):
+        """
+        Active le cache des évaluations quantifiées devant calculate_all/recompute.
+        
+        Args:
+            max_size: nombre maximal d'entrées (valeur de config.json par défaut)
+            eviction_policy: "lru" ou "fifo" (valeur de config.json par défaut)
+        """
+        self.evaluation_cache = EvaluationCache(max_size, eviction_policy)
+        self.cache_entry = None
+
+    def disable_evaluation_cache(self):
+        """Désactive et libère le cache des évaluations."""
+        self.evaluation_cache = None
+        self.cache_entry = None
     
     def _calculate_eta(self):
         """
@@ -93,7 +309,7 @@ class ReactorModel:
         """
         # 1. Effet Doppler (température du combustible)
         fuel_temp_K = self.fuel_temperature + config.CELSIUS_TO_KELVIN
-        sqrt_T_diff = np.sqrt(fuel_temp_K) - np.sqrt(config.P_REF_TEMP_K)
+        sqrt_T_diff = np.sqrt(fuel_temp_K) - config.DERIVED.sqrt_p_ref_temp_k
         doppler_effect = np.exp(-config.P_DOPPLER_COEFF * sqrt_T_diff)
         
         # 2. Effet température du modérateur (densité et efficacité de ralentissement)
@@ -131,14 +347,14 @@ class ReactorModel:
         Calcule le rapport d'absorption du Xénon-135.
         Utilise le rapport Σa_xenon / Σa_fuel pour assurer la cohérence dimensionnelle.
         """
+        derived = config.DERIVED
+        
         # Section efficace d'absorption du Xénon
-        sigma_a_xenon = self.xenon_concentration * config.XENON_ABSORPTION_CROSS_SECTION * config.BARNS_TO_CM2
+        sigma_a_xenon = self.xenon_concentration * derived.xenon_microscopic_absorption_cm2
 
         # Calcul de Σa_fuel à partir de la définition de eta = nu * Σf / Σa_fuel
-        sigma_f_nominal = config.FISSION_RATE_COEFF * 100.0  # Valeur de Σf à 100% puissance
-
         if self.eta > 1e-9:  # Prévenir la division par zéro
-            sigma_a_fuel_nominal = (sigma_f_nominal * config.NEUTRONS_PER_THERMAL_FISSION_U235) / self.eta
+            sigma_a_fuel_nominal = derived.fuel_absorption_times_eta / self.eta
         else:
             sigma_a_fuel_nominal = 1.0  # Fallback sécuritaire
 
@@ -181,23 +397,23 @@ class ReactorModel:
         """
         Calculate k-effective using the analytical model.
         """
+        self._calculate_k_infinite()
+        self._calculate_leakage()
         self._calculate_k_effective_analytical()
 
-    def _calculate_k_effective_analytical(self):
-        """Calcul k-effectif avec le modèle analytique."""
-        # --- Calcul analytique ---
+    def _calculate_k_infinite(self):
+        """Calcule k-infini à partir des quatre facteurs."""
         self.k_infinite = self.eta * self.epsilon * self.p * self.f
-        
+
+    def _calculate_leakage(self):
+        """Calcule les probabilités de non-fuite rapide et thermique."""
         # Nouveau calcul de fuite basé sur la théorie de diffusion à deux groupes
-        # 1. Laplacien géométrique B^2
-        R = config.CORE_DIAMETER_M / 2.0
-        H = config.CORE_HEIGHT_M
-        geometric_buckling = (np.pi / H)**2 + (config.BESSEL_J0_FIRST_ZERO / R)**2
+        # 1. Laplacien géométrique B^2 (précalculé au chargement de la configuration)
+        geometric_buckling = config.DERIVED.geometric_buckling
         
         # 2. Effet de la température sur la densité du modérateur et les aires de diffusion
         # L^2 et L_s^2 sont proportionnels à (rho_ref/rho_T)^2
-        temp_deviation = self.average_temperature - config.F_REF_MOD_TEMP_C
-        density_ratio = 1.0 / (1.0 - config.MODERATOR_DENSITY_COEFF * temp_deviation)
+        density_ratio = self._get_moderator_density_ratio()
         
         thermal_diffusion_area = config.THERMAL_DIFFUSION_AREA_M2 * (density_ratio**2)
         fast_diffusion_area = config.FAST_DIFFUSION_AREA_M2 * (density_ratio**2)
@@ -205,7 +421,14 @@ class ReactorModel:
         # 3. Probabilités de non-fuite
         self.fast_non_leakage_prob = 1.0 / (1.0 + geometric_buckling * fast_diffusion_area)
         self.thermal_non_leakage_prob = 1.0 / (1.0 + geometric_buckling * thermal_diffusion_area)
-        
+
+    def _get_moderator_density_ratio(self):
+        """Rapport de densité du modérateur ρ_ref / ρ(T) à la température moyenne."""
+        temp_deviation = self.average_temperature - config.F_REF_MOD_TEMP_C
+        return 1.0 / (1.0 - config.MODERATOR_DENSITY_COEFF * temp_deviation)
+
+    def _calculate_k_effective_analytical(self):
+        """Calcul k-effectif avec le modèle analytique."""
         self.k_effective = self.k_infinite * self.fast_non_leakage_prob * self.thermal_non_leakage_prob
 
     def calculate_reactivity(self):
@@ -234,7 +457,7 @@ class ReactorModel:
             prompt_reactivity = rho - self.delayed_neutron_fraction
             if prompt_reactivity > 0:
                 period = config.PROMPT_NEUTRON_LIFETIME / prompt_reactivity
-                self.doubling_time = period * np.log(2)
+                self.doubling_time = period * config.DERIVED.ln2
             else:
                 # Exactement critique prompt, la période est théoriquement zéro.
                 self.doubling_time = 0.0
@@ -250,94 +473,105 @@ class ReactorModel:
             # Une approximation plus simple et plus courante pour une petite réactivité est T ≈ β / (λ * ρ)
             if rho > 0:
                 period = self.delayed_neutron_fraction / (rho * effective_decay_constant)
-                self.doubling_time = period * np.log(2)
+                self.doubling_time = period * config.DERIVED.ln2
             else:
                 self.doubling_time = float('inf')
 
     def calculate_xenon_equilibrium(self):
         """
-        Calcule les concentrations d'équilibre de l'Iode-135 et du Xénon-135
-        pour le niveau de puissance actuel.
+        Calcule les concentrations d'équilibre de l'Iode-135, du Xénon-135 et des
+        autres poisons de poison_chains pour le niveau de puissance actuel.
         """
-        # Taux de fission basé sur le niveau de puissance
-        fission_rate = self.power_level * config.FISSION_RATE_COEFF * config.THERMAL_FLUX_NOMINAL
-        
-        # Concentrations d'équilibre
-        # Iode: λI * [I] = γI * Σf * Φ (production = disparition)
-        self.iodine_concentration = (config.IODINE_YIELD * fission_rate) / config.IODINE_DECAY_CONSTANT
-        
-        # Xénon: λX * [Xe] + σXe * Φ * [Xe] = γXe * Σf * Φ + λI * [I]
-        thermal_flux = config.THERMAL_FLUX_NOMINAL * (self.power_level / config.PERCENT_TO_FRACTION)
-        xenon_removal_rate = config.XENON_DECAY_CONSTANT + config.XENON_ABSORPTION_CROSS_SECTION * thermal_flux * config.BARNS_TO_CM2
-        xenon_production_rate = (config.XENON_YIELD_DIRECT * fission_rate + 
-                               config.IODINE_DECAY_CONSTANT * self.iodine_concentration)
-        
-        self.xenon_concentration = xenon_production_rate / xenon_removal_rate
+        self._set_poison_state(self.poison_chain.equilibrium(self.power_level, self._get_poison_state()))
+        self.mark_dirty("xenon_concentration")
+        self._reset_axial_xenon()
+
+    def _reset_axial_xenon(self):
+        """Demande le recalcul de la distribution axiale d'équilibre au prochain recompute()."""
+        self.axial_iodine_concentration = None
+        self.axial_xenon_concentration = None
 
-    def _xenon_derivatives(self, concentrations, power_level):
+    def _ensure_axial_xenon(self):
         """
-        Calcule les dérivées temporelles des concentrations I-135 et Xe-135.
-        
-        Args:
-            concentrations: [iodine_concentration, xenon_concentration]
-            power_level: niveau de puissance (%)
-            
-        Returns:
-            [d_iodine_dt, d_xenon_dt]: dérivées temporelles
+        Initialise si besoin les concentrations nodales à la distribution d'équilibre,
+        remise à l'échelle pour que leurs moyennes égalent les concentrations du modèle ponctuel.
         """
-        iodine_conc, xenon_conc = concentrations
-        
-        # Taux de fission pour ce niveau de puissance
-        fission_rate = power_level * config.FISSION_RATE_COEFF * config.THERMAL_FLUX_NOMINAL
-        thermal_flux = config.THERMAL_FLUX_NOMINAL * (power_level / config.PERCENT_TO_FRACTION)
-        
-        # Équation pour l'Iode-135: d[I]/dt = γI * Σf * Φ - λI * [I]
-        iodine_production = config.IODINE_YIELD * fission_rate
-        iodine_decay = config.IODINE_DECAY_CONSTANT * iodine_conc
-        d_iodine_dt = iodine_production - iodine_decay
-        
-        # Équation pour le Xénon-135: d[Xe]/dt = γXe * Σf * Φ + λI * [I] - λXe * [Xe] - σXe * Φ * [Xe]
-        xenon_production_direct = config.XENON_YIELD_DIRECT * fission_rate
-        xenon_production_from_iodine = config.IODINE_DECAY_CONSTANT * iodine_conc
-        xenon_decay = config.XENON_DECAY_CONSTANT * xenon_conc
-        xenon_burnup = config.XENON_ABSORPTION_CROSS_SECTION * thermal_flux * xenon_conc * config.BARNS_TO_CM2
-        
-        d_xenon_dt = xenon_production_direct + xenon_production_from_iodine - xenon_decay - xenon_burnup
-        
-        
-        return np.array([d_iodine_dt, d_xenon_dt])
+        if not config.AXIAL_XENON_ENABLED or self.axial_xenon_concentration is not None:
+            return
+        iodine, xenon = equilibrium_axial_xenon(self._solve_axial_flux_for_xenon, self.power_level)
+
+        def rescale(nodes, mean_value):
+            mean = nodes.mean()
+            return nodes * (mean_value / mean) if mean > 0 else np.full_like(nodes, mean_value)
+
+        self.axial_iodine_concentration = rescale(iodine, self.iodine_concentration)
+        self.axial_xenon_concentration = rescale(xenon, self.xenon_concentration)
+
+    def _get_poison_state(self):
+        """Vecteur des concentrations de poisons, I-135/Xe-135 repris des attributs du modèle."""
+        chain = self.poison_chain
+        state = self.poison_concentrations.copy()
+        state[chain.index[config.POISON_IODINE]] = self.iodine_concentration
+        state[chain.index[config.POISON_XENON]] = self.xenon_concentration
+        return state
+
+    def _set_poison_state(self, state):
+        """Enregistre le vecteur des poisons et met à jour les attributs I-135/Xe-135."""
+        chain = self.poison_chain
+        self.poison_concentrations = state
+        self.iodine_concentration = float(state[chain.index[config.POISON_IODINE]])
+        self.xenon_concentration = float(state[chain.index[config.POISON_XENON]])
 
     def update_xenon_dynamics(self, dt=None):
         """
-        Met à jour les concentrations d'Iode-135 et de Xénon-135 
-        selon les équations différentielles de Bateman en utilisant 
-        l'intégration Runge-Kutta 4 pour une meilleure précision.
+        Met à jour les concentrations des chaînes de poisons (Iode-135, Xénon-135,
+        Samarium-149, ...) selon les équations différentielles de Bateman.
+        
+        L'intégrateur est choisi par `xenon_dynamics.INTEGRATOR` dans config.json :
+        "exact" (exponentielle de matrice, un seul calcul quel que soit dt) ou "rk4".
         
         Args:
             dt: pas de temps en secondes (utilise self.time_step par défaut)
         """
         if dt is None:
             dt = self.time_step
-            
-        # Concentrations actuelles
-        y0 = np.array([self.iodine_concentration, self.xenon_concentration])
         
-        # Méthode Runge-Kutta 4
-        k1 = self._xenon_derivatives(y0, self.power_level)
-        k2 = self._xenon_derivatives(y0 + 0.5 * dt * k1, self.power_level)
-        k3 = self._xenon_derivatives(y0 + 0.5 * dt * k2, self.power_level)
-        k4 = self._xenon_derivatives(y0 + dt * k3, self.power_level)
+        if config.XENON_INTEGRATOR == "exact":
+            self._update_xenon_dynamics_exact(dt)
+        elif config.XENON_INTEGRATOR == "rk4":
+            self._update_xenon_dynamics_rk4(dt)
+        else:
+            raise ValueError(f"Intégrateur Xénon inconnu dans config.json : {config.XENON_INTEGRATOR}")
         
-        # Intégration RK4
-        y_new = y0 + (dt / 6.0) * (k1 + 2*k2 + 2*k3 + k4)
+        if config.AXIAL_XENON_ENABLED:
+            self._ensure_axial_xenon()
+            self.axial_iodine_concentration, self.axial_xenon_concentration = advance_axial_xenon(
+                self._solve_axial_flux_for_xenon, self.axial_iodine_concentration,
+                self.axial_xenon_concentration, self.power_level, dt)
         
-        # Mise à jour des concentrations
-        self.iodine_concentration, self.xenon_concentration = y_new
         self.simulation_time += dt
+
+    def _update_xenon_dynamics_exact(self, dt):
+        """
+        Avance toutes les chaînes de poisons par exponentielle de matrice
+        (exacte à puissance constante sur l'intervalle).
+        """
+        self._set_poison_state(self.poison_chain.advance(self._get_poison_state(), self.power_level, dt))
+
+    def _update_xenon_dynamics_rk4(self, dt):
+        """
+        Avance toutes les chaînes de poisons par un pas Runge-Kutta 4.
+        """
+        chain = self.poison_chain
+        y0 = self._get_poison_state()
         
-        # Assurer que les concentrations ne deviennent pas négatives
-        self.iodine_concentration = max(0, self.iodine_concentration)
-        self.xenon_concentration = max(0, self.xenon_concentration)
+        k1 = chain.derivatives(y0, self.power_level)
+        k2 = chain.derivatives(y0 + 0.5 * dt * k1, self.power_level)
+        k3 = chain.derivatives(y0 + 0.5 * dt * k2, self.power_level)
+        k4 = chain.derivatives(y0 + dt * k3, self.power_level)
+        
+        # Les concentrations restent physiquement positives
+        self._set_poison_state(np.maximum(y0 + (dt / 6.0) * (k1 + 2*k2 + 2*k3 + k4), 0.0))
 
     def get_xenon_reactivity_effect(self):
         """
@@ -347,15 +581,21 @@ class ReactorModel:
         """
         # L'antiréactivité xénon est proportionnelle à la concentration uniquement
         # Utilisation du flux nominal de référence pour le calcul de l'effet
-        xenon_absorption_rate = (config.XENON_ABSORPTION_CROSS_SECTION * 
-                               self.xenon_concentration * config.THERMAL_FLUX_NOMINAL * config.BARNS_TO_CM2)
-        
         # Conversion en pcm basée sur les données expérimentales PWR
         # Calibré pour donner ~-2750 pcm à l'équilibre à 100% Pn
-        xenon_reactivity_pcm = -xenon_absorption_rate * config.XENON_REACTIVITY_CONVERSION_FACTOR
+        xenon_reactivity_pcm = -self.xenon_concentration * config.DERIVED.xenon_reactivity_pcm_per_atom
         
         return xenon_reactivity_pcm
 
+    def get_poison_reactivity_effects(self):
+        """
+        Antiréactivité (pcm) de chaque poison absorbant de poison_chains (Xe-135, Sm-149, ...).
+        Seul le xénon intervient dans k-effectif : le samarium d'équilibre est
+        inclus dans l'absorption de base du modèle.
+        """
+        effects = self.poison_chain.reactivity_effects(self._get_poison_state())
+        return {name: float(value) for name, value in effects.items()}
+
     def advance_time(self, hours=1.0):
         """
         Fait avancer la simulation temporelle et met à jour la dynamique Xénon.
@@ -365,21 +605,186 @@ class ReactorModel:
         """
         dt_seconds = hours * config.HOURS_TO_SECONDS
         self.update_xenon_dynamics(dt_seconds)
-        # Recalcul de tous les paramètres après la mise à jour Xénon
-        self.calculate_all()
+        # Seules les grandeurs dépendant du Xénon sont recalculées
+        self.mark_dirty("xenon_concentration")
+        self.recompute()
 
-    def _update_parameter(self, param_name, value, update_temperatures=False):
+    def advance_kinetics(self, seconds, dt=None):
+        """
+        Fait évoluer la population neutronique (cinétique ponctuelle à six groupes)
+        avec la réactivité actuelle du modèle, supposée constante sur la durée.
+        
+        Args:
+            seconds: durée à simuler en secondes
+            dt: résolution de la trajectoire en secondes (config par défaut)
+            
+        Returns:
+            tuple: (temps en s, population neutronique relative) à chaque pas
+        """
+        return self.point_kinetics.advance(seconds, self.reactivity, dt)
+
+    def reset_kinetics(self, relative_power=1.0):
+        """Remet la cinétique ponctuelle à l'équilibre."""
+        self.point_kinetics.reset(relative_power)
+
+    def scram(self):
+        """Arrêt d'urgence : insertion complète des deux groupes de barres."""
+        self.rod_group_R_position = 0
+        self.rod_group_GCP_position = 0
+        self.mark_dirty("rod_group_R_position", "rod_group_GCP_position")
+        self.recompute()
+
+    def get_model_inputs(self):
+        """Retourne les entrées du modèle au format attendu par evaluate_batch."""
+        return {
+            "rod_group_R_position": self.rod_group_R_position,
+            "rod_group_GCP_position": self.rod_group_GCP_position,
+            "boron_concentration": self.boron_concentration,
+            "average_temperature": self.average_temperature,
+            "power_level": self.power_level,
+            "fuel_enrichment": self.fuel_enrichment,
+            "xenon_concentration": self.xenon_concentration,
+        }
+
+    def get_reactivity_coefficients(self):
+        """
+        Coefficients de réactivité de l'état actuel (Doppler, modérateur, puissance,
+        bore, efficacités différentielles des groupes de barres), en pcm par unité.
+        Calculés analytiquement, sans perturber le modèle.
+        """
+        coefficients = reactivity_coefficients(**self.get_model_inputs())
+        return {name: float(value) for name, value in coefficients.items()}
+
+    def find_critical_parameter(self, parameter, target_k_effective=1.0, target_reactivity=None):
+        """
+        Recherche la valeur du bore ou de la position d'un groupe de barres qui
+        donne le k-effectif (ou la réactivité) cible, les autres entrées étant
+        celles de l'état actuel. Le modèle n'est pas modifié.
+        
+        Args:
+            parameter: "boron_concentration", "rod_group_R_position" ou "rod_group_GCP_position"
+            target_k_effective: k-effectif recherché
+            target_reactivity: réactivité absolue recherchée (prioritaire si fournie)
+            
+        Returns:
+            float or None: valeur critique, ou None si la cible est hors de la plage du paramètre
+        """
+        result = find_critical(parameter, target_k_effective, target_reactivity, **self.get_model_inputs())
+        if not result["converged"]:
+            return None
+        return float(result["value"])
+
+    def find_critical_boron(self, target_k_effective=1.0):
+        """Concentration en bore critique (ppm) pour l'état actuel."""
+        return self.find_critical_parameter("boron_concentration", target_k_effective)
+
+    def find_critical_rod_position(self, group="R", target_k_effective=1.0):
+        """Position critique (%) du groupe de barres "R" ou "GCP" pour l'état actuel."""
+        return self.find_critical_parameter(f"rod_group_{group}_position", target_k_effective)
+
+    def run_depletion(self, cycle_length_days=None):
+        """
+        Calcule l'évolution du cœur sur un cycle pour l'enrichissement de recharge.
+        
+        L'enrichissement de recharge est celui du modèle, sauf si un instant du
+        cycle est déjà appliqué (l'enrichissement affiché est alors équivalent).
+        
+        Returns:
+            dict: résultat de deplete_cycle
+        """
+        if self.depletion is not None and self.cycle_time_days > 0.0:
+            reload_enrichment = self.depletion["initial_enrichment"]
+        else:
+            reload_enrichment = self.fuel_enrichment
+        self.depletion = deplete_cycle(reload_enrichment, cycle_length_days)
+        return self.depletion
+
+    def set_cycle_time(self, days):
+        """
+        Place le cœur à un instant du cycle : η (via l'enrichissement équivalent)
+        prend la valeur issue du calcul d'évolution.
+        
+        Args:
+            days: temps écoulé depuis le début du cycle (jours)
+        """
+        if self.depletion is None:
+            self.run_depletion()
+        cycle = self.depletion
+        days = float(np.clip(days, 0.0, cycle["time_days"][-1]))
+        enrichment = float(np.interp(days, cycle["time_days"], cycle["equivalent_enrichment"]))
+        self.cycle_time_days = days
+        self._update_parameter('fuel_enrichment', enrichment)
+
+    def get_boron_letdown(self):
+        """
+        Courbe de dilution du bore le long du cycle, pour les barres, la température
+        et la puissance actuelles (xénon à l'équilibre à chaque instant).
+        
+        Returns:
+            dict: résultat de boron_letdown
+        """
+        if self.depletion is None:
+            self.run_depletion()
+        inputs = self.get_model_inputs()
+        del inputs["xenon_concentration"]
+        return boron_letdown(self.depletion, **inputs)
+
+    def run_uncertainty_analysis(self, samples=None, workers=None):
+        """
+        Propage les incertitudes des coefficients de calibration sur k-effectif,
+        la réactivité et la trajectoire xénon de l'état actuel (Monte-Carlo).
+        
+        Returns:
+            dict: résultat de propagate_uncertainty
+        """
+        return propagate_uncertainty(samples=samples, workers=workers, **self.get_model_inputs())
+
+    def run_sensitivity_analysis(self, base_samples=None, workers=None):
+        """
+        Indices de Sobol de k-effectif et de l'antiréactivité xénon sur tout le
+        domaine de fonctionnement (indépendants de l'état actuel).
+        
+        Returns:
+            dict: résultat de sobol_indices
+        """
+        return sobol_indices(base_samples=base_samples, workers=workers)
+
+    def _reset_depletion(self):
+        """Revient au combustible de début de cycle (nouvel enrichissement de recharge)."""
+        self.depletion = None
+        self.cycle_time_days = 0.0
+
+    def _update_parameter(self, param_name, value):
         """Méthode générique pour mettre à jour un paramètre et recalculer le modèle
         
+        Seules les grandeurs situées en aval du paramètre dans le graphe de
+        dépendances sont recalculées (la température combustible en fait partie).
+        
         Args:
             param_name: Nom de l'attribut à mettre à jour
             value: Nouvelle valeur
-            update_temperatures: Si True, met à jour les températures avant de recalculer
         """
         setattr(self, param_name, value)
-        if update_temperatures:
-            self._update_temperatures()
-        self.calculate_all()
+        self.mark_dirty(param_name)
+        self.recompute()
+
+    def update_parameters(self, values):
+        """
+        Met à jour plusieurs paramètres de pilotage puis recalcule une seule fois.
+        
+        Args:
+            values: dictionnaire nom du paramètre -> nouvelle valeur
+                    (noms de CONTROL_PARAMETERS)
+        """
+        unknown = set(values) - set(CONTROL_PARAMETERS)
+        if unknown:
+            raise KeyError(f"Paramètres de pilotage inconnus : {', '.join(sorted(unknown))}")
+        if "fuel_enrichment" in values:
+            self._reset_depletion()
+        for param_name, value in values.items():
+            setattr(self, param_name, value)
+        self.mark_dirty(*values)
+        self.recompute()
 
     def update_rod_group_R_position(self, position):
         """Update R group position and recalculate"""
@@ -394,7 +799,8 @@ class ReactorModel:
         # Maintenant position est directement en pourcentage (0-100%)
         self.rod_group_R_position = position
         self.rod_group_GCP_position = position
-        self.calculate_all()
+        self.mark_dirty("rod_group_R_position", "rod_group_GCP_position")
+        self.recompute()
     
     def update_boron_concentration(self, concentration):
         """Update boron concentration and recalculate"""
@@ -402,76 +808,86 @@ class ReactorModel:
     
     def update_average_temperature(self, temperature):
         """Update moderator temperature and recalculate"""
-        self._update_parameter('average_temperature', temperature, update_temperatures=True)
+        self._update_parameter('average_temperature', temperature)
     
     def update_power_level(self, power_level):
         """Update power level and recalculate"""
-        self._update_parameter('power_level', power_level, update_temperatures=True)
+        self._update_parameter('power_level', power_level)
     
     def update_fuel_enrichment(self, enrichment):
         """Update fuel enrichment and recalculate"""
+        self._reset_depletion()
         self._update_parameter('fuel_enrichment', enrichment)
     
-    def get_axial_flux_distribution(self):
-        """
-        Calculate axial flux distribution based on control rod position
-        Returns array of values representing flux at different heights
+    def solve_axial_flux(self):
         """
-        # Simple cosine shape with depression at top if control rods inserted
-        points = 100
-        height = np.linspace(0, 1, points)
-        
-        # Base cosine shape
-        flux = np.cos(np.pi * (height - 0.5))
-        
-        # Control rod effect (simplified)
-        # Nouvelle convention: 0% = insérées, 100% = retirées
-        if self._get_equivalent_rod_position_percent() > 0 and self._get_equivalent_rod_position_percent() < 100:
-            rod_withdrawal_fraction = self._get_equivalent_rod_position_percent() / config.PERCENT_TO_FRACTION  # Fraction de retrait
-            rod_insertion_depth = 1.0 - rod_withdrawal_fraction  # Profondeur d'insertion réelle
-            rod_insertion_point = 1 - rod_insertion_depth  # Position des pointes des barres
-            
-            # Calculer l'effet des barres avec atténuation progressive aux fortes insertions
-            rod_effect = np.ones_like(height)
-            
-            # Zone affectée par les barres (au-dessus de leur position)
-            affected_zone = height > rod_insertion_point
-            
-            if np.any(affected_zone):
-                # Distance normalisée par rapport aux barres
-                distance_from_rods = height - rod_insertion_point
-                distance_from_rods[~affected_zone] = 0
-                
-                # Effet d'écrasement avec atténuation progressive et fluide
-                # Transition fluide commençant vers 85% d'insertion (donc 15% de retrait)
-                if rod_insertion_depth > 0.85:
-                    # Fonction de transition en S (sigmoïde) pour une fluidité maximale
-                    # Transformation pour avoir une transition de 85% à 100% d'insertion
-                    relative_depth = (rod_insertion_depth - 0.85) / 0.15  # Normalise 0.85-1.0 vers 0-1
-                    
-                    # Fonction sigmoïde inverse pour transition fluide
-                    # À 85% d'insertion : attenuation_factor ≈ 1.0 (effet complet)
-                    # À 100% d'insertion : attenuation_factor = 0.0 (aucun effet)
-                    # Transition en forme de S pour fluidité maximale
-                    sigmoid_factor = 1.0 / (1.0 + np.exp(-12 * (relative_depth - 0.5)))
-                    attenuation_factor = 1.0 - sigmoid_factor
-                    
-                    effect_coeff = config.CONTROL_ROD_EFFECT_COEFF * attenuation_factor
-                else:
-                    effect_coeff = config.CONTROL_ROD_EFFECT_COEFF
-                
-                # Application de l'effet gaussien atténué
-                if effect_coeff > 0:
-                    rod_effect[affected_zone] = np.exp(-effect_coeff * distance_from_rods[affected_zone]**2)
-            
-            flux = flux * rod_effect
+        Résout la diffusion axiale à deux groupes pour l'état actuel, avec la
+        distribution nodale du xénon si le modèle axial est actif (sans la
+        modifier : elle est initialisée par recompute()).
         
-        # À 0% (100% insertion) ou 100% (0% insertion), le flux reste parfaitement symétrique (cosinus pur)
+        Returns:
+            dict: résultat de AxialDiffusionSolver.solve (tableaux réutilisés par le solveur)
+        """
+        return self._solve_axial_flux_for_xenon(self.axial_xenon_concentration)
+
+    def _solve_axial_flux_for_xenon(self, axial_xenon=None):
+        """
+        Résout la diffusion axiale pour une distribution de xénon donnée par maille
+        (None : xénon uniforme du modèle ponctuel).
+        """
+        derived = config.DERIVED
+        rod_ratio = config.F_CONTROL_ROD_WORTH
+        absorption_ratio = self._calculate_f_base_absorption() + self._calculate_f_boron_absorption()
+        if axial_xenon is None:
+            absorption_ratio += self._calculate_f_xenon_absorption()
+            extra_absorption = None
+        else:
+            extra_absorption = xenon_absorption_ratios(axial_xenon, self.eta)
+        return self.axial_solver.solve(
+            fission_yield=self.eta * self.epsilon,
+            resonance_escape=self.p,
+            absorption_ratio=absorption_ratio,
+            rod_absorption=(
+                (rod_ratio * derived.rod_worth_R, (100 - self.rod_group_R_position) / 100),
+                (rod_ratio * derived.rod_worth_GCP, (100 - self.rod_group_GCP_position) / 100),
+            ),
+            density_ratio=self._get_moderator_density_ratio(),
+            extra_absorption=extra_absorption,
+        )
+
+    def solve_rz_flux(self):
+        """
+        Résout la diffusion à deux groupes en r-z pour l'état actuel (xénon uniforme).
         
-        # Normalize
-        flux = flux / np.max(flux)
+        Returns:
+            dict: résultat de RZDiffusionSolver.solve
+        """
+        if self.rz_solver is None:
+            self.rz_solver = RZDiffusionSolver()
+        derived = config.DERIVED
+        rod_ratio = config.F_CONTROL_ROD_WORTH
+        return self.rz_solver.solve(
+            fission_yield=self.eta * self.epsilon,
+            resonance_escape=self.p,
+            absorption_ratio=(self._calculate_f_base_absorption() +
+                              self._calculate_f_boron_absorption() +
+                              self._calculate_f_xenon_absorption()),
+            rod_insertions={
+                "rod_group_R": (rod_ratio * derived.rod_worth_R, (100 - self.rod_group_R_position) / 100),
+                "rod_group_GCP": (rod_ratio * derived.rod_worth_GCP, (100 - self.rod_group_GCP_position) / 100),
+            },
+            density_ratio=self._get_moderator_density_ratio(),
+        )
+
+    def get_axial_flux_distribution(self):
+        """
+        Distribution axiale du flux thermique, issue du solveur de diffusion à deux groupes.
         
-        return height, flux
+        Returns:
+            tuple: (hauteurs relatives, flux relatif au maximum)
+        """
+        result = self.solve_axial_flux()
+        return result["heights"], result["flux"]
     
     def get_four_factors_data(self):
         """Get data for the four factors visualization"""
@@ -617,7 +1033,45 @@ class ReactorModel:
             "iodine_concentration": self.iodine_concentration,
             "xenon_concentration": self.xenon_concentration,
             "xenon_reactivity_pcm": self.get_xenon_reactivity_effect(),
-            "power_level": self.power_level
+            "poison_concentrations": dict(zip(self.poison_chain.names, self._get_poison_state().tolist())),
+            "poison_reactivity_pcm": self.get_poison_reactivity_effects(),
+            "power_level": self.power_level,
+            **self.get_axial_offsets(),
+        }
+    
+    def get_axial_offsets(self):
+        """
+        Déséquilibres axiaux du flux et du xénon (scalaires, sans les profils par maille).
+        
+        Returns:
+            dict: "flux_axial_offset" et "xenon_axial_offset" (None si le modèle axial est désactivé)
+        """
+        if not config.AXIAL_XENON_ENABLED:
+            return {"flux_axial_offset": None, "xenon_axial_offset": None}
+        return {
+            "flux_axial_offset": self.solve_axial_flux()["axial_offset"],
+            "xenon_axial_offset": axial_offset(self.axial_xenon_concentration),
+        }
+    
+    def get_axial_xenon_data(self):
+        """
+        Données du modèle nodal axial : concentrations I-135/Xe-135 et flux relatif par maille.
+        
+        Returns:
+            dict: hauteurs relatives, tableaux par maille, déséquilibres axiaux et temps (h),
+                ou None si le modèle axial est désactivé
+        """
+        if not config.AXIAL_XENON_ENABLED:
+            return None
+        result = self.solve_axial_flux()
+        return {
+            "time_hours": self.simulation_time / config.HOURS_TO_SECONDS,
+            "heights": result["heights"],
+            "iodine_concentration": self.axial_iodine_concentration,
+            "xenon_concentration": self.axial_xenon_concentration,
+            "flux": result["flux"],
+            "flux_axial_offset": result["axial_offset"],
+            "xenon_axial_offset": axial_offset(self.axial_xenon_concentration),
         }
     
     def apply_preset(self, preset_name):
@@ -633,13 +1087,20 @@ class ReactorModel:
         self.average_temperature = preset.average_temperature
         self.fuel_enrichment = preset.fuel_enrichment
         self.power_level = preset.power_level
+        self._reset_depletion()
         
         # Appliquer les états temporels si disponibles
         if preset.iodine_concentration is not None:
             self.iodine_concentration = preset.iodine_concentration
         
         if preset.xenon_concentration is not None:
+            # Autres poisons des chaînes (Pm-149/Sm-149, ...) à l'équilibre de la puissance
+            # du preset ; I-135/Xe-135 repris du preset
+            iodine = self.iodine_concentration
+            self._set_poison_state(self.poison_chain.equilibrium(self.power_level, self._get_poison_state()))
+            self.iodine_concentration = iodine
             self.xenon_concentration = preset.xenon_concentration
+            self._reset_axial_xenon()
         else:
             # Si pas de concentration Xénon spécifiée, calculer l'équilibre
             self.calculate_xenon_equilibrium()
@@ -785,11 +1246,9 @@ class ReactorModel:
         gcp_insertion_fraction = (100 - self.rod_group_GCP_position) / 100
         
         # Calcul des contributions pondérées
-        r_worth = config.parameters_config['rod_group_R']['worth_fraction']
-        gcp_worth = config.parameters_config['rod_group_GCP']['worth_fraction']
-        
-        total_worth_fraction = (r_insertion_fraction * r_worth + 
-                               gcp_insertion_fraction * gcp_worth)
+        derived = config.DERIVED
+        total_worth_fraction = (r_insertion_fraction * derived.rod_worth_R + 
+                               gcp_insertion_fraction * derived.rod_worth_GCP)
         
         return total_worth_fraction
 
@@ -802,4 +1261,17 @@ class ReactorModel:
             float: Position équivalente en % (0-100, où 0% = inséré, 100% = extrait)
         """
         total_insertion_fraction = self._get_total_rod_worth_fraction()
-        return (1.0 - total_insertion_fraction) * 100.0
\ No newline at end of file
+        return (1.0 - total_insertion_fraction) * 100.0
+
+
+# Paramètres de pilotage modifiables depuis l'interface (voir update_parameters)
+CONTROL_PARAMETERS = (
+    "rod_group_R_position", "rod_group_GCP_position", "boron_concentration",
+    "average_temperature", "fuel_enrichment", "power_level"
+)
+
+# Grandeurs en aval de chaque nœud du graphe (entrées comprises), précalculées une fois
+_DOWNSTREAM_QUANTITIES = {
+    name: frozenset(ReactorModel.get_downstream_quantities(name))
+    for name in set(ReactorModel._DEPENDENCIES).union(*ReactorModel._DEPENDENCIES.values())
+}
@@ -0,0 +1,220 @@
+"""
+Table de réponse précalculée de k-effectif, projetée en mémoire
+
+Mode optionnel destiné aux postes peu puissants : k-effectif, la réactivité et
+les six facteurs sont précalculés une fois sur une grille régulière en
+(R, GCP, bore, température, puissance, xénon), à l'enrichissement de l'état par
+défaut. La table est stockée dans un fichier .npy dont le nom dérive du hachage
+de config.json, puis ouverte en projection mémoire (`mmap_mode='r'`) : plusieurs
+processus partagent ainsi les mêmes pages sans copie. Les requêtes sont
+résolues par interpolation multilinéaire sur les 2^6 sommets de la maille.
+"""
+import itertools
+import os
+from pathlib import Path
+
+import numpy as np
+
+from . import config
+from .batch_evaluation import evaluate_batch, _resolve_inputs
+
+# Axes de la grille -> entrée de parameters_config donnant la plage (le xénon a sa propre plage)
+RESPONSE_SURFACE_AXES = {
+    "rod_group_R_position": "rod_group_R",
+    "rod_group_GCP_position": "rod_group_GCP",
+    "boron_concentration": "boron",
+    "average_temperature": "moderator_temp",
+    "power_level": "power_level",
+    "xenon_concentration": None,
+}
+
+# Grandeurs tabulées, dans l'ordre du dernier axe de la table
+RESPONSE_SURFACE_OUTPUTS = (
+    "eta",
+    "epsilon",
+    "p",
+    "f",
+    "fast_non_leakage_prob",
+    "thermal_non_leakage_prob",
+    "k_effective",
+    "reactivity",
+)
+
+# Simple précision : divise par deux la mémoire projetée, erreur d'arrondi ~0.01 pcm
+_TABLE_DTYPE = np.float32
+
+# Nombre d'états évalués par bloc lors de la construction de la table
+_BUILD_CHUNK_SIZE = 65536
+
+# Nombre d'états interpolés par bloc (limite la mémoire des 2^6 sommets rassemblés)
+_INTERPOLATION_CHUNK_SIZE = 16384
+
+
+def grid_axes():
+    """Retourne les vecteurs de la grille (un tableau par axe), tels que définis par config.json."""
+    axes = {}
+    for name, parameter in RESPONSE_SURFACE_AXES.items():
+        if parameter is None:
+            low, high = config.RESPONSE_SURFACE_XENON_RANGE
+        else:
+            low, high = config.parameters_config[parameter]['range']
+        axes[name] = np.linspace(float(low), float(high), int(config.RESPONSE_SURFACE_GRID_POINTS[name]))
+    return axes
+
+
+def table_path(directory=None):
+    """Chemin du fichier de table associé à la configuration courante."""
+    if directory is None:
+        directory = config.get_project_root() / config.RESPONSE_SURFACE_DIRECTORY
+    return Path(directory) / f"keff_response_{config.DERIVED.config_hash[:16]}.npy"
+
+
+def build_table(path, axes, fuel_enrichment):
+    """
+    Évalue le modèle sur toute la grille et écrit la table dans `path`.
+
+    La table est d'abord écrite dans un fichier temporaire puis renommée, de sorte
+    qu'un autre processus ne voie jamais une table partiellement remplie.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    shape = tuple(len(axis) for axis in axes.values())
+    temporary = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npy")
+
+    table = np.lib.format.open_memmap(temporary, mode='w+', dtype=_TABLE_DTYPE,
+                                      shape=shape + (len(RESPONSE_SURFACE_OUTPUTS),))
+    flat = table.reshape(-1, len(RESPONSE_SURFACE_OUTPUTS))
+    total = flat.shape[0]
+    for start in range(0, total, _BUILD_CHUNK_SIZE):
+        indices = np.unravel_index(np.arange(start, min(start + _BUILD_CHUNK_SIZE, total)), shape)
+        inputs = {name: axis[index] for (name, axis), index in zip(axes.items(), indices)}
+        results = evaluate_batch(fuel_enrichment=fuel_enrichment, **inputs)
+        flat[start:start + len(indices[0])] = np.stack(
+            [results[name] for name in RESPONSE_SURFACE_OUTPUTS], axis=-1)
+    table.flush()
+    del flat, table
+    os.replace(temporary, path)
+
+
+class ResponseSurface:
+    """
+    Table de réponse projetée en mémoire et interpolation multilinéaire associée.
+
+    Valable uniquement à l'enrichissement de construction ; `covers` indique
+    quels états sont dans le domaine de la table.
+    """
+
+    def __init__(self, table, axes, fuel_enrichment, path=None):
+        self.table = table
+        self.axes = axes
+        self.fuel_enrichment = fuel_enrichment
+        self.path = path
+        self._lower = np.array([axis[0] for axis in axes.values()])
+        self._upper = np.array([axis[-1] for axis in axes.values()])
+        self._steps = np.array([axis[1] - axis[0] for axis in axes.values()])
+        self._sizes = np.array([len(axis) for axis in axes.values()])
+
+        # Sommets d'une maille : décalages dans la table aplatie
+        self._flat_table = np.asarray(table).reshape(-1, table.shape[-1])
+        corners = np.array(list(itertools.product((0, 1), repeat=len(axes))), dtype=np.intp)
+        self._row_strides = np.cumprod(np.concatenate(([1], self._sizes[:0:-1])))[::-1]
+        self._corner_offsets = corners @ self._row_strides
+
+    @classmethod
+    def load_or_build(cls, directory=None, rebuild=False):
+        """
+        Ouvre la table de la configuration courante, en la construisant si elle
+        n'existe pas (ou si sa forme ne correspond plus à la grille).
+
+        Args:
+            directory: répertoire des tables (RESPONSE_SURFACE_DIRECTORY par défaut)
+            rebuild: force la reconstruction de la table
+        """
+        axes = grid_axes()
+        fuel_enrichment = float(config.default_state["fuel_enrichment"])
+        path = table_path(directory)
+        expected_shape = tuple(len(axis) for axis in axes.values()) + (len(RESPONSE_SURFACE_OUTPUTS),)
+
+        table = None
+        if path.exists() and not rebuild:
+            table = np.load(path, mmap_mode='r')
+            if table.shape != expected_shape or table.dtype != _TABLE_DTYPE:
+                table = None
+        if table is None:
+            build_table(path, axes, fuel_enrichment)
+            table = np.load(path, mmap_mode='r')
+        return cls(table, axes, fuel_enrichment, path)
+
+    def covers(self, states=None, **inputs):
+        """Indique, pour chaque état, s'il est dans le domaine de la table."""
+        values = _resolve_inputs(states, inputs)
+        inside = np.isclose(values["fuel_enrichment"], self.fuel_enrichment, rtol=0.0, atol=1e-9)
+        for lower, upper, name in zip(self._lower, self._upper, self.axes):
+            inside = inside & (values[name] >= lower) & (values[name] <= upper)
+        return inside
+
+    def interpolate(self, states=None, **inputs):
+        """
+        Interpole les grandeurs tabulées pour un lot d'états.
+
+        Les entrées hors de la grille sont ramenées sur sa frontière et
+        l'enrichissement est ignoré : utiliser `covers` pour vérifier le domaine.
+
+        Args:
+            states, **inputs: comme pour evaluate_batch
+
+        Returns:
+            dict: tableaux NumPy pour chaque nom de RESPONSE_SURFACE_OUTPUTS
+        """
+        values = _resolve_inputs(states, inputs)
+        shape = np.broadcast_shapes(*(values[name].shape for name in self.axes))
+        coordinates = np.stack([np.broadcast_to(values[name], shape).ravel() for name in self.axes], axis=-1)
+
+        # Maille contenant chaque point et position relative dans la maille
+        position = np.clip((coordinates - self._lower) / self._steps, 0.0, self._sizes - 1)
+        cell = np.minimum(position.astype(np.intp), self._sizes - 2)
+        fraction = position - cell
+
+        base = cell @ self._row_strides
+        result = np.empty((coordinates.shape[0], len(RESPONSE_SURFACE_OUTPUTS)))
+        for start in range(0, coordinates.shape[0], _INTERPOLATION_CHUNK_SIZE):
+            block = slice(start, start + _INTERPOLATION_CHUNK_SIZE)
+            # Poids des 2^d sommets : produit tensoriel des poids linéaires (1 - t, t) de chaque axe,
+            # dans l'ordre de itertools.product utilisé pour les décalages des sommets
+            weights = np.ones((fraction[block].shape[0], 1))
+            for t in fraction[block].T:
+                weights = (weights[:, :, None] * np.stack((1.0 - t, t), axis=-1)[:, None, :]).reshape(len(t), -1)
+            corners = np.take(self._flat_table, base[block, None] + self._corner_offsets, axis=0)
+            result[block] = np.einsum('nc,nco->no', weights, corners)
+        return {name: result[:, index].reshape(shape) for index, name in enumerate(RESPONSE_SURFACE_OUTPUTS)}
+
+    def error_report(self, samples=None, seed=0):
+        """
+        Compare la table au modèle analytique sur des états tirés uniformément dans la grille.
+
+        Args:
+            samples: nombre d'états tirés (RESPONSE_SURFACE_ERROR_SAMPLES par défaut)
+            seed: graine du générateur aléatoire
+
+        Returns:
+            dict: pour chaque grandeur, erreurs absolues "max", "mean" et "rms"
+                (la réactivité est exprimée en pcm), plus "samples"
+        """
+        samples = config.RESPONSE_SURFACE_ERROR_SAMPLES if samples is None else int(samples)
+        rng = np.random.default_rng(seed)
+        inputs = {name: rng.uniform(lower, upper, samples)
+                  for name, lower, upper in zip(self.axes, self._lower, self._upper)}
+        interpolated = self.interpolate(fuel_enrichment=self.fuel_enrichment, **inputs)
+        reference = evaluate_batch(fuel_enrichment=self.fuel_enrichment, **inputs)
+
+        report = {"samples": samples}
+        for name in RESPONSE_SURFACE_OUTPUTS:
+            error = np.abs(interpolated[name] - reference[name])
+            if name == "reactivity":
+                error = error * config.REACTIVITY_TO_PCM
+            report[name] = {
+                "max": float(error.max()),
+                "mean": float(error.mean()),
+                "rms": float(np.sqrt(np.mean(error**2))),
+            }
+        return report
@@ -0,0 +1,184 @@
+"""
+Diffusion à deux groupes en géométrie cylindrique r-z
+
+Extension bidimensionnelle du solveur axial (`axial_diffusion`) : mêmes
+constantes exprimées par absorption dans le combustible, mais le flux dépend
+du rayon et de la hauteur. Les opérateurs sont assemblés en volumes finis
+(matrices creuses `scipy.sparse`) :
+
+    M1 φ1 = S / k                    S = η ε V φ2 (source de fission)
+    M2 φ2 = p Σr1 V φ1
+
+Les groupes de barres sont placés dans des couronnes radiales configurables ;
+leur absorption y est concentrée de sorte que la moyenne sur le cœur reste
+celle du modèle à quatre facteurs.
+
+La valeur propre dominante de l'opérateur de génération S -> η ε V M2⁻¹ p Σr1 V M1⁻¹ S
+est obtenue par itération de Krylov (Arnoldi, `scipy.sparse.linalg.eigs`)
+démarrée sur la source de la résolution précédente. M1 ne dépend que de la
+température et sa factorisation LU est conservée ; M2 (barres, bore, xénon)
+est refactorisée à chaque résolution.
+"""
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import LinearOperator, eigs, splu
+
+from . import config
+
+# Groupes de barres -> entrée de parameters_config (poids relatif du groupe)
+_ROD_GROUPS = ("rod_group_R", "rod_group_GCP")
+
+
+class RZDiffusionSolver:
+    """
+    Solveur de valeur propre de la diffusion à deux groupes en r-z.
+
+    Les inconnues sont ordonnées par hauteur puis par rayon : l'indice de la
+    maille (j, i) est j * radial_points + i.
+    """
+
+    def __init__(self, radial_points=None, axial_points=None):
+        self.radial_points = config.RZ_RADIAL_MESH_POINTS if radial_points is None else int(radial_points)
+        self.axial_points = config.RZ_AXIAL_MESH_POINTS if axial_points is None else int(axial_points)
+        if self.radial_points < 3 or self.axial_points < 3:
+            raise ValueError("Le maillage r-z doit comporter au moins 3 mailles dans chaque direction")
+        self.tolerance = config.RZ_DIFFUSION_TOLERANCE
+
+        nr, nz = self.radial_points, self.axial_points
+        radius = config.CORE_DIAMETER_M / 2.0
+        self.dr = radius / nr
+        self.dz = config.CORE_HEIGHT_M / nz
+
+        # Centres (relatifs) et faces des mailles
+        self.radii = (np.arange(nr) + 0.5) / nr
+        self.heights = (np.arange(nz) + 0.5) / nz
+        faces = np.arange(nr + 1) * self.dr
+        ring_areas = np.pi * (faces[1:]**2 - faces[:-1]**2)
+        self.volumes = np.tile(ring_areas * self.dz, nz)
+
+        # Géométrie des couplages : (indices, voisins, surface / distance) pour chaque face interne,
+        # puis terme de bord des faces à flux nul (demi-maille jusqu'à la face)
+        index = np.arange(nr * nz).reshape(nz, nr)
+        radial_coupling = np.broadcast_to(2.0 * np.pi * faces[1:-1] * self.dz / self.dr, (nz, nr - 1))
+        axial_coupling = np.broadcast_to(ring_areas / self.dz, (nz - 1, nr))
+        self._pairs = (
+            np.concatenate([index[:, :-1].ravel(), index[:-1, :].ravel()]),
+            np.concatenate([index[:, 1:].ravel(), index[1:, :].ravel()]),
+            np.concatenate([radial_coupling.ravel(), axial_coupling.ravel()]),
+        )
+        boundary = np.zeros((nz, nr))
+        boundary[:, -1] += 2.0 * np.pi * faces[-1] * self.dz / (0.5 * self.dr)  # bord radial
+        boundary[0, :] += ring_areas / (0.5 * self.dz)                          # bas du cœur
+        boundary[-1, :] += ring_areas / (0.5 * self.dz)                         # haut du cœur
+        self._boundary = boundary.ravel()
+
+        # Couronnes radiales des groupes de barres et fraction de surface correspondante
+        self._rod_zones = {}
+        for group in _ROD_GROUPS:
+            inner, outer = config.RZ_ROD_RADIAL_ZONES[group]
+            mask = (self.radii >= inner) & (self.radii < outer)
+            if not mask.any():
+                raise ValueError(f"La couronne radiale du groupe {group} ne contient aucune maille")
+            area_fraction = ring_areas[mask].sum() / ring_areas.sum()
+            self._rod_zones[group] = (np.tile(mask, nz), area_fraction)
+
+        self._fast_lu = None
+        self._fast_key = None
+        self._source = None
+        self.k_effective = None
+        self.operator_applications = 0
+
+    def reset(self):
+        """Oublie la solution précédente (la prochaine résolution part d'une source plate)."""
+        self._source = None
+        self.k_effective = None
+
+    def _diffusion_matrix(self, diffusion, removal):
+        """Assemble -∇·D∇ + Σ (intégré sur les volumes) au format CSC."""
+        rows, cols, coupling = self._pairs
+        weights = diffusion * coupling
+        n = self.volumes.size
+        diagonal = removal * self.volumes + diffusion * self._boundary
+        diagonal = diagonal + np.bincount(rows, weights, n) + np.bincount(cols, weights, n)
+        matrix = sp.coo_matrix(
+            (np.concatenate([diagonal, -weights, -weights]),
+             (np.concatenate([np.arange(n), rows, cols]), np.concatenate([np.arange(n), cols, rows]))),
+            shape=(n, n))
+        return matrix.tocsc()
+
+    def _absorption_map(self, absorption_ratio, rod_insertions):
+        """Rapport d'absorption non-combustible par maille, barres comprises."""
+        absorption = np.full(self.volumes.size, float(absorption_ratio))
+        height_index = np.repeat(np.arange(self.axial_points), self.radial_points)
+        for group, (zone, area_fraction) in self._rod_zones.items():
+            ratio, insertion = rod_insertions[group]
+            # Partie insérée de chaque maille (les barres entrent par le haut)
+            tip = (1.0 - insertion) * self.axial_points
+            rodded = np.clip(height_index + 1 - tip, 0.0, 1.0)
+            absorption += np.where(zone, ratio / area_fraction, 0.0) * rodded
+        return absorption
+
+    def solve(self, fission_yield, resonance_escape, absorption_ratio, rod_insertions, density_ratio=1.0):
+        """
+        Calcule le mode fondamental r-z.
+
+        Args:
+            fission_yield: η·ε
+            resonance_escape: probabilité p d'échapper aux résonances
+            absorption_ratio: rapport d'absorption non-combustible uniforme (hors barres)
+            rod_insertions: {groupe: (rapport d'absorption du groupe entièrement inséré,
+                fraction insérée depuis le haut)} pour "rod_group_R" et "rod_group_GCP"
+            density_ratio: rapport de densité du modérateur
+
+        Returns:
+            dict: "radii", "heights" (relatifs), "power" (carte Nz x Nr, moyenne
+                volumique 1), "radial_power", "axial_power", "k_effective",
+                "peaking_factor" et "operator_applications"
+        """
+        absorption = self._absorption_map(absorption_ratio, rod_insertions)
+        mean_absorption = np.average(absorption, weights=self.volumes)
+
+        fast_diffusion = config.FAST_DIFFUSION_AREA_M2 * density_ratio**2
+        thermal_diffusion = config.THERMAL_DIFFUSION_AREA_M2 * density_ratio**2 * (1.0 + mean_absorption)
+
+        # M1 ne dépend que de la température : sa factorisation est réutilisée
+        if self._fast_key != fast_diffusion:
+            self._fast_lu = splu(self._diffusion_matrix(fast_diffusion, 1.0))
+            self._fast_key = fast_diffusion
+        fast_lu = self._fast_lu
+        thermal_lu = splu(self._diffusion_matrix(thermal_diffusion, 1.0 + absorption))
+
+        slowing_down = resonance_escape * self.volumes
+        fission = fission_yield * self.volumes
+
+        def next_generation(source):
+            self.operator_applications += 1
+            return fission * thermal_lu.solve(slowing_down * fast_lu.solve(source))
+
+        n = self.volumes.size
+        self.operator_applications = 0
+        operator = LinearOperator((n, n), matvec=next_generation, dtype=float)
+        start = self._source if self._source is not None else self.volumes.copy()
+        values, vectors = eigs(operator, k=1, which='LM', v0=start, tol=self.tolerance)
+
+        k = float(values[0].real)
+        source = np.abs(vectors[:, 0].real)
+        source *= n / source.sum()
+        self._source = source
+        self.k_effective = k
+
+        # Puissance ∝ source de fission par unité de volume, normalisée à une moyenne volumique de 1
+        density = source / self.volumes
+        power = density / np.average(density, weights=self.volumes)
+        power_map = power.reshape(self.axial_points, self.radial_points)
+        ring_volumes = self.volumes[:self.radial_points]
+        return {
+            "radii": self.radii,
+            "heights": self.heights,
+            "power": power_map,
+            "radial_power": power_map.mean(axis=0),
+            "axial_power": power_map @ ring_volumes / ring_volumes.sum(),
+            "k_effective": k,
+            "peaking_factor": float(power.max()),
+            "operator_applications": self.operator_applications,
+        }
@@ -0,0 +1,356 @@
+"""
+Scénarios chronologiques sans interface graphique
+
+Un scénario est un fichier JSON qui décrit un état initial (preset et/ou
+valeurs des paramètres), une durée et une liste d'actions d'opérateur datées :
+
+    {
+        "name": "Baisse de charge",
+        "preset": "PMD en début de cycle",
+        "initial_state": {"power_level": 100.0},
+        "duration_hours": 24.0,
+        "record_interval_hours": 0.5,
+        "actions": [
+            {"time_hours": 2.0, "action": "ramp", "parameter": "power_level", "value": 50.0,
+             "duration_hours": 1.0},
+            {"time_hours": 10.0, "action": "find_critical", "parameter": "boron_concentration"},
+            {"time_hours": 16.0, "action": "set", "parameter": "rod_group_R_position", "value": 80.0},
+            {"time_hours": 20.0, "action": "trip"}
+        ]
+    }
+
+Les actions sont exécutées par un moteur à événements discrets
+(`ScenarioEngine`) : file de priorité des actions datées, intégration du xénon
+coupée exactement aux dates des actions et des enregistrements. Une rampe est
+découpée en paliers de `ramp_step_hours` (SCENARIO_RAMP_STEP_HOURS par défaut).
+Le déroulement est aussi rapide que possible, ou cadencé sur l'horloge murale
+avec un facteur d'accélération.
+
+Le scénario pilote directement un `ReactorModel` : aucun module Qt ni
+matplotlib n'est importé.
+"""
+import heapq
+import itertools
+import json
+import math
+import time
+from pathlib import Path
+
+import numpy as np
+
+from . import config
+from .reactor_model import ReactorModel
+from .criticality_search import SEARCH_PARAMETERS
+
+# Paramètre modifiable par l'action "set" -> méthode de ReactorModel
+SCENARIO_SETTERS = {
+    "rod_group_R_position": "update_rod_group_R_position",
+    "rod_group_GCP_position": "update_rod_group_GCP_position",
+    "boron_concentration": "update_boron_concentration",
+    "average_temperature": "update_average_temperature",
+    "power_level": "update_power_level",
+    "fuel_enrichment": "update_fuel_enrichment",
+}
+
+# Paramètre modifiable -> entrée de parameters_config donnant sa plage admissible
+SCENARIO_PARAMETER_RANGES = {
+    "rod_group_R_position": "rod_group_R",
+    "rod_group_GCP_position": "rod_group_GCP",
+    "boron_concentration": "boron",
+    "average_temperature": "moderator_temp",
+    "power_level": "power_level",
+    "fuel_enrichment": "fuel_enrichment",
+}
+
+# Actions reconnues et champs obligatoires (en plus de "time_hours" et "action")
+SCENARIO_ACTIONS = {
+    "set": ("parameter", "value"),
+    "ramp": ("parameter", "value", "duration_hours"),
+    "preset": ("preset",),
+    "scram": (),
+    "trip": (),
+    "xenon_equilibrium": (),
+    "find_critical": ("parameter",),
+    "cycle_time": ("days",),
+}
+
+# Grandeurs enregistrables -> lecture sur le modèle
+RECORDABLE_QUANTITIES = {
+    "rod_group_R_position": lambda model: model.rod_group_R_position,
+    "rod_group_GCP_position": lambda model: model.rod_group_GCP_position,
+    "boron_concentration": lambda model: model.boron_concentration,
+    "average_temperature": lambda model: model.average_temperature,
+    "fuel_temperature": lambda model: model.fuel_temperature,
+    "power_level": lambda model: model.power_level,
+    "fuel_enrichment": lambda model: model.fuel_enrichment,
+    "k_infinite": lambda model: model.k_infinite,
+    "k_effective": lambda model: model.k_effective,
+    "reactivity_pcm": lambda model: model.reactivity * config.REACTIVITY_TO_PCM,
+    "iodine_concentration": lambda model: model.iodine_concentration,
+    "xenon_concentration": lambda model: model.xenon_concentration,
+    "xenon_reactivity_pcm": lambda model: model.get_xenon_reactivity_effect(),
+}
+
+# Tolérance sur les dates (heures) pour regrouper actions et enregistrements
+_TIME_TOLERANCE = 1e-9
+
+
+class ScenarioError(ValueError):
+    """Fichier de scénario invalide."""
+
+
+def _number(value, context):
+    """Valeur numérique finie d'un champ du scénario, ScenarioError sinon."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+        raise ScenarioError(f"{context} : valeur numérique attendue, reçu {value!r}")
+    return float(value)
+
+
+def _parameter_value(parameter, value, context):
+    """Valeur d'un paramètre de fonctionnement, vérifiée dans sa plage de parameters_config."""
+    value = _number(value, context)
+    low, high = config.parameters_config[SCENARIO_PARAMETER_RANGES[parameter]]['range']
+    if not low <= value <= high:
+        raise ScenarioError(f"{context} : {parameter} = {value} hors de la plage [{low}, {high}]")
+    return value
+
+
+def validate_scenario(scenario):
+    """
+    Vérifie la structure d'un scénario et complète les valeurs par défaut.
+
+    Args:
+        scenario: dictionnaire lu depuis un fichier de scénario
+
+    Returns:
+        dict: scénario complété ("record_interval_hours", "ramp_step_hours",
+            "recorded_quantities", "initial_state", "actions" triées par date)
+    """
+    if "duration_hours" not in scenario:
+        raise ScenarioError("Le scénario doit indiquer sa durée ('duration_hours')")
+    duration = _number(scenario["duration_hours"], "duration_hours")
+    interval = _number(scenario.get("record_interval_hours", config.SCENARIO_RECORD_INTERVAL_HOURS),
+                       "record_interval_hours")
+    ramp_step = _number(scenario.get("ramp_step_hours", config.SCENARIO_RAMP_STEP_HOURS), "ramp_step_hours")
+    if duration < 0.0 or interval <= 0.0 or ramp_step <= 0.0:
+        raise ScenarioError("La durée doit être positive, l'intervalle d'enregistrement et le pas "
+                            "des rampes strictement positifs")
+
+    quantities = tuple(scenario.get("recorded_quantities", config.SCENARIO_RECORDED_QUANTITIES))
+    unknown = set(quantities) - set(RECORDABLE_QUANTITIES)
+    if unknown:
+        raise ScenarioError(f"Grandeurs non enregistrables : {sorted(unknown)} "
+                            f"(valeurs possibles : {', '.join(RECORDABLE_QUANTITIES)})")
+
+    initial_state = dict(scenario.get("initial_state", {}))
+    unknown = set(initial_state) - set(SCENARIO_SETTERS)
+    if unknown:
+        raise ScenarioError(f"Paramètres initiaux inconnus : {sorted(unknown)}")
+    initial_state = {name: _parameter_value(name, value, "État initial")
+                     for name, value in initial_state.items()}
+
+    actions = []
+    for number, action in enumerate(scenario.get("actions", []), start=1):
+        kind = action.get("action")
+        if kind not in SCENARIO_ACTIONS:
+            raise ScenarioError(f"Action {number} : type inconnu {kind!r} "
+                                f"(valeurs possibles : {', '.join(SCENARIO_ACTIONS)})")
+        missing = [field for field in ("time_hours",) + SCENARIO_ACTIONS[kind] if field not in action]
+        if missing:
+            raise ScenarioError(f"Action {number} ({kind}) : champs manquants {missing}")
+        time_hours = _number(action["time_hours"], f"Action {number} ({kind})")
+        if not 0.0 <= time_hours <= duration:
+            raise ScenarioError(f"Action {number} ({kind}) : date hors de la durée du scénario")
+        if kind in ("set", "ramp"):
+            if action["parameter"] not in SCENARIO_SETTERS:
+                raise ScenarioError(f"Action {number} : paramètre inconnu {action['parameter']!r}")
+            _parameter_value(action["parameter"], action["value"], f"Action {number} ({kind})")
+        if kind == "ramp" and _number(action["duration_hours"], f"Action {number} (ramp)") < 0.0:
+            raise ScenarioError(f"Action {number} : durée de rampe négative")
+        if kind == "find_critical" and action["parameter"] not in SEARCH_PARAMETERS:
+            raise ScenarioError(f"Action {number} : recherche critique impossible sur {action['parameter']!r} "
+                                f"(valeurs possibles : {', '.join(SEARCH_PARAMETERS)})")
+        if kind == "find_critical":
+            context = f"Action {number} (find_critical)"
+            if "target_k_effective" in action and _number(action["target_k_effective"], context) <= 0.0:
+                raise ScenarioError(f"{context} : k-effectif cible non positif")
+            if action.get("target_reactivity_pcm") is not None:
+                _number(action["target_reactivity_pcm"], context)
+        if kind == "cycle_time" and _number(action["days"], f"Action {number} (cycle_time)") < 0.0:
+            raise ScenarioError(f"Action {number} : durée de cycle négative")
+        actions.append(dict(action, time_hours=time_hours))
+    # Tri stable : les actions simultanées gardent l'ordre du fichier
+    actions.sort(key=lambda action: action["time_hours"])
+
+    return dict(scenario, duration_hours=duration, record_interval_hours=interval, ramp_step_hours=ramp_step,
+                recorded_quantities=quantities, initial_state=initial_state, actions=actions)
+
+
+def load_scenario(path):
+    """Lit et valide un fichier de scénario JSON."""
+    path = Path(path)
+    with open(path, "r", encoding="utf-8") as file:
+        scenario = json.load(file)
+    scenario.setdefault("name", path.stem)
+    return validate_scenario(scenario)
+
+
+def apply_action(model, action):
+    """Applique une action d'opérateur au modèle."""
+    kind = action["action"]
+    if kind == "set":
+        getattr(model, SCENARIO_SETTERS[action["parameter"]])(float(action["value"]))
+    elif kind == "preset":
+        if not model.apply_preset(action["preset"]):
+            raise ScenarioError(f"Preset inconnu : {action['preset']!r}")
+    elif kind == "scram":
+        model.scram()
+    elif kind == "trip":
+        # Arrêt automatique : chute des barres et puissance nulle
+        model.scram()
+        model.update_power_level(0.0)
+    elif kind == "xenon_equilibrium":
+        model.calculate_xenon_equilibrium()
+        model.recompute()
+    elif kind == "find_critical":
+        target = action.get("target_reactivity_pcm")
+        target = None if target is None else target / config.REACTIVITY_TO_PCM
+        value = model.find_critical_parameter(action["parameter"], action.get("target_k_effective", 1.0), target)
+        if value is not None:
+            getattr(model, SCENARIO_SETTERS[action["parameter"]])(value)
+    elif kind == "cycle_time":
+        model.set_cycle_time(float(action["days"]))
+
+
+class ScenarioEngine:
+    """
+    Moteur à événements discrets piloté par une file de priorité (heapq).
+
+    Les actions datées sont rangées par (date, ordre d'insertion) : les actions
+    simultanées s'exécutent dans l'ordre où elles ont été programmées. Le modèle
+    est intégré d'un événement au suivant, le pas étant coupé exactement à la date
+    de chaque action. Une rampe programme elle-même ses paliers successifs dans
+    la file au fur et à mesure de son exécution.
+    """
+
+    def __init__(self, model=None, ramp_step_hours=None):
+        self.model = ReactorModel() if model is None else model
+        self.ramp_step_hours = (config.SCENARIO_RAMP_STEP_HOURS if ramp_step_hours is None
+                                else float(ramp_step_hours))
+        self.time_hours = 0.0
+        self._queue = []
+        self._sequence = itertools.count()
+        # Diagnostics : actions exécutées et pas d'intégration du xénon
+        self.events_processed = 0
+        self.integration_steps = 0
+
+    def schedule(self, action):
+        """Programme une action (dictionnaire au format des scénarios, date absolue en heures)."""
+        time_hours = float(action["time_hours"])
+        if time_hours < self.time_hours - _TIME_TOLERANCE:
+            raise ScenarioError(f"Action {action['action']!r} programmée dans le passé ({time_hours} h)")
+        heapq.heappush(self._queue, (time_hours, next(self._sequence), action))
+
+    def pending_actions(self):
+        """Nombre d'actions encore dans la file."""
+        return len(self._queue)
+
+    def _execute(self, action):
+        """Exécute une action ; une rampe programme ses paliers dans la file."""
+        self.events_processed += 1
+        if action["action"] != "ramp":
+            apply_action(self.model, action)
+            return
+
+        # Paliers de valeur constante, chacun pris au milieu de son intervalle de la rampe
+        # linéaire ; la valeur finale est imposée exactement à la fin de la rampe
+        parameter, duration = action["parameter"], float(action["duration_hours"])
+        start_value = float(RECORDABLE_QUANTITIES[parameter](self.model))
+        target = float(action["value"])
+        steps = max(math.ceil(duration / self.ramp_step_hours - _TIME_TOLERANCE), 1) if duration > 0.0 else 0
+        for step in range(steps):
+            fraction = (step + 0.5) / steps
+            self.schedule({"time_hours": self.time_hours + duration * step / steps, "action": "set",
+                           "parameter": parameter, "value": start_value + (target - start_value) * fraction})
+        self.schedule({"time_hours": self.time_hours + duration, "action": "set",
+                       "parameter": parameter, "value": target})
+
+    def _advance_to(self, time_hours, pacing, wall_start, time_start):
+        """Intègre le modèle jusqu'à une date ; en mode cadencé, attend l'heure murale correspondante."""
+        if time_hours - self.time_hours > _TIME_TOLERANCE:
+            self.model.advance_time(time_hours - self.time_hours)
+            self.integration_steps += 1
+        self.time_hours = max(self.time_hours, time_hours)
+        if pacing is not None:
+            delay = wall_start + (self.time_hours - time_start) * config.HOURS_TO_SECONDS / pacing - time.perf_counter()
+            if delay > 0.0:
+                time.sleep(delay)
+
+    def run(self, until_hours, record_interval_hours, quantities, pacing=None):
+        """
+        Déroule la file jusqu'à une date et produit une ligne de résultats par
+        instant d'enregistrement (actions de même date appliquées avant l'enregistrement).
+
+        Args:
+            until_hours: date de fin (heures)
+            record_interval_hours: intervalle d'enregistrement (heures)
+            quantities: grandeurs enregistrées (voir RECORDABLE_QUANTITIES)
+            pacing: facteur d'accélération par rapport au temps réel (1 : temps réel) ;
+                None pour dérouler le scénario aussi vite que possible
+
+        Yields:
+            dict: "time_hours" et les grandeurs demandées
+        """
+        if pacing is not None and pacing <= 0.0:
+            raise ScenarioError("Le facteur d'accélération doit être strictement positif")
+        time_start, wall_start = self.time_hours, time.perf_counter()
+        records = math.floor((until_hours - time_start) / record_interval_hours + _TIME_TOLERANCE)
+        record_times = [time_start + step * record_interval_hours for step in range(max(records, 0) + 1)]
+        if until_hours - record_times[-1] > _TIME_TOLERANCE:
+            record_times.append(until_hours)
+
+        queue = self._queue
+        for record_time in record_times:
+            while queue and queue[0][0] <= record_time + _TIME_TOLERANCE:
+                action_time, _, action = heapq.heappop(queue)
+                self._advance_to(action_time, pacing, wall_start, time_start)
+                self._execute(action)
+            self._advance_to(record_time, pacing, wall_start, time_start)
+            row = {"time_hours": record_time}
+            row.update({name: float(RECORDABLE_QUANTITIES[name](self.model)) for name in quantities})
+            yield row
+
+
+def iter_scenario(scenario, model=None, pacing=None):
+    """
+    Déroule un scénario et produit une ligne de résultats par instant d'enregistrement.
+
+    Args:
+        scenario: scénario validé (voir validate_scenario)
+        model: ReactorModel à piloter (un nouveau modèle par défaut)
+        pacing: facteur d'accélération par rapport au temps réel (None : au plus vite)
+
+    Yields:
+        dict: "time_hours" et les grandeurs de "recorded_quantities"
+    """
+    engine = ScenarioEngine(model, scenario["ramp_step_hours"])
+    if "preset" in scenario and not engine.model.apply_preset(scenario["preset"]):
+        raise ScenarioError(f"Preset inconnu : {scenario['preset']!r}")
+    for parameter, value in scenario["initial_state"].items():
+        getattr(engine.model, SCENARIO_SETTERS[parameter])(float(value))
+    for action in scenario["actions"]:
+        engine.schedule(action)
+    yield from engine.run(scenario["duration_hours"], scenario["record_interval_hours"],
+                          scenario["recorded_quantities"], pacing)
+
+
+def run_scenario(scenario, model=None, pacing=None):
+    """
+    Déroule un scénario complet.
+
+    Returns:
+        dict: nom de colonne ("time_hours" puis les grandeurs enregistrées) -> tableau NumPy
+    """
+    columns = ("time_hours",) + tuple(scenario["recorded_quantities"])
+    rows = list(iter_scenario(scenario, model, pacing))
+    return {name: np.array([row[name] for row in rows]) for name in columns}
@@ -0,0 +1,202 @@
+"""
+Analyse de sensibilité globale : indices de Sobol par le plan de Saltelli
+
+Les entrées étudiées sont les paramètres de fonctionnement (plages de
+`parameters_config`, loi uniforme) et une sélection de coefficients de
+calibration (lois de `uncertainty.DISTRIBUTIONS`). Pour d entrées et N tirages
+de base, deux matrices A et B (N × d) sont prises dans une suite de Sobol
+brouillée de dimension 2d ; les matrices A_B^i (A dont la colonne i vient de B)
+complètent le plan, soit N (d + 2) évaluations du modèle. Les indices sont
+estimés par :
+
+    S_i  = moyenne(f(B) (f(A_B^i) - f(A))) / V          (Saltelli 2010)
+    ST_i = moyenne((f(A) - f(A_B^i))²) / (2 V)          (Jansen)
+
+Le plan dans le cube unité ne dépend que de N, d et de la graine : il est
+enregistré une fois dans un fichier .npy, ouvert en projection mémoire par
+chaque processus du pool. Chaque bloc A, B ou A_B^i est une tâche du pool,
+évaluée en un seul appel vectorisé à `evaluate_batch`.
+"""
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from scipy.stats import qmc
+
+from . import config
+from .batch_evaluation import evaluate_batch, _resolve_inputs
+from .uncertainty import coefficients_from_quantiles, _validate_distributions
+from .xenon_solver import xenon_reactivity_pcm
+
+# Grandeurs pour lesquelles les indices peuvent être calculés
+SENSITIVITY_OUTPUTS = ("k_effective", "reactivity_pcm", "xenon_reactivity_pcm")
+
+# Les points de Sobol brouillés peuvent valoir exactement 0 : quantiles ramenés dans ]0, 1[
+_QUANTILE_EPSILON = 1e-12
+
+
+def sample_matrix_path(base_samples, dimensions, seed, directory=None):
+    """Chemin du fichier du plan [A | B] dans le cube unité."""
+    if directory is None:
+        directory = config.get_project_root() / config.SENSITIVITY_DIRECTORY
+    return Path(directory) / f"saltelli_{base_samples}x{2 * dimensions}_seed{seed}.npy"
+
+
+def load_or_build_sample_matrix(base_samples, dimensions, seed, directory=None):
+    """
+    Ouvre le plan [A | B] (N × 2d) en projection mémoire, en le tirant s'il n'existe pas.
+
+    Le fichier est écrit sous un nom temporaire puis renommé, de sorte qu'un
+    autre processus ne voie jamais un plan partiellement écrit.
+
+    Returns:
+        tuple: (plan en lecture seule, chemin du fichier)
+    """
+    exponent = int(round(math.log2(base_samples))) if base_samples > 0 else -1
+    if exponent < 0 or 2**exponent != base_samples:
+        raise ValueError(f"Le nombre de tirages de base doit être une puissance de 2 (reçu : {base_samples})")
+    path = sample_matrix_path(base_samples, dimensions, seed, directory)
+    if path.exists():
+        matrix = np.load(path, mmap_mode='r')
+        if matrix.shape == (base_samples, 2 * dimensions):
+            return matrix, path
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    matrix = qmc.Sobol(d=2 * dimensions, scramble=True, seed=seed).random_base2(exponent)
+    temporary = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npy")
+    np.save(temporary, np.clip(matrix, _QUANTILE_EPSILON, 1.0 - _QUANTILE_EPSILON))
+    os.replace(temporary, path)
+    return np.load(path, mmap_mode='r'), path
+
+
+def _evaluate_block(path, block, operating_inputs, distributions, outputs):
+    """
+    Évalue un bloc du plan (exécuté dans un processus du pool).
+
+    Args:
+        path: fichier du plan [A | B]
+        block: 0 pour A, 1 pour B, i + 2 pour A_B^i
+        operating_inputs: entrée du modèle -> (borne basse, borne haute)
+        distributions: lois des coefficients étudiés
+        outputs: grandeurs à calculer
+
+    Returns:
+        np.ndarray: forme (grandeurs, N)
+    """
+    matrix = np.load(path, mmap_mode='r')
+    dimensions = matrix.shape[1] // 2
+    if block == 1:
+        unit = np.array(matrix[:, dimensions:])
+    else:
+        unit = np.array(matrix[:, :dimensions])
+        if block >= 2:
+            unit[:, block - 2] = matrix[:, dimensions + block - 2]
+
+    inputs = {name: low + (high - low) * unit[:, column]
+              for column, (name, (low, high)) in enumerate(operating_inputs.items())}
+    coefficients = coefficients_from_quantiles(distributions, unit[:, len(operating_inputs):])
+
+    # Xénon à l'équilibre de la puissance tirée (et des coefficients tirés)
+    values = _resolve_inputs(None, inputs, coefficients)
+    results = evaluate_batch(coefficients=coefficients, **values)
+    columns = {
+        "k_effective": lambda: results["k_effective"],
+        "reactivity_pcm": lambda: results["reactivity"] * config.REACTIVITY_TO_PCM,
+        "xenon_reactivity_pcm": lambda: xenon_reactivity_pcm(values["xenon_concentration"], coefficients),
+    }
+    return np.stack([np.broadcast_to(columns[name](), (unit.shape[0],)) for name in outputs])
+
+
+def _indices(f_a, f_b, f_ab):
+    """
+    Indices de premier ordre et totaux d'une grandeur.
+
+    Args:
+        f_a, f_b: tableaux (N,)
+        f_ab: tableau (d, N)
+    """
+    variance = np.var(np.concatenate((f_a, f_b)))
+    if variance <= 0.0:
+        zeros = np.zeros(f_ab.shape[0])
+        return zeros, zeros.copy(), variance
+    first_order = np.mean(f_b * (f_ab - f_a), axis=-1) / variance
+    total_order = 0.5 * np.mean((f_a - f_ab)**2, axis=-1) / variance
+    return first_order, total_order, variance
+
+
+def sobol_indices(base_samples=None, workers=None, seed=None, operating_inputs=None, coefficients=None,
+                  outputs=None, directory=None):
+    """
+    Indices de Sobol de premier ordre et totaux sur tout le domaine de fonctionnement.
+
+    Args:
+        base_samples: tirages de base N, puissance de 2 (config par défaut)
+        workers: nombre de processus (0 : un par cœur, 1 : calcul dans le processus courant)
+        seed: graine de la suite de Sobol brouillée
+        operating_inputs: entrée du modèle -> nom de parameters_config donnant la plage
+        coefficients: noms des coefficients étudiés (lois de uncertainty.DISTRIBUTIONS)
+        outputs: grandeurs étudiées (voir SENSITIVITY_OUTPUTS)
+        directory: répertoire des plans (SENSITIVITY_DIRECTORY par défaut)
+
+    Returns:
+        dict: "inputs" et "labels" (d,), "base_samples", "evaluations" et, pour chaque
+            grandeur de "outputs" : "first_order" (d,), "total_order" (d,), "mean" et "variance"
+    """
+    base_samples = config.SENSITIVITY_BASE_SAMPLES if base_samples is None else int(base_samples)
+    workers = config.SENSITIVITY_WORKERS if workers is None else int(workers)
+    seed = config.SENSITIVITY_SEED if seed is None else seed
+    operating_inputs = config.SENSITIVITY_OPERATING_INPUTS if operating_inputs is None else operating_inputs
+    coefficients = config.SENSITIVITY_COEFFICIENTS if coefficients is None else coefficients
+    outputs = tuple(config.SENSITIVITY_OUTPUTS if outputs is None else outputs)
+
+    unknown = set(outputs) - set(SENSITIVITY_OUTPUTS)
+    if unknown:
+        raise ValueError(f"Grandeurs inconnues : {sorted(unknown)} "
+                         f"(valeurs possibles : {', '.join(SENSITIVITY_OUTPUTS)})")
+    missing = [name for name in coefficients if name not in config.UNCERTAINTY_DISTRIBUTIONS]
+    if missing:
+        raise ValueError(f"Coefficients sans loi dans uncertainty.DISTRIBUTIONS : {missing}")
+    distributions = {name: config.UNCERTAINTY_DISTRIBUTIONS[name] for name in coefficients}
+    _validate_distributions(distributions)
+
+    ranges = {name: tuple(float(bound) for bound in config.parameters_config[parameter]['range'])
+              for name, parameter in operating_inputs.items()}
+    labels = ([config.parameters_config[parameter]['label'] for parameter in operating_inputs.values()] +
+              list(coefficients))
+    dimensions = len(ranges) + len(distributions)
+
+    _, path = load_or_build_sample_matrix(base_samples, dimensions, seed, directory)
+    blocks = range(dimensions + 2)
+    arguments = ([path] * len(blocks), blocks, [ranges] * len(blocks), [distributions] * len(blocks),
+                 [outputs] * len(blocks))
+
+    workers = (os.cpu_count() or 1) if workers == 0 else workers
+    workers = min(workers, len(blocks))
+    if workers <= 1:
+        evaluations = np.stack(list(map(_evaluate_block, *arguments)))
+    else:
+        # "spawn" : processus neufs, sans copie des threads de l'interface
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            evaluations = np.stack(list(pool.map(_evaluate_block, *arguments)))
+
+    # evaluations : (blocs, grandeurs, N)
+    result = {
+        "inputs": tuple(ranges) + tuple(distributions),
+        "labels": labels,
+        "base_samples": base_samples,
+        "evaluations": base_samples * len(blocks),
+        "outputs": outputs,
+    }
+    for index, name in enumerate(outputs):
+        f_a, f_b, f_ab = evaluations[0, index], evaluations[1, index], evaluations[2:, index]
+        first_order, total_order, variance = _indices(f_a, f_b, f_ab)
+        result[name] = {
+            "first_order": first_order,
+            "total_order": total_order,
+            "mean": float(np.mean(np.concatenate((f_a, f_b)))),
+            "variance": float(variance),
+        }
+    return result
@@ -0,0 +1,248 @@
+"""
+Propagation d'incertitudes Monte-Carlo sur les coefficients de calibration
+
+Les coefficients de `four_factors`, `neutron_leakage`, `xenon_dynamics` (et de
+la chaîne I-135/Xe-135) sont des valeurs uniques dans config.json. Ce module
+les tire selon les lois déclarées dans `uncertainty.DISTRIBUTIONS` (normale,
+uniforme ou log-normale, exprimées en écart relatif autour de la valeur
+nominale), puis évalue pour chaque tirage :
+
+- k-effectif et la réactivité de l'état demandé (`evaluate_batch`, un seul
+  appel vectorisé par paquet d'échantillons) ;
+- la trajectoire de l'antiréactivité xénon après un échelon de puissance,
+  depuis l'équilibre (solution analytique vectorisée sur échantillons × temps).
+
+Les paquets sont répartis sur un pool de processus. Chaque paquet reçoit son
+propre flux aléatoire, issu de `SeedSequence(seed).spawn` : le résultat ne
+dépend que de la graine et de la taille des paquets, pas du nombre de processus.
+"""
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy.special import ndtri
+
+from . import config
+from .batch_evaluation import evaluate_batch, _resolve_inputs
+from .xenon_solver import advance_iodine_xenon, equilibrium_iodine_xenon, xenon_reactivity_pcm
+
+DISTRIBUTION_TYPES = ("normal", "uniform", "lognormal")
+
+
+def _validate_distributions(distributions):
+    """Vérifie les noms des coefficients et les types de lois."""
+    for name, spec in distributions.items():
+        if name not in config.OVERRIDABLE_COEFFICIENTS:
+            raise ValueError(f"Coefficient incertain inconnu : {name} "
+                             f"(valeurs possibles : {', '.join(config.OVERRIDABLE_COEFFICIENTS)})")
+        if spec["DISTRIBUTION"] not in DISTRIBUTION_TYPES:
+            raise ValueError(f"Loi inconnue pour {name} : {spec['DISTRIBUTION']} "
+                             f"(valeurs possibles : {', '.join(DISTRIBUTION_TYPES)})")
+
+
+def sample_coefficients(distributions, size, rng):
+    """
+    Tire un échantillon de coefficients autour de leurs valeurs nominales.
+
+    Args:
+        distributions: nom du coefficient -> {"DISTRIBUTION": "normal" | "lognormal",
+            "RELATIVE_STD": ...} ou {"DISTRIBUTION": "uniform", "RELATIVE_HALF_WIDTH": ...}
+        size: nombre de tirages
+        rng: générateur NumPy (np.random.Generator)
+
+    Returns:
+        dict: nom du coefficient -> tableau (size,)
+    """
+    samples = {}
+    for name, spec in distributions.items():
+        nominal = config.get_coefficient(name)
+        kind = spec["DISTRIBUTION"]
+        if kind == "normal":
+            samples[name] = nominal * (1.0 + spec["RELATIVE_STD"] * rng.standard_normal(size))
+        elif kind == "uniform":
+            samples[name] = nominal * (1.0 + spec["RELATIVE_HALF_WIDTH"] * rng.uniform(-1.0, 1.0, size))
+        elif kind == "lognormal":
+            # Moyenne conservée, écart-type relatif RELATIVE_STD
+            sigma = math.sqrt(math.log1p(spec["RELATIVE_STD"]**2))
+            samples[name] = nominal * np.exp(sigma * rng.standard_normal(size) - 0.5 * sigma**2)
+        else:
+            raise ValueError(f"Loi inconnue pour {name} : {kind}")
+    return samples
+
+
+def coefficients_from_quantiles(distributions, quantiles):
+    """
+    Transforme des points du cube unité en coefficients (inverse des fonctions de
+    répartition), par exemple pour un plan quasi-Monte-Carlo.
+
+    Args:
+        distributions: lois des coefficients, comme pour sample_coefficients
+        quantiles: tableau (..., nombre de coefficients) dans ]0, 1[, colonnes dans
+            l'ordre de `distributions`
+
+    Returns:
+        dict: nom du coefficient -> tableau quantiles.shape[:-1]
+    """
+    quantiles = np.asarray(quantiles, dtype=float)
+    samples = {}
+    for column, (name, spec) in enumerate(distributions.items()):
+        nominal = config.get_coefficient(name)
+        u = quantiles[..., column]
+        kind = spec["DISTRIBUTION"]
+        if kind == "normal":
+            samples[name] = nominal * (1.0 + spec["RELATIVE_STD"] * ndtri(u))
+        elif kind == "uniform":
+            samples[name] = nominal * (1.0 + spec["RELATIVE_HALF_WIDTH"] * (2.0 * u - 1.0))
+        elif kind == "lognormal":
+            sigma = math.sqrt(math.log1p(spec["RELATIVE_STD"]**2))
+            samples[name] = nominal * np.exp(sigma * ndtri(u) - 0.5 * sigma**2)
+        else:
+            raise ValueError(f"Loi inconnue pour {name} : {kind}")
+    return samples
+
+
+def xenon_reactivity_trajectory(time_seconds, initial_power_level, final_power_level, coefficients=None):
+    """
+    Antiréactivité xénon (pcm) après un échelon de puissance, depuis l'équilibre.
+
+    Args:
+        time_seconds: instants après l'échelon (tableau (temps,))
+        initial_power_level: puissance (%) avant l'échelon, xénon à l'équilibre
+        final_power_level: puissance (%) après l'échelon
+        coefficients: coefficients remplacés, tableaux (échantillons,) (optionnel)
+
+    Returns:
+        np.ndarray: forme (échantillons, temps), ou (temps,) sans coefficients remplacés
+    """
+    # Les coefficients (échantillons,) sont diffusés contre l'axe des temps
+    c = None if coefficients is None else {name: np.asarray(value)[..., None]
+                                           for name, value in coefficients.items()}
+    iodine, xenon = equilibrium_iodine_xenon(initial_power_level, c)
+    _, xenon = advance_iodine_xenon(iodine, xenon, final_power_level, np.asarray(time_seconds, dtype=float), c)
+    return xenon_reactivity_pcm(xenon, c)
+
+
+def _propagate_chunk(seed, size, distributions, inputs, time_seconds, final_power_level):
+    """
+    Évalue un paquet d'échantillons (exécuté dans un processus du pool).
+
+    Returns:
+        tuple: (k-effectif, réactivité, trajectoires xénon en float32)
+    """
+    rng = np.random.default_rng(seed)
+    coefficients = sample_coefficients(distributions, size, rng)
+    results = evaluate_batch(coefficients=coefficients, **inputs)
+    trajectories = xenon_reactivity_trajectory(time_seconds, inputs["power_level"], final_power_level,
+                                               coefficients)
+    return (np.broadcast_to(results["k_effective"], (size,)),
+            np.broadcast_to(results["reactivity"], (size,)),
+            np.broadcast_to(trajectories, (size, len(time_seconds))).astype(np.float32))
+
+
+def _summary(nominal, samples, percentiles):
+    """
+    Valeur nominale, moyenne, écart-type et centiles le long du dernier axe
+    (les échantillons, contigus en mémoire pour accélérer le tri partiel).
+    """
+    return {
+        "nominal": nominal,
+        "mean": samples.mean(axis=-1),
+        "std": samples.std(axis=-1),
+        "percentiles": np.percentile(samples, percentiles, axis=-1),
+    }
+
+
+def _collect_chunks(chunks, k_effective, reactivity, trajectories):
+    """Range les résultats des paquets, dans l'ordre, dans les tableaux de sortie"""
+    start = 0
+    for chunk_k, chunk_reactivity, chunk_trajectories in chunks:
+        stop = start + len(chunk_k)
+        k_effective[start:stop] = chunk_k
+        reactivity[start:stop] = chunk_reactivity
+        trajectories[:, start:stop] = chunk_trajectories.T
+        start = stop
+
+
+def propagate_uncertainty(samples=None, distributions=None, workers=None, seed=None, chunk_size=None,
+                          percentiles=None, trajectory_hours=None, trajectory_points=None,
+                          trajectory_power_level=None, **inputs):
+    """
+    Propage les incertitudes des coefficients sur k-effectif, la réactivité et
+    la trajectoire xénon d'un état.
+
+    Args:
+        samples: nombre de tirages (config par défaut)
+        distributions: lois des coefficients (config par défaut)
+        workers: nombre de processus (0 : un par cœur, 1 : calcul dans le processus courant)
+        seed: graine de la SeedSequence racine
+        chunk_size: tirages par paquet
+        percentiles: centiles à calculer (%)
+        trajectory_hours, trajectory_points: horizon et nombre de points de la trajectoire xénon
+        trajectory_power_level: puissance (%) après l'échelon (la puissance de l'état avant)
+        **inputs: entrées du modèle (voir BATCH_INPUT_FIELDS), scalaires
+
+    Returns:
+        dict: "samples", "percentiles", "k_effective" et "reactivity_pcm" (nominal, mean,
+            std, percentiles, samples), "xenon_time_hours", "xenon_reactivity_pcm"
+            (nominal, mean, std, percentiles par instant), "initial_power_level"
+            et "final_power_level"
+    """
+    samples = config.UNCERTAINTY_SAMPLES if samples is None else int(samples)
+    distributions = config.UNCERTAINTY_DISTRIBUTIONS if distributions is None else distributions
+    workers = config.UNCERTAINTY_WORKERS if workers is None else int(workers)
+    seed = config.UNCERTAINTY_SEED if seed is None else seed
+    chunk_size = config.UNCERTAINTY_CHUNK_SIZE if chunk_size is None else int(chunk_size)
+    percentiles = np.asarray(config.UNCERTAINTY_PERCENTILES if percentiles is None else percentiles, dtype=float)
+    trajectory_hours = config.UNCERTAINTY_XENON_TRAJECTORY_HOURS if trajectory_hours is None else trajectory_hours
+    trajectory_points = (config.UNCERTAINTY_XENON_TRAJECTORY_POINTS if trajectory_points is None
+                         else int(trajectory_points))
+    final_power_level = (config.UNCERTAINTY_XENON_TRAJECTORY_POWER_LEVEL if trajectory_power_level is None
+                         else trajectory_power_level)
+    if samples < 1 or chunk_size < 1:
+        raise ValueError("Le nombre de tirages et la taille des paquets doivent être positifs")
+    _validate_distributions(distributions)
+
+    # État unique, entrées complétées (xénon à l'équilibre s'il est absent)
+    inputs = {name: float(value) for name, value in _resolve_inputs(None, inputs).items()}
+    time_hours = np.linspace(0.0, trajectory_hours, trajectory_points)
+    time_seconds = time_hours * config.HOURS_TO_SECONDS
+
+    # Un flux aléatoire indépendant par paquet
+    sizes = [min(chunk_size, samples - start) for start in range(0, samples, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    arguments = (seeds, sizes, [distributions] * len(sizes), [inputs] * len(sizes),
+                 [time_seconds] * len(sizes), [final_power_level] * len(sizes))
+
+    workers = (os.cpu_count() or 1) if workers == 0 else workers
+    workers = min(workers, len(sizes))
+    k_effective = np.empty(samples)
+    reactivity = np.empty(samples)
+    trajectories = np.empty((trajectory_points, samples), dtype=np.float32)
+    results = (k_effective, reactivity, trajectories)
+    if workers <= 1:
+        _collect_chunks(map(_propagate_chunk, *arguments), *results)
+    else:
+        # "spawn" : processus neufs, sans copie des threads de l'interface
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            _collect_chunks(pool.map(_propagate_chunk, *arguments), *results)
+
+    nominal = evaluate_batch(**inputs)
+    to_pcm = config.REACTIVITY_TO_PCM
+    k_summary = _summary(float(nominal["k_effective"]), k_effective, percentiles)
+    k_summary["samples"] = k_effective
+    reactivity_summary = _summary(float(nominal["reactivity"]) * to_pcm, reactivity * to_pcm, percentiles)
+    reactivity_summary["samples"] = reactivity * to_pcm
+    return {
+        "samples": samples,
+        "percentiles": percentiles,
+        "k_effective": k_summary,
+        "reactivity_pcm": reactivity_summary,
+        "xenon_time_hours": time_hours,
+        "xenon_reactivity_pcm": _summary(
+            xenon_reactivity_trajectory(time_seconds, inputs["power_level"], final_power_level),
+            trajectories, percentiles),
+        "initial_power_level": inputs["power_level"],
+        "final_power_level": final_power_level,
+    }